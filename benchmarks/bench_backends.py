@@ -0,0 +1,62 @@
+"""Compare the heap and timing wheel TimerEngine backends.
+
+Measures insert, cancel and expire cost per timer at 1k, 10k and 100k
+pending timers. Run with ``python benchmarks/bench_backends.py``.
+"""
+
+import random
+import time
+
+from clockwise.models import create_engine
+
+NS_PER_SECOND = 1_000_000_000
+SIZES = (1_000, 10_000, 100_000)
+
+
+def bench_backend(backend: str, count: int, seed: int = 0) -> dict:
+    """Time inserting, cancelling and expiring ``count`` timers."""
+    rng = random.Random(seed)
+    durations = [rng.randint(1, 3600) for _ in range(count)]
+
+    engine = create_engine(backend)
+    started = time.perf_counter()
+    ids = [engine.add(duration, start=True) for duration in durations]
+    insert_s = time.perf_counter() - started
+
+    rng.shuffle(ids)
+    started = time.perf_counter()
+    for timer_id in ids:
+        engine.cancel(timer_id)
+    cancel_s = time.perf_counter() - started
+
+    engine = create_engine(backend)
+    for duration in durations:
+        engine.add(duration, start=True)
+    origin = time.monotonic_ns()
+    expired = 0
+    started = time.perf_counter()
+    for second in range(1, 3602):
+        expired += len(engine.poll(origin + second * NS_PER_SECOND))
+    expire_s = time.perf_counter() - started
+    assert expired == count
+
+    return {
+        "insert_us": insert_s / count * 1e6,
+        "cancel_us": cancel_s / count * 1e6,
+        "expire_us": expire_s / count * 1e6,
+    }
+
+
+def main():
+    print(f"{'timers':>8} {'backend':>8} {'insert us':>10} {'cancel us':>10} {'expire us':>10}")
+    for count in SIZES:
+        for backend in ("heap", "wheel"):
+            result = bench_backend(backend, count)
+            print(
+                f"{count:>8} {backend:>8} {result['insert_us']:>10.2f} "
+                f"{result['cancel_us']:>10.2f} {result['expire_us']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure state write latency for each durability mode.
+
+Writes the state file repeatedly with ``none``, ``rename`` and ``fsync``
+durability, for a fresh stopwatch and for ones holding many laps. Run
+with ``python benchmarks/bench_durability.py [directory]`` and point it at
+the file system you deploy on (e.g. an NFS home directory).
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from clockwise.models import Stopwatch, Timer
+from clockwise.state.persistence import DURABILITY_MODES, StatePersistence
+
+LAP_COUNTS = (0, 1_000, 100_000)
+WRITES = 200
+
+
+def make_state(laps: int):
+    """Build timer and stopwatch state with ``laps`` recorded laps."""
+    timer = Timer(1500, "Pomodoro")
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    for _ in range(laps):
+        stopwatch.tick()
+        stopwatch.add_lap()
+    return timer.get_state(), stopwatch.get_state()
+
+
+def bench_mode(directory: Path, durability: str, laps: int) -> list:
+    """Return per-write latencies in seconds."""
+    timer_state, stopwatch_state = make_state(laps)
+    persistence = StatePersistence(directory / f"state-{durability}.json", durability)
+    latencies = []
+    for _ in range(WRITES):
+        started = time.perf_counter()
+        persistence.save_state(timer_state, stopwatch_state)
+        latencies.append(time.perf_counter() - started)
+    return sorted(latencies)
+
+
+def main():
+    with tempfile.TemporaryDirectory(dir=sys.argv[1] if len(sys.argv) > 1 else None) as tmp:
+        print(f"{'laps':>8} {'mode':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for laps in LAP_COUNTS:
+            for durability in DURABILITY_MODES:
+                latencies = bench_mode(Path(tmp), durability, laps)
+                p50 = latencies[len(latencies) // 2] * 1e3
+                p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+                print(
+                    f"{laps:>8} {durability:>8} {p50:>8.3f} {p99:>8.3f} {latencies[-1] * 1e3:>8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
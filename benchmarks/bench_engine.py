@@ -0,0 +1,66 @@
+"""Benchmark TimerEngine scheduling with thousands of concurrent timers.
+
+Run with ``python benchmarks/bench_engine.py [timer_count]``.
+"""
+
+import random
+import sys
+import time
+
+from clockwise.models import TimerEngine
+
+NS_PER_SECOND = 1_000_000_000
+
+
+def bench_engine(count: int, seed: int = 0) -> dict:
+    """Start ``count`` timers, then tick once per simulated second for an hour."""
+    rng = random.Random(seed)
+    engine = TimerEngine()
+
+    started = time.perf_counter()
+    ids = [engine.add(rng.randint(1, 3600), start=True) for _ in range(count)]
+    start_s = time.perf_counter() - started
+
+    origin = time.monotonic_ns()
+    tick_times = []
+    completed = 0
+    for second in range(1, 3601):
+        now_ns = origin + second * NS_PER_SECOND
+        tick_started = time.perf_counter()
+        completed += len(engine.poll(now_ns))
+        tick_times.append(time.perf_counter() - tick_started)
+
+    engine = TimerEngine()
+    ids = [engine.add(3600, start=True) for _ in range(count)]
+    rng.shuffle(ids)
+    started = time.perf_counter()
+    for timer_id in ids:
+        engine.cancel(timer_id)
+    cancel_s = time.perf_counter() - started
+
+    tick_times.sort()
+    return {
+        "timers": count,
+        "completed": completed,
+        "start_us": start_s / count * 1e6,
+        "cancel_us": cancel_s / count * 1e6,
+        "tick_mean_us": sum(tick_times) / len(tick_times) * 1e6,
+        "tick_p99_us": tick_times[int(len(tick_times) * 0.99)] * 1e6,
+        "tick_max_us": tick_times[-1] * 1e6,
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    result = bench_engine(count)
+    print(f"TimerEngine with {result['timers']} timers ({result['completed']} completed)")
+    print(f"  start:  {result['start_us']:8.2f} us/timer")
+    print(f"  cancel: {result['cancel_us']:8.2f} us/timer")
+    print(
+        f"  tick:   {result['tick_mean_us']:8.2f} us mean, "
+        f"{result['tick_p99_us']:.2f} us p99, {result['tick_max_us']:.2f} us max"
+    )
+
+
+if __name__ == "__main__":
+    main()
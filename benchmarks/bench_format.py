@@ -0,0 +1,104 @@
+"""Compare time formatting with the previous uncached functions.
+
+Formats a live clock (every second of a day, each value once), a
+redraw loop (the same few values over and over, as the widgets do every
+tick) and a lap table of 100,000 laps, as a Python loop and through
+``format_times`` on a list, an ``array('q')`` and, if installed, a NumPy
+array. Run with ``python benchmarks/bench_format.py``.
+"""
+
+import random
+import time
+from array import array
+
+from clockwise.utils.formatting import (
+    format_time,
+    format_time_natural,
+    format_times,
+    format_times_natural,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LAPS = 100_000
+
+
+def legacy_format_time(seconds: int, show_hours: bool = True) -> str:
+    """The previous format_time, verbatim apart from its docstring."""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+
+    if show_hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        total_minutes = seconds // 60
+        secs = seconds % 60
+        return f"{total_minutes:02d}:{secs:02d}"
+
+
+def legacy_format_time_natural(seconds: int) -> str:
+    """The previous format_time_natural, verbatim apart from its docstring."""
+    if seconds == 0:
+        return "0s"
+
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+
+    parts = []
+    if hours > 0:
+        parts.append(f"{hours}h")
+    if minutes > 0:
+        parts.append(f"{minutes}m")
+    if secs > 0 or not parts:
+        parts.append(f"{secs}s")
+
+    return " ".join(parts)
+
+
+def bench(name: str, run, count: int):
+    """Time ``run()`` and print nanoseconds per formatted value."""
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{name:>40} {elapsed / count * 1e9:>8.0f} ns/value")
+
+
+def main():
+    day = list(range(86_400))
+    redraw = [1500, 1499, 1498, 61, 60, 59] * 20_000
+    rng = random.Random(0)
+    laps = [rng.randrange(20, 400) for _ in range(LAPS)]
+
+    print("live clock, each second of a day once")
+    bench("legacy format_time", lambda: [legacy_format_time(s) for s in day], len(day))
+    bench("format_time", lambda: [format_time(s) for s in day], len(day))
+
+    print("redraw, a few values repeated")
+    bench("legacy format_time", lambda: [legacy_format_time(s, False) for s in redraw], len(redraw))
+    bench("format_time", lambda: [format_time(s, False) for s in redraw], len(redraw))
+
+    print(f"lap table, {LAPS:,} laps")
+    bench("legacy format_time loop", lambda: [legacy_format_time(s, False) for s in laps], LAPS)
+    bench("format_time loop", lambda: [format_time(s, False) for s in laps], LAPS)
+    bench("format_times(list)", lambda: format_times(laps, False), LAPS)
+    lap_array = array("q", laps)
+    bench("format_times(array('q'))", lambda: format_times(lap_array, False), LAPS)
+    if numpy is not None:
+        lap_numpy = numpy.array(laps)
+        bench("format_times(numpy.ndarray)", lambda: format_times(lap_numpy, False), LAPS)
+    bench(
+        "legacy format_time_natural loop",
+        lambda: [legacy_format_time_natural(s) for s in laps],
+        LAPS,
+    )
+    bench("format_time_natural loop", lambda: [format_time_natural(s) for s in laps], LAPS)
+    bench("format_times_natural(array('q'))", lambda: format_times_natural(lap_array), LAPS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Time history queries over years of recorded sessions.
+
+Fills a fresh database with ten years of sessions (twenty a day, mixed
+presets) through batched inserts, then times "total Pomodoro time this
+week", a year-long total and the all-time report by preset. Run with
+``python benchmarks/bench_history.py``.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from clockwise.state import HistoryStore
+
+DAY = 24 * 3600
+YEARS = 10
+PER_DAY = 20
+PRESETS = ("pomodoro", "short_break", "long_break", None)
+
+
+def fill(history: HistoryStore, seed: int = 0) -> int:
+    """Insert ``YEARS`` of sessions one day per transaction."""
+    rng = random.Random(seed)
+    origin = time.time() - YEARS * 365 * DAY
+    total = 0
+    for day in range(YEARS * 365):
+        batch = []
+        for _ in range(PER_DAY):
+            started_at = origin + day * DAY + rng.randint(0, DAY)
+            preset = rng.choice(PRESETS)
+            duration = rng.randint(60, 3600)
+            batch.append(
+                {
+                    "kind": "timer" if preset else "stopwatch",
+                    "name": preset or "Stopwatch",
+                    "preset": preset,
+                    "started_at": started_at,
+                    "ended_at": started_at + duration,
+                    "duration": duration,
+                }
+            )
+        total += history.record_many(batch)
+    return total
+
+
+def timed(label: str, query, repeat: int = 100):
+    """Print the mean time of ``query`` in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = query()
+    elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+    print(f"  {label:<32} {elapsed_ms:>8.3f} ms  ({result:.0f}s)")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        history = HistoryStore(Path(tmp) / "history.db")
+        started = time.perf_counter()
+        count = fill(history)
+        print(f"Inserted {count} sessions in {time.perf_counter() - started:.2f}s")
+
+        now = time.time()
+        timed(
+            "pomodoro this week",
+            lambda: history.total_duration(since=now - 7 * DAY, preset="pomodoro"),
+        )
+        timed("everything this year", lambda: history.total_duration(since=now - 365 * DAY))
+        timed("everything", lambda: history.total_duration(), repeat=10)
+        timed(
+            "report by preset, all time",
+            lambda: sum(row["duration"] for row in history.report()),
+        )
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare duration parsing throughput with the previous parser.
+
+Parses two columns of durations: one the way a spreadsheet import looks,
+many rows with few distinct values, and one where every value is
+distinct, so no cache or memo can help and only the grammar is measured.
+``legacy`` is the character-by-character parser ``parse_time_input``
+used before the compiled grammar, kept here for comparison. Run with
+``python benchmarks/bench_parse.py [rows]`` (default 1,000,000).
+"""
+
+import random
+import sys
+import time
+
+from clockwise.utils import formatting
+from clockwise.utils.formatting import parse_time_input, parse_time_inputs
+
+SAMPLES = ["5m", "25m", "1h", "1h30m", "90", "45s", "2h15m", "1:30", "01:30:00", "10m30s"]
+
+
+def legacy_parse_time_input(time_str: str) -> int:
+    """The previous parser, verbatim apart from its docstring."""
+    time_str = time_str.strip().lower()
+
+    if any(unit in time_str for unit in ["h", "m", "s"]):
+        total_seconds = 0
+        current_num = ""
+
+        for char in time_str:
+            if char.isdigit():
+                current_num += char
+            elif char in "hms":
+                if current_num:
+                    num = int(current_num)
+                    if char == "h":
+                        total_seconds += num * 3600
+                    elif char == "m":
+                        total_seconds += num * 60
+                    elif char == "s":
+                        total_seconds += num
+                    current_num = ""
+
+        return total_seconds
+
+    if ":" in time_str:
+        parts = time_str.split(":")
+        if len(parts) == 2:
+            minutes, seconds = map(int, parts)
+            return minutes * 60 + seconds
+        elif len(parts) == 3:
+            hours, minutes, seconds = map(int, parts)
+            return hours * 3600 + minutes * 60 + seconds
+        else:
+            raise ValueError("Invalid time format")
+
+    return int(time_str)
+
+
+def make_column(rows: int) -> list:
+    """Build a column of durations drawn from a few hundred distinct values."""
+    rng = random.Random(0)
+    values = SAMPLES + [f"{minutes}m" for minutes in range(1, 300)]
+    return [rng.choice(values) for _ in range(rows)]
+
+
+def make_distinct_column(rows: int) -> list:
+    """Build a column of distinct durations in the forms both parsers accept."""
+    forms = (
+        lambda i: f"{i}m",
+        lambda i: f"{i % 24}h{i % 60}m",
+        lambda i: f"{i // 60}:{i % 60:02d}",
+        lambda i: f"{i}s",
+        lambda i: f"{i // 3600}:{i // 60 % 60:02d}:{i % 60:02d}",
+        lambda i: f"{i % 24}h{i % 60}m{i % 59}s",
+    )
+    return [forms[i % len(forms)](i) for i in range(rows)]
+
+
+def bench(name: str, parse, column: list) -> float:
+    """Time ``parse(column)`` and print rows per second."""
+    started = time.perf_counter()
+    results = parse(column)
+    elapsed = time.perf_counter() - started
+    print(f"{name:>28} {len(column) / elapsed:>14,.0f} rows/s")
+    assert len(results) == len(column)
+    return elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    column = make_column(rows)
+    distinct = make_distinct_column(rows)
+    assert [legacy_parse_time_input(v) for v in SAMPLES] == parse_time_inputs(SAMPLES)
+    assert [legacy_parse_time_input(v) for v in distinct[:1000]] == parse_time_inputs(
+        distinct[:1000]
+    )
+
+    def legacy_parse(c):
+        return [legacy_parse_time_input(v) for v in c]
+
+    def grammar_parse(c):
+        return [formatting._parse(v) for v in c]
+
+    print("Distinct values")
+    legacy = bench("legacy, one at a time", legacy_parse, distinct)
+    grammar = bench("grammar only, no memo", grammar_parse, distinct)
+    bench("parse_time_inputs", parse_time_inputs, distinct)
+    print(f"grammar speedup over legacy: {legacy / grammar:.1f}x")
+
+    print("Few distinct values")
+    legacy = bench("legacy, one at a time", legacy_parse, column)
+    bench("grammar only, no memo", grammar_parse, column)
+    bench("parse_time_input, one at a time", lambda c: [parse_time_input(v) for v in c], column)
+    bulk = bench("parse_time_inputs", parse_time_inputs, column)
+    print(f"parse_time_inputs speedup over legacy: {legacy / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Count widget updates pushed to Textual over a simulated hour.
+
+Drives a headless ClockwiseApp through Textual's ``run_test`` pilot: a
+25 minute Pomodoro that completes and a stopwatch lapping every five
+minutes, one display wakeup per simulated second. Counts how many
+``Static.update``, ``ProgressBar.update``, class changes and lap list
+refreshes reached Textual, then runs the same hour again with dirty
+tracking turned off, every field pushed on every wakeup, for comparison.
+
+Run with ``python benchmarks/bench_render.py``.
+"""
+
+import asyncio
+import tempfile
+import time
+from collections import Counter
+from unittest import mock
+
+from textual.dom import DOMNode
+from textual.geometry import Size
+from textual.widgets import ProgressBar, Static
+
+import clockwise.config.manager
+from clockwise.app import ClockwiseApp
+from clockwise.widgets.lap_list import LapList
+from clockwise.widgets.stopwatch import StopwatchWidget
+from clockwise.widgets.timer import TimerWidget
+
+SECONDS = 3600
+
+
+def counting(counts: Counter, key: str, method):
+    """Wrap ``method`` so each call is counted under ``key``."""
+
+    def wrapper(self, *args, **kwargs):
+        counts[key] += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def always_changed(self, field, value) -> bool:
+    """Replacement for the widgets' ``_changed``: every field is new."""
+    return True
+
+
+def sync_unconditionally(self):
+    """Replacement for ``LapList.sync`` that refreshes on every wakeup."""
+    self.lap_count = len(self.stopwatch.laps)
+    self._laps = self.stopwatch.laps
+    self.virtual_size = Size(0, max(self.lap_count, 1))
+    self.refresh()
+
+
+async def simulate_hour(counts: Counter) -> float:
+    """Run the simulated hour and return the wall time spent in wakeups."""
+    app = ClockwiseApp()
+    async with app.run_test() as pilot:
+        app.timer.set_duration(25 * 60, "Pomodoro")
+        app.timer.start()
+        app.stopwatch.start()
+        await pilot.pause()
+        counts.clear()
+
+        started = time.perf_counter()
+        for second in range(1, SECONDS + 1):
+            app.timer.tick()
+            app.stopwatch.tick()
+            if second % 300 == 0:
+                app.stopwatch.add_lap()
+            app.tick_update()
+        elapsed = time.perf_counter() - started
+        await pilot.pause()
+    return elapsed
+
+
+def measure(dirty_tracking: bool):
+    """Run the simulated hour, returning update counts and wakeup wall time."""
+    counts = Counter()
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.multiple(
+        clockwise.config.manager,
+        user_config_dir=lambda _: f"{tmp}/config",
+        user_data_dir=lambda _: f"{tmp}/data",
+    ), mock.patch.multiple(
+        Static, update=counting(counts, "Static.update", Static.update)
+    ), mock.patch.multiple(
+        ProgressBar, update=counting(counts, "ProgressBar.update", ProgressBar.update)
+    ), mock.patch.multiple(
+        DOMNode, set_class=counting(counts, "set_class", DOMNode.set_class)
+    ), mock.patch.multiple(
+        LapList, refresh=counting(counts, "LapList.refresh", LapList.refresh)
+    ):
+        if dirty_tracking:
+            elapsed = asyncio.run(simulate_hour(counts))
+        else:
+            with mock.patch.multiple(TimerWidget, _changed=always_changed), mock.patch.multiple(
+                StopwatchWidget, _changed=always_changed
+            ), mock.patch.multiple(LapList, sync=sync_unconditionally):
+                elapsed = asyncio.run(simulate_hour(counts))
+    return counts, elapsed
+
+
+def main():
+    tracked, tracked_elapsed = measure(dirty_tracking=True)
+    untracked, untracked_elapsed = measure(dirty_tracking=False)
+
+    print(f"Simulated {SECONDS} wakeups: {'dirty tracking':>15} {'every field':>12}")
+    for key in sorted(set(tracked) | set(untracked)):
+        print(f"  {key:<28} {tracked[key]:>15} {untracked[key]:>12}")
+    pushed, unconditional = sum(tracked.values()), sum(untracked.values())
+    print(f"  {'total pushed':<28} {pushed:>15} {unconditional:>12}")
+    print(f"  {'wakeup wall time':<28} {tracked_elapsed:>14.2f}s {untracked_elapsed:>11.2f}s")
+    print(f"Dirty tracking pushes {unconditional / max(pushed, 1):.1f}x fewer updates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare polling the JSON state with reading the memory-mapped sidecar.
+
+A status bar polls state many times a second. This times one poll each
+way: parsing ``state.json`` as ``clockwise status`` does, loading it
+through :class:`StatePersistence`, opening and reading the sidecar once,
+and reading it through a :class:`SidecarReader` kept open. Run with
+``python benchmarks/bench_sidecar.py``.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from clockwise.models import Stopwatch, Timer
+from clockwise.state.persistence import StatePersistence
+from clockwise.state.sidecar import SidecarReader, StateSidecar, read_sidecar
+from clockwise.status import read_state
+
+LAP_COUNTS = (0, 1_000, 100_000)
+READS = 2_000
+
+
+def make_models(laps: int):
+    """Build a running timer and a stopwatch with ``laps`` recorded laps."""
+    timer = Timer(1500, "Pomodoro")
+    timer.start()
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    for _ in range(laps):
+        stopwatch.tick()
+        stopwatch.add_lap()
+    return timer, stopwatch
+
+
+def bench(read) -> list:
+    """Return per-call latencies of ``read()`` in seconds."""
+    latencies = []
+    for _ in range(READS):
+        started = time.perf_counter()
+        read()
+        latencies.append(time.perf_counter() - started)
+    return sorted(latencies)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        print(f"{'laps':>8} {'reader':>16} {'p50 us':>9} {'p99 us':>9}")
+        for laps in LAP_COUNTS:
+            timer, stopwatch = make_models(laps)
+            state_file = directory / f"state-{laps}.json"
+            persistence = StatePersistence(state_file)
+            persistence.save_state(timer.get_state(), stopwatch.get_state())
+            sidecar = StateSidecar(directory / f"state-{laps}.bin")
+            sidecar.update(timer, stopwatch)
+            reader = SidecarReader(sidecar.path)
+
+            readers = {
+                "status json": lambda: read_state(str(state_file)),
+                "load_state": persistence.load_state,
+                "read_sidecar": lambda: read_sidecar(sidecar.path),
+                "SidecarReader": reader.read,
+            }
+            for name, read in readers.items():
+                latencies = bench(read)
+                p50 = latencies[len(latencies) // 2] * 1e6
+                p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+                print(f"{laps:>8} {name:>16} {p50:>9.1f} {p99:>9.1f}")
+            reader.close()
+            sidecar.close()
+
+
+if __name__ == "__main__":
+    main()
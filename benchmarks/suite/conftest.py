@@ -0,0 +1,26 @@
+"""Shared setup for the pytest-benchmark performance suite.
+
+Run with ``pytest benchmarks/suite``. Every run is saved as JSON under
+``.benchmarks/`` (pytest-benchmark's ``--benchmark-autosave``), keyed by
+machine and commit, so a later run on the same machine can be compared
+against it::
+
+    pytest benchmarks/suite --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Pass ``--benchmark-json=FILE`` to write a single report elsewhere
+instead. ``app_dirs`` comes from the repository's top-level conftest.py.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def pytest_configure(config):
+    # Save every run, named after the commit, unless the caller chose
+    # where results go
+    from pytest_benchmark.utils import get_tag
+
+    option = config.option
+    if not (option.benchmark_json or option.benchmark_save or option.benchmark_autosave):
+        option.benchmark_autosave = get_tag()
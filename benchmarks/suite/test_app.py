@@ -0,0 +1,39 @@
+"""Benchmarks for the end-to-end cost of an app tick, run headlessly."""
+
+import asyncio
+
+import pytest
+
+from clockwise.app import ClockwiseApp
+from clockwise.models import SimulatedClock
+
+LAP_COUNTS = (0, 1_000)
+
+
+@pytest.mark.parametrize("laps", LAP_COUNTS)
+def test_tick_update(benchmark, app_dirs, laps):
+    """
+    Run one display wakeup with a running timer and stopwatch.
+
+    The app runs on a simulated clock that is moved on a second before
+    every round, so each tick redraws the timer, progress bar, stopwatch
+    and current lap the way a real wakeup does.
+    """
+    clock = SimulatedClock()
+
+    async def main():
+        app = ClockwiseApp(clock=clock)
+        async with app.run_test() as pilot:
+            app.timer.set_duration(10**6, "Benchmark")
+            app.timer.start()
+            app.stopwatch.start()
+            for _ in range(laps):
+                clock.advance(1)
+                app.stopwatch.add_lap()
+            await pilot.pause()
+
+            benchmark.pedantic(
+                app.tick_update, setup=lambda: clock.advance(1), rounds=500, warmup_rounds=20
+            )
+
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""Benchmarks for time formatting and duration parsing throughput."""
+
+import random
+from array import array
+
+import pytest
+
+from clockwise.utils import formatting
+from clockwise.utils.formatting import (
+    format_time,
+    format_time_natural,
+    format_times,
+    parse_time_input,
+    parse_time_inputs,
+)
+
+DAY = range(86_400)
+SAMPLES = ["5m", "25m", "1h", "1h30m", "90", "45s", "2h15m", "1:30", "01:30:00", "1.5h"]
+
+
+@pytest.fixture
+def laps():
+    """A lap table of 10,000 lap times in seconds."""
+    rng = random.Random(0)
+    return array("q", (rng.randrange(20, 400) for _ in range(10_000)))
+
+
+@pytest.mark.parametrize("show_hours", [True, False])
+def test_format_time_day(benchmark, show_hours):
+    """Format every second of a day once, as a live clock does."""
+    benchmark(lambda: [format_time(seconds, show_hours) for seconds in DAY])
+
+
+def test_format_time_natural_day(benchmark):
+    """Format every second of a day in natural language."""
+    benchmark(lambda: [format_time_natural(seconds) for seconds in DAY])
+
+
+def test_format_times_laps(benchmark, laps):
+    """Format a lap table in one call."""
+    assert len(benchmark(format_times, laps, False)) == len(laps)
+
+
+def test_parse_time_input_uncached(benchmark):
+    """Parse durations through the grammar, bypassing the cache."""
+    benchmark(lambda: [formatting._parse(text) for text in SAMPLES])
+
+
+def test_parse_time_input(benchmark):
+    """Parse durations one call at a time."""
+    benchmark(lambda: [parse_time_input(text) for text in SAMPLES])
+
+
+def test_parse_time_inputs_column(benchmark):
+    """Parse a 100,000 row column in one call."""
+    rng = random.Random(0)
+    column = [rng.choice(SAMPLES) for _ in range(100_000)]
+    assert len(benchmark(parse_time_inputs, column)) == len(column)
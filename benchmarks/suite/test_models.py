@@ -0,0 +1,59 @@
+"""Benchmarks for the timer and stopwatch models at scale."""
+
+import pytest
+
+from clockwise.models import Stopwatch, Timer
+
+COUNTS = (1_000, 10_000)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_timer_tick(benchmark, count):
+    """Tick many running timers once each."""
+    timers = [Timer(10**9, f"Timer {i}") for i in range(count)]
+    for timer in timers:
+        timer.start()
+
+    def tick():
+        for timer in timers:
+            timer.tick()
+
+    benchmark(tick)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_stopwatch_tick(benchmark, count):
+    """Tick many running stopwatches once each."""
+    stopwatches = [Stopwatch() for _ in range(count)]
+    for stopwatch in stopwatches:
+        stopwatch.start()
+
+    def tick():
+        for stopwatch in stopwatches:
+            stopwatch.tick()
+
+    benchmark(tick)
+
+
+@pytest.mark.parametrize("laps", COUNTS)
+def test_stopwatch_laps(benchmark, laps):
+    """Record many laps, with the running lap statistics."""
+
+    def record():
+        stopwatch = Stopwatch()
+        stopwatch.start()
+        for _ in range(laps):
+            stopwatch.tick()
+            stopwatch.add_lap()
+        return stopwatch.get_lap_stats()
+
+    assert benchmark(record)["count"] == laps
+
+
+def test_next_change(benchmark):
+    """Compute the next display change of a running timer and stopwatch."""
+    timer = Timer(3600)
+    stopwatch = Stopwatch()
+    timer.start()
+    stopwatch.start()
+    benchmark(lambda: (timer.next_change_ns(), stopwatch.next_change_ns()))
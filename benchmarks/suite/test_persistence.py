@@ -0,0 +1,48 @@
+"""Benchmarks for state save and load latency as laps accumulate."""
+
+import pytest
+
+from clockwise.models import Stopwatch, Timer
+from clockwise.state import StateJournal, StatePersistence
+
+LAP_COUNTS = (0, 1_000, 100_000)
+BACKENDS = {"snapshot": StatePersistence, "journal": StateJournal}
+
+
+def make_state(laps: int):
+    """Build timer and stopwatch state with ``laps`` recorded laps."""
+    timer = Timer(1500, "Pomodoro")
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    for _ in range(laps):
+        stopwatch.tick()
+        stopwatch.add_lap()
+    return timer, stopwatch
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("laps", LAP_COUNTS)
+def test_save_state(benchmark, tmp_path, backend, laps):
+    """Save after one more lap, as the app does on every change."""
+    timer, stopwatch = make_state(laps)
+    persistence = BACKENDS[backend](tmp_path / "state.json")
+    persistence.save_state(timer.get_state(), stopwatch.get_state())
+
+    def save():
+        stopwatch.tick()
+        stopwatch.add_lap()
+        persistence.save_state(timer.get_state(), stopwatch.get_state())
+
+    benchmark(save)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("laps", LAP_COUNTS)
+def test_load_state(benchmark, tmp_path, backend, laps):
+    """Load state, as a new instance or a reload does."""
+    timer, stopwatch = make_state(laps)
+    persistence = BACKENDS[backend](tmp_path / "state.json")
+    persistence.save_state(timer.get_state(), stopwatch.get_state())
+
+    state = benchmark(persistence.load_state)
+    assert state["timer"]["name"] == "Pomodoro"
@@ -0,0 +1,33 @@
+"""Fixtures and options shared by the test suite and the benchmark suite."""
+
+import pytest
+
+
+@pytest.fixture
+def app_dirs(tmp_path, monkeypatch):
+    """Point the config and data directories at a temporary location."""
+    config_dir = tmp_path / "config"
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr("clockwise.config.manager.user_config_dir", lambda _: str(config_dir))
+    monkeypatch.setattr("clockwise.config.manager.user_data_dir", lambda _: str(data_dir))
+    return tmp_path
+
+
+def pytest_addoption(parser):
+    """Add --soak, which opts in to the slow memory soak tests."""
+    parser.addoption("--soak", action="store_true", help="also run the memory soak tests (slow)")
+
+
+def pytest_configure(config):
+    """Register the soak marker."""
+    config.addinivalue_line("markers", "soak: memory soak test, only run with --soak")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked soak unless --soak was given."""
+    if config.getoption("--soak"):
+        return
+    skip = pytest.mark.skip(reason="memory soak test, run with --soak")
+    for item in items:
+        if "soak" in item.keywords:
+            item.add_marker(skip)
@@ -2,6 +2,15 @@ __version__ = "0.1.0"
 __author__ = "othaimeen"
 __description__ = "A minimalist TUI timer and stopwatch application"
 
-from .app import ClockwiseApp, run
+from ._lazy import lazy_exports
 
-__all__ = ["ClockwiseApp", "run"]
+# Exports are loaded on first access (PEP 562): importing the app pulls in
+# Textual, which the command line and ``clockwise.models`` never need.
+_LAZY = {
+    "ClockwiseApp": ".app",
+    "run": ".app",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY)
@@ -1,19 +1,34 @@
 """Main entry point for Clockwise."""
 
-import click
-from .app import run
+import sys
 
 
-@click.command()
-@click.version_option(version="0.1.0")
-def main():
+def main(argv=None):
     """
-    Clockwise - A minimalist TUI timer and stopwatch.
+    Run the clockwise command.
 
-    Launch the application with beautiful terminal interface
-    for managing timers and tracking time.
+    ``clockwise status`` and ``clockwise --version`` are answered without
+    loading click, which would otherwise dominate the run time of a
+    command that tmux invokes every few seconds. Everything else goes
+    through the click interface.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``
     """
-    run()
+    args = sys.argv[1:] if argv is None else list(argv)
+    if args == ["--version"]:
+        from . import __version__
+
+        sys.stdout.write(f"clockwise, version {__version__}\n")
+        sys.exit(0)
+    if args[:1] == ["status"]:
+        from .status import main as status_main
+
+        sys.exit(status_main(args[1:]))
+
+    from .cli import cli
+
+    cli.main(args, prog_name="clockwise")
 
 
 if __name__ == "__main__":
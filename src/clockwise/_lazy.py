@@ -0,0 +1,36 @@
+"""Lazy package exports (PEP 562).
+
+This module imports nothing, not even ``typing``, so that importing a
+package costs no more than reading its export table.
+"""
+
+
+def lazy_exports(namespace, exports):
+    """
+    Build the module ``__getattr__`` and ``__dir__`` of a package with lazy exports.
+
+    Each export is imported from its submodule on first access and then
+    stored in the package, so later lookups never reach ``__getattr__``.
+
+    Args:
+        namespace: The package's ``globals()``
+        exports: Maps each exported name to the relative module defining it
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        from importlib import import_module
+
+        value = getattr(import_module(exports[name], package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,17 +1,29 @@
 """Main Clockwise application."""
 
+import asyncio
+import sqlite3
+import time
+from typing import Optional
+
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal
 from textual.binding import Binding
 from textual.widgets import Header, Footer
 
-from .models.timer_model import Timer
+from .models.clock import SYSTEM_CLOCK, Clock
+from .models.timer_model import NS_PER_SECOND, Timer
 from .models.stopwatch_model import Stopwatch
 from .widgets.timer import TimerWidget
 from .widgets.stopwatch import StopwatchWidget
 from .widgets.preset_manager import PresetListScreen, NewTimerScreen
 from .config.manager import ConfigManager
-from .state.persistence import StatePersistence
+from .daemon import DaemonClient, DaemonError
+from .metrics import DRIFT, SAVE_STATE, STOPWATCH_TICK, TIMER_TICK, TickMetrics
+from .state.history import HistoryStore, stopwatch_session, timer_session
+from .state.persistence import create_persistence
+from .state.sidecar import open_sidecar
+from .state.watch import StateWatcher
+from .state.writer import StateWriter
 
 
 class ClockwiseApp(App):
@@ -45,29 +57,74 @@ class ClockwiseApp(App):
         Binding("n", "new_timer", "New Timer"),
         Binding("l", "add_lap", "Lap (Stopwatch)"),
         Binding("d", "dismiss_alert", "Dismiss Alert"),
+        Binding("m", "toggle_metrics", "Metrics", show=False),
     ]
 
-    def __init__(self):
+    def __init__(
+        self,
+        attach: Optional[str] = None,
+        clock: Optional[Clock] = None,
+        collect_metrics: bool = False,
+    ):
+        """
+        Initialize the app.
+
+        Args:
+            attach: Socket of a ``clockwise daemon`` to attach to. The
+                daemon then owns the timers, their saved state and the
+                history; the app only mirrors and controls them.
+            clock: Clock for the models, saved state and history,
+                defaults to the system clock. With a
+                :class:`~clockwise.models.clock.SimulatedClock`, advance the
+                clock and call :meth:`tick_update` to play time forward.
+            collect_metrics: Record tick latency and drift from the
+                start. Otherwise nothing is measured until the metrics
+                overlay is first shown.
+        """
         super().__init__()
+        self.attach = attach
+        self.clock = clock or SYSTEM_CLOCK
+        self.daemon = None
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load_config()
-        self.state_persistence = StatePersistence(self.config_manager.state_file)
+        settings = self.config.get("settings", {})
+        self.state_persistence = create_persistence(
+            self.config_manager.state_file, settings, self.clock
+        )
 
         # Initialize models
-        self.timer = Timer()
-        self.stopwatch = Stopwatch()
+        self.timer = Timer(clock=self.clock)
+        self.stopwatch = Stopwatch(self.clock)
 
         # Restore state if enabled
-        if self.config.get("settings", {}).get("state_persistence", True):
+        if self.config.get("settings", {}).get("state_persistence", True) and not attach:
             self._restore_state()
 
+        self.history = None
+        if settings.get("history", True) and not attach:
+            try:
+                self.history = HistoryStore(self.config_manager.history_file)
+            except sqlite3.Error:
+                # History is optional - run without it
+                self.history = None
+        self.timer_preset = None
+        self.timer_started_at = None
+        self.stopwatch_started_at = None
+
         self.timer_widget = None
         self.stopwatch_widget = None
         self.focused_widget = "timer"  # "timer" or "stopwatch"
+        self._wakeup = None
+        self._wakeup_due_ns = None
+        self.metrics = TickMetrics() if collect_metrics else None
+        self.metrics_overlay = None
+        self.state_writer = None
+        self.state_watcher = None
+        self.state_sidecar = None
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
-        yield Header(show_clock=True)
+        yield Header(show_clock=self.config.get("settings", {}).get("show_clock", True))
         with Horizontal():
             self.timer_widget = TimerWidget(self.timer, id="timer-widget")
             self.stopwatch_widget = StopwatchWidget(self.stopwatch, id="stopwatch-widget")
@@ -81,17 +138,91 @@ class ClockwiseApp(App):
         self.timer_widget.add_class("focused")
         self.timer_widget.focus()
 
-        # Set up tick timer (1 second interval)
-        self.set_interval(1, self.tick_update)
+        settings = self.config.get("settings", {})
+        if self.attach:
+            self.run_worker(self._attach_daemon(), exit_on_error=False)
+        else:
+            if settings.get("state_sidecar", False):
+                self.state_sidecar = open_sidecar(self.config_manager.sidecar_file)
+                self._publish_state()
+            if settings.get("state_persistence", True):
+                interval = settings.get("state_save_interval", 5)
+                self.state_writer = StateWriter(self.state_persistence, interval)
+                # Not call_from_thread: it would block the watcher, which
+                # on_unmount joins from the event loop
+                loop = asyncio.get_running_loop()
+                self.state_watcher = StateWatcher(
+                    self.state_persistence.state_files(),
+                    lambda: loop.call_soon_threadsafe(self._state_file_changed),
+                )
+                self.state_watcher.start()
+
+        self._schedule_wakeup()
 
     def tick_update(self):
-        """Update timer and stopwatch every second."""
+        """
+        Update timer and stopwatch when their displayed time changes.
+
+        Normally run by the armed wakeup; when called directly, e.g. on a
+        simulated clock, the pending wakeup is replaced rather than left
+        to fire.
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            if self._wakeup_due_ns is not None:
+                metrics.record(DRIFT, self.clock.monotonic_ns() - self._wakeup_due_ns)
+            started = time.perf_counter_ns()
+        was_completed = self.timer.completed
         self.timer_widget.handle_tick()
+        if metrics is not None:
+            ended = time.perf_counter_ns()
+            metrics.record(TIMER_TICK, ended - started)
         self.stopwatch_widget.handle_tick()
+        if metrics is not None:
+            metrics.record(STOPWATCH_TICK, time.perf_counter_ns() - ended)
+        if self.timer.completed and not was_completed:
+            self._record_timer()
 
         # Save state if persistence is enabled
-        if self.config.get("settings", {}).get("state_persistence", True):
-            self._save_state()
+        self._save_state()
+
+        if self.metrics_overlay is not None and self.metrics_overlay.display:
+            self.metrics_overlay.refresh_metrics()
+        self._schedule_wakeup()
+
+    def _wakeup_due(self):
+        """Run the tick the armed wakeup was set for."""
+        # This timer has fired; stopping it from its own callback would
+        # cancel the task running this tick
+        self._wakeup = None
+        self.tick_update()
+
+    def _schedule_wakeup(self):
+        """
+        Arm a single wakeup for the next time the display changes.
+
+        Nothing is armed while both timer and stopwatch are stopped, so an
+        idle app does no periodic work at all.
+        """
+        if self._wakeup is not None:
+            self._wakeup.stop()
+            self._wakeup = None
+        self._wakeup_due_ns = None
+
+        deadlines = [
+            deadline
+            for deadline in (self.timer.next_change_ns(), self.stopwatch.next_change_ns())
+            if deadline is not None
+        ]
+        if deadlines:
+            self._wakeup_due_ns = min(deadlines)
+            delay = max(0, self._wakeup_due_ns - self.clock.monotonic_ns()) / NS_PER_SECOND
+            self._wakeup = self.set_timer(delay, self._wakeup_due)
+
+    def _models_changed(self):
+        """Persist state and re-arm the wakeup after a user action."""
+        self._save_state()
+        self._schedule_wakeup()
 
     def action_switch_focus(self):
         """Switch focus between timer and stopwatch."""
@@ -108,21 +239,35 @@ class ClockwiseApp(App):
 
     def action_toggle_active(self):
         """Toggle start/pause for the focused widget."""
+        if self.attach:
+            self._remote("toggle", target=self.focused_widget)
+            return
         if self.focused_widget == "timer":
             self.timer.toggle()
+            if self.timer.running and self.timer_started_at is None:
+                self.timer_started_at = self.clock.time()
             self.timer_widget.update_display()
         else:
             self.stopwatch.toggle()
+            if self.stopwatch.running and self.stopwatch_started_at is None:
+                self.stopwatch_started_at = self.clock.time()
             self.stopwatch_widget.update_display()
+        self._models_changed()
 
     def action_reset_active(self):
         """Reset the focused widget."""
+        if self.attach:
+            self._remote("reset", target=self.focused_widget)
+            return
         if self.focused_widget == "timer":
             self.timer.reset()
+            self.timer_started_at = None
             self.timer_widget.update_display()
         else:
+            self._record_stopwatch()
             self.stopwatch.reset()
             self.stopwatch_widget.update_display()
+        self._models_changed()
 
     def action_show_presets(self):
         """Show preset selection screen (timer only)."""
@@ -132,9 +277,19 @@ class ClockwiseApp(App):
 
     def _handle_preset_selection(self, preset_data):
         """Handle preset selection."""
-        if preset_data:
+        if preset_data and self.attach:
+            self._remote(
+                "set",
+                duration=preset_data["duration"],
+                name=preset_data["name"],
+                preset=preset_data.get("id"),
+            )
+        elif preset_data:
             self.timer.set_duration(preset_data["duration"], preset_data["name"])
+            self.timer_preset = preset_data.get("id")
+            self.timer_started_at = None
             self.timer_widget.update_display()
+            self._models_changed()
             self.notify(f"Timer set: {preset_data['name']}")
 
     def action_new_timer(self):
@@ -143,23 +298,49 @@ class ClockwiseApp(App):
 
     def _handle_new_timer(self, timer_data):
         """Handle new timer creation."""
-        if timer_data:
+        if timer_data and self.attach:
+            self._remote("set", duration=timer_data["duration"], name=timer_data["name"])
+        elif timer_data:
             self.timer.set_duration(timer_data["duration"], timer_data["name"])
+            self.timer_preset = None
+            self.timer_started_at = None
             self.timer_widget.update_display()
+            self._models_changed()
             self.notify(f"Timer set: {timer_data['name']}")
 
     def action_add_lap(self):
         """Add lap time (stopwatch only)."""
-        if self.focused_widget == "stopwatch":
+        if self.focused_widget == "stopwatch" and self.attach:
+            self._remote("lap")
+        elif self.focused_widget == "stopwatch":
             self.stopwatch.add_lap()
             self.stopwatch_widget.update_display()
+            self._models_changed()
             self.notify("Lap recorded")
 
     def action_dismiss_alert(self):
         """Dismiss timer completion alert."""
-        if self.timer.completed:
+        if self.timer.completed and self.attach:
+            self._remote("reset")
+        elif self.timer.completed:
             self.timer.reset()
+            self.timer_started_at = None
             self.timer_widget.update_display()
+            self._models_changed()
+
+    def action_toggle_metrics(self):
+        """Show or hide the tick latency overlay, starting measurement if needed."""
+        if self.metrics_overlay is None:
+            from .widgets.metrics_overlay import MetricsOverlay
+
+            if self.metrics is None:
+                self.metrics = TickMetrics()
+            self.metrics_overlay = MetricsOverlay(self.metrics, id="metrics-overlay")
+            self.mount(self.metrics_overlay)
+            return
+        self.metrics_overlay.display = not self.metrics_overlay.display
+        if self.metrics_overlay.display:
+            self.metrics_overlay.refresh_metrics()
 
     def action_help(self):
         """Show help message."""
@@ -169,6 +350,7 @@ class ClockwiseApp(App):
         Global:
           q - Quit application
           Tab - Switch focus (Timer/Stopwatch)
+          m - Show/hide tick latency metrics
           ? - Show this help
 
         Timer:
@@ -185,11 +367,110 @@ class ClockwiseApp(App):
         """
         self.notify(help_text, timeout=10)
 
+    async def _attach_daemon(self):
+        """Connect to the daemon and mirror its state until it goes away."""
+        client = DaemonClient(self.attach, lambda event: self._apply_daemon_state(event["state"]))
+        try:
+            await client.connect()
+            state = await client.request("subscribe")
+        except DaemonError as e:
+            self.exit(return_code=1, message=str(e))
+            return
+        self.daemon = client
+        self._apply_daemon_state(state)
+        try:
+            await client.wait_closed()
+        except DaemonError as e:
+            message = str(e)
+        else:
+            message = "The daemon closed the connection"
+        self.daemon = None
+        self.exit(return_code=1, message=message)
+
+    def _apply_daemon_state(self, state):
+        """Mirror state pushed by the daemon."""
+        self.timer.set_state(state["timer"])
+        try:
+            self.stopwatch.set_state(state["stopwatch"])
+        except ValueError:
+            # New laps that do not follow the ones held; fetch them all
+            self.run_worker(self._resync_daemon_state(), exit_on_error=False)
+        self.timer_widget.update_display()
+        self.stopwatch_widget.update_display()
+        self._schedule_wakeup()
+
+    async def _resync_daemon_state(self):
+        """Replace the mirrored state with the daemon's full state."""
+        if self.daemon is not None:
+            self._apply_daemon_state(await self.daemon.request("status"))
+
+    def _remote(self, cmd, **args):
+        """Send a command to the daemon; its state push updates the display."""
+        if self.daemon is None:
+            self.notify("Not connected to the daemon", severity="error")
+            return
+        self.run_worker(self.daemon.request(cmd, **args), exit_on_error=False)
+
+    def _state_file_changed(self):
+        """Pick up state saved by another Clockwise instance."""
+        state = self.state_persistence.reload()
+        if state is None:
+            return
+        if state.get("timer"):
+            self.timer.set_state(state["timer"])
+        if state.get("stopwatch"):
+            self.stopwatch.set_state(state["stopwatch"])
+        self.timer_widget.update_display()
+        self.stopwatch_widget.update_display()
+        self._publish_state()
+        self._schedule_wakeup()
+
+    def _publish_state(self):
+        """Update the memory-mapped sidecar in place."""
+        if self.state_sidecar is not None:
+            self.state_sidecar.update(self.timer, self.stopwatch)
+
     def _save_state(self):
-        """Save current state."""
-        timer_state = self.timer.get_state()
-        stopwatch_state = self.stopwatch.get_state()
-        self.state_persistence.save_state(timer_state, stopwatch_state)
+        """Publish the current state and hand it to the background writer."""
+        if self.metrics is not None:
+            started = time.perf_counter_ns()
+            self._write_state()
+            self.metrics.record(SAVE_STATE, time.perf_counter_ns() - started)
+        else:
+            self._write_state()
+
+    def _write_state(self):
+        """
+        Update the sidecar and submit a snapshot to the writer.
+
+        Only constant-size values are captured here; the writer thread
+        encodes the laps.
+        """
+        self._publish_state()
+        if self.state_writer is None:
+            return
+        self.state_writer.submit(self.timer.get_state(), self.stopwatch.snapshot())
+
+    def _record_timer(self):
+        """Record the timer that just completed in the history."""
+        self._record_session(timer_session(self.timer, self.timer_preset, self.timer_started_at))
+
+    def _record_stopwatch(self):
+        """Record the stopwatch session about to be reset in the history."""
+        if not self.stopwatch.elapsed_ns:
+            return
+        self._record_session(stopwatch_session(self.stopwatch, self.stopwatch_started_at))
+        self.stopwatch_started_at = None
+
+    def _record_session(self, session):
+        """Add a finished session to the history database."""
+        if self.history is None:
+            return
+        try:
+            self.history.record(session)
+        except sqlite3.Error:
+            # Silently fail - history is not critical
+            pass
 
     def _restore_state(self):
         """Restore saved state."""
@@ -204,12 +485,46 @@ class ClockwiseApp(App):
 
     def on_unmount(self) -> None:
         """Clean up when application closes."""
+        if self.state_watcher is not None:
+            self.state_watcher.stop()
         # Save final state
-        if self.config.get("settings", {}).get("state_persistence", True):
+        if self.state_writer is not None:
             self._save_state()
-
-
-def run():
-    """Run the Clockwise application."""
-    app = ClockwiseApp()
-    app.run()
+            self.state_writer.close()
+        if self.state_sidecar is not None:
+            self.state_sidecar.close()
+        if self.history is not None:
+            self.history.close()
+
+
+def run(
+    attach: Optional[str] = None,
+    metrics_file: Optional[str] = None,
+    profile_file: Optional[str] = None,
+    memory_file: Optional[str] = None,
+):
+    """
+    Run the Clockwise application.
+
+    Args:
+        attach: Socket of a running daemon to attach to, if any
+        metrics_file: File to write the tick latency histograms to as
+            JSON on exit, if any
+        profile_file: File to write a cProfile of the whole session to,
+            if any
+        memory_file: File to write tracemalloc snapshots of the session
+            to, if any
+
+    Raises:
+        OSError: If a metrics or profiling file cannot be written
+    """
+    app = ClockwiseApp(attach, collect_metrics=metrics_file is not None)
+    if profile_file is None and memory_file is None:
+        app.run()
+    else:
+        from .profiling import profiling
+
+        with profiling(profile_file, memory_file):
+            app.run()
+    if metrics_file is not None:
+        app.metrics.dump(metrics_file)
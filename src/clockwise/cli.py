@@ -0,0 +1,281 @@
+"""Command line interface for Clockwise."""
+
+import click
+
+from . import __version__
+
+
+@click.group(invoke_without_command=True)
+@click.version_option(version=__version__, prog_name="clockwise")
+@click.option("--attach", is_flag=True, help="Control the timers of a running daemon.")
+@click.option("--socket", "socket_path", metavar="PATH", help="Daemon socket to attach to.")
+@click.option(
+    "--metrics-file",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help="Write tick latency and drift histograms to PATH as JSON on exit.",
+)
+@click.option(
+    "--profile",
+    "profile_file",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help="Profile the whole session with cProfile and write the stats to PATH.",
+)
+@click.option(
+    "--trace-memory",
+    "memory_file",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help="Trace allocations and snapshot them to PATH every few minutes and on exit.",
+)
+@click.pass_context
+def cli(ctx, attach, socket_path, metrics_file, profile_file, memory_file):
+    """
+    Clockwise - A minimalist TUI timer and stopwatch.
+
+    Launch the application with beautiful terminal interface
+    for managing timers and tracking time.
+    """
+    if ctx.invoked_subcommand is None:
+        from .app import run
+
+        socket = None
+        if attach:
+            from .daemon import DaemonError, require_unix_sockets
+            from .daemon import socket_path as default_socket_path
+
+            try:
+                require_unix_sockets()
+            except DaemonError as e:
+                raise click.ClickException(str(e)) from e
+            socket = socket_path or default_socket_path()
+        try:
+            run(
+                attach=socket,
+                metrics_file=metrics_file,
+                profile_file=profile_file,
+                memory_file=memory_file,
+            )
+        except OSError as e:
+            raise click.ClickException(str(e)) from e
+
+
+@cli.command()
+@click.argument("duration")
+@click.option("--name", default="Timer", show_default=True, help="Name shown while running.")
+@click.option("--quiet", "-q", is_flag=True, help="Print nothing, just exit when done.")
+@click.pass_context
+def timer(ctx, duration, name, quiet):
+    """
+    Run a timer in the terminal without the TUI.
+
+    DURATION is given like "25m", "1h30m", "90" or "1:30:00". Exits with
+    status 0 when the timer completes and 130 when interrupted.
+    """
+    from .headless import run_timer
+
+    seconds = _parse_duration(duration, "DURATION")
+    ctx.exit(run_timer(seconds, name, quiet))
+
+
+@cli.command()
+@click.option("--for", "limit", help='Stop after this long, e.g. "10m".')
+@click.option("--quiet", "-q", is_flag=True, help="Print nothing, just exit when done.")
+@click.pass_context
+def stopwatch(ctx, limit, quiet):
+    """Run a stopwatch in the terminal without the TUI until Ctrl-C."""
+    from .headless import run_stopwatch
+
+    seconds = None if limit is None else _parse_duration(limit, "--for")
+    ctx.exit(run_stopwatch(seconds, quiet))
+
+
+@cli.command(
+    context_settings={"ignore_unknown_options": True},
+    add_help_option=False,
+    short_help="Print the current timer state for status bars.",
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+@click.pass_context
+def status(ctx, args):
+    """
+    Print the current timer state, e.g. for a tmux status bar.
+
+    Takes --format with the fields {name}, {remaining}, {status} and
+    more; see 'clockwise status --help'. Normally answered by a fast
+    path that never loads this command line parser.
+    """
+    from .status import main as status_main
+
+    ctx.exit(status_main(list(args)))
+
+
+@cli.command()
+@click.option("--since", help="Start of the period: YYYY-MM-DD, today, 7d or 4w.")
+@click.option(
+    "--group-by",
+    type=click.Choice(["preset", "day", "week"]),
+    default="preset",
+    show_default=True,
+    help="How to bucket sessions.",
+)
+def report(since, group_by):
+    """Summarise recorded sessions."""
+    from .report import format_report, parse_since
+
+    try:
+        start = parse_since(since)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--since") from e
+
+    history = _open_history()
+    try:
+        click.echo(format_report(history.report(start, group_by), group_by))
+    finally:
+        history.close()
+
+
+@cli.command("rebuild-report")
+def rebuild_report():
+    """Recompute report rollups from the recorded sessions."""
+    history = _open_history()
+    try:
+        history.rebuild_rollups()
+        click.echo(f"Rebuilt rollups from {history.count()} sessions")
+    finally:
+        history.close()
+
+
+@cli.command("profile-report")
+@click.option(
+    "--profile",
+    "profile_file",
+    metavar="PATH",
+    type=click.Path(exists=True, dir_okay=False),
+    help="cProfile stats written by --profile.",
+)
+@click.option(
+    "--trace-memory",
+    "memory_file",
+    metavar="PATH",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Snapshot written by --trace-memory.",
+)
+@click.option("--limit", default=15, show_default=True, help="Entries to list in each table.")
+def profile_report(profile_file, memory_file, limit):
+    """
+    Summarise files written by --profile and --trace-memory.
+
+    Lists the functions with the most cumulative time and the lines
+    holding the most memory. If the baseline taken when the session
+    started is still next to the memory file, the lines that grew the
+    most since then are listed too.
+    """
+    from .profiling import memory_report, profile_report
+
+    if profile_file is None and memory_file is None:
+        raise click.UsageError("Give --profile, --trace-memory or both")
+    reports = []
+    try:
+        if profile_file is not None:
+            reports.append(profile_report(profile_file, limit))
+        if memory_file is not None:
+            reports.append(memory_report(memory_file, limit))
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+    click.echo("\n\n".join(reports))
+
+
+@cli.command()
+@click.option("--socket", "socket_path", metavar="PATH", help="Socket to listen on.")
+def daemon(socket_path):
+    """Run a daemon that owns the timers and serves them over a Unix socket."""
+    from .daemon import DaemonError, run_daemon
+
+    try:
+        run_daemon(socket_path)
+    except DaemonError as e:
+        raise click.ClickException(str(e)) from e
+
+
+@cli.command()
+@click.argument(
+    "command",
+    type=click.Choice(["start", "pause", "toggle", "reset", "lap", "set", "status", "subscribe"]),
+    metavar="COMMAND",
+)
+@click.argument("duration", required=False)
+@click.option(
+    "--target",
+    type=click.Choice(["timer", "stopwatch"]),
+    default="timer",
+    show_default=True,
+    help="Which clock to control.",
+)
+@click.option("--name", help="Timer name, for set.")
+@click.option("--socket", "socket_path", metavar="PATH", help="Daemon socket to connect to.")
+def ctl(command, duration, target, name, socket_path):
+    """
+    Send a command to a running daemon and print the resulting state.
+
+    COMMAND is one of start, pause, toggle, reset, lap, set, status or
+    subscribe. 'set' takes a DURATION such as "25m". 'subscribe' prints a line for
+    every state change until interrupted.
+    """
+    import json
+
+    from .daemon import DaemonError, send_command
+
+    args = {"target": target}
+    if command == "set":
+        if duration is None:
+            raise click.UsageError("'set' needs a DURATION")
+        args.update(duration=_parse_duration(duration, "DURATION"), name=name)
+    try:
+        if command == "subscribe":
+            _subscribe(socket_path)
+        else:
+            click.echo(json.dumps(send_command(command, socket_path, **args)))
+    except DaemonError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def _subscribe(socket_path):
+    """Print daemon state events until interrupted."""
+    import asyncio
+    import json
+
+    from .daemon import DaemonClient
+
+    async def main():
+        client = DaemonClient(socket_path, lambda event: click.echo(json.dumps(event)))
+        await client.connect()
+        click.echo(json.dumps(await client.request("subscribe")))
+        await client.wait_closed()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def _parse_duration(value, param_hint):
+    """Parse a positive duration argument into seconds."""
+    from .utils.formatting import DurationParseError, parse_time_input
+
+    try:
+        seconds = parse_time_input(value)
+    except DurationParseError as e:
+        raise click.BadParameter(str(e), param_hint=param_hint) from e
+    if seconds <= 0:
+        raise click.BadParameter(f"Invalid duration: {value!r}", param_hint=param_hint)
+    return seconds
+
+
+def _open_history():
+    """Open the history database from the configured data directory."""
+    from .config.manager import ConfigManager
+    from .state.history import HistoryStore
+
+    return HistoryStore(ConfigManager().history_file)
@@ -1,4 +1,12 @@
-from .manager import ConfigManager
-from .defaults import get_default_config
+"""Configuration for Clockwise, loaded on first use."""
 
-__all__ = ["ConfigManager", "get_default_config"]
+from .._lazy import lazy_exports
+
+_LAZY = {
+    "ConfigManager": ".manager",
+    "get_default_config": ".defaults",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY)
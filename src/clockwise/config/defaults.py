@@ -3,8 +3,15 @@
 DEFAULT_CONFIG = {
     "settings": {
         "state_persistence": True,
+        "state_save_interval": 5,  # seconds between background state writes
+        "state_durability": "rename",  # none, rename, fsync
+        "state_mode": "snapshot",  # snapshot, journal
+        "state_sidecar": False,  # publish state in memory-mapped state.bin
+        "history": True,  # record finished sessions in history.db
         "alert_style": "flash",  # flash, border, color
         "time_format": "digital",  # digital, natural
+        "timer_backend": "heap",  # heap, wheel
+        "show_clock": True,  # header clock, redraws every second
     },
     "presets": {
         "pomodoro": {
@@ -26,6 +33,14 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Settings restricted to a fixed set of values; anything else in the
+# config file falls back to the default
+SETTING_CHOICES = {
+    "state_durability": ("none", "rename", "fsync"),
+    "state_mode": ("snapshot", "journal"),
+    "timer_backend": ("heap", "wheel"),
+}
+
 
 def get_default_config():
     """Return a copy of the default configuration."""
@@ -20,7 +20,7 @@ except ImportError:
 
 from platformdirs import user_config_dir, user_data_dir
 
-from .defaults import get_default_config
+from .defaults import SETTING_CHOICES, get_default_config
 
 
 class ConfigManager:
@@ -32,6 +32,8 @@ class ConfigManager:
         self.data_dir = Path(user_data_dir(self.app_name))
         self.config_file = self.config_dir / "config.toml"
         self.state_file = self.data_dir / "state.json"
+        self.history_file = self.data_dir / "history.db"
+        self.sidecar_file = self.data_dir / "state.bin"
 
         self.config: Dict[str, Any] = {}
         self._ensure_directories()
@@ -102,6 +104,15 @@ class ConfigManager:
         for key, value in default["settings"].items():
             if key not in config["settings"]:
                 config["settings"][key] = value
+        for key, choices in SETTING_CHOICES.items():
+            value = config["settings"][key]
+            if value not in choices:
+                print(
+                    f"Invalid {key} {value!r} in {self.config_file}, "
+                    f"using {default['settings'][key]!r} (choose from {', '.join(choices)})",
+                    file=sys.stderr,
+                )
+                config["settings"][key] = default["settings"][key]
 
         # Ensure presets exist
         if "presets" not in config:
@@ -0,0 +1,707 @@
+"""Background daemon that owns the timer and stopwatch.
+
+The daemon serves a line-delimited JSON protocol over a Unix domain socket.
+Each request is one JSON object per line::
+
+    {"id": 1, "cmd": "start", "target": "timer"}
+    {"id": 2, "cmd": "set", "duration": "25m", "name": "Focus", "preset": "pomodoro"}
+    {"id": 3, "cmd": "subscribe"}
+
+and gets one response line echoing its ``id``, either
+``{"id": 1, "ok": true, "state": {...}}`` or ``{"id": 1, "ok": false,
+"error": "..."}``. After ``subscribe`` the connection also receives an
+``{"event": "state", "cause": "start", "state": {...}}`` line whenever the
+state changes. Nothing is pushed while the clocks merely run: the state
+carries ``remaining_ns``/``elapsed_ns`` and a running flag, so clients
+count locally and the daemon only wakes up when the timer completes.
+
+Laps are sent once. The response to ``subscribe`` carries all of them;
+each event's stopwatch state then carries ``laps_from``, the number of
+laps sent before, and only the laps added since, which
+``Stopwatch.set_state`` appends. Responses to a subscribed connection's
+later changes carry no laps (``laps_from`` is the current count), as
+the event for the same change brings them. A client that finds
+``laps_from`` does not match the laps it holds can send ``status`` for
+the full state.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import sqlite3
+import tempfile
+from typing import Any, Callable, Dict, Optional, Set
+
+from .models.clock import SYSTEM_CLOCK, Clock
+from .models.engine import create_engine
+from .models.stopwatch_model import Stopwatch
+from .models.timer_model import NS_PER_SECOND
+
+COMMANDS = ("start", "pause", "toggle", "reset", "lap", "set", "status", "subscribe")
+TARGETS = ("timer", "stopwatch")
+# Responses to status and subscribe carry the full lap buffer, which can
+# outgrow asyncio's 64 KiB default
+READ_LIMIT = 16 * 1024 * 1024
+# Messages buffered for a client before it is considered too slow and dropped
+CLIENT_QUEUE = 256
+# Seconds close() lets clients take what they were sent before dropping them
+CLOSE_TIMEOUT = 2.0
+
+
+def socket_path() -> str:
+    """
+    Default path of the daemon socket for the current user.
+
+    Raises:
+        DaemonError: If the platform has no Unix domain sockets
+    """
+    require_unix_sockets()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "clockwise.sock")
+    return os.path.join(tempfile.gettempdir(), f"clockwise-{os.getuid()}.sock")
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Serialise a protocol message as one line."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class DaemonError(Exception):
+    """A request the daemon rejected or could not answer."""
+
+
+def require_unix_sockets():
+    """
+    Check the platform can run the daemon and its clients.
+
+    Raises:
+        DaemonError: If there are no Unix domain sockets, as on Windows
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("The daemon needs Unix domain sockets, which this platform lacks")
+
+
+class ClockwiseDaemon:
+    """
+    Owns a :class:`~clockwise.models.timer_model.Timer` and :class:`Stopwatch`
+    and serves them to clients.
+
+    Everything runs on one asyncio event loop: each client gets a reader
+    coroutine and a writer coroutine fed by a bounded queue, so a slow
+    subscriber is disconnected instead of stalling the others. State is
+    persisted through a :class:`~clockwise.state.writer.StateWriter` and
+    finished sessions go to the history, exactly as the TUI does when it
+    runs standalone.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        persistence=None,
+        history=None,
+        save_interval: float = 5.0,
+        sidecar=None,
+        clock: Optional[Clock] = None,
+        timer_backend: str = "heap",
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            path: Socket path, defaults to :func:`socket_path`
+            persistence: State persistence backend, or None to keep state in memory
+            history: :class:`~clockwise.state.history.HistoryStore` for
+                finished sessions, or None
+            save_interval: Seconds between state saves while a clock runs
+            sidecar: :class:`~clockwise.state.sidecar.StateSidecar` to
+                publish state in, or None
+            clock: Clock for the timer, stopwatch and history, defaults
+                to the system clock
+            timer_backend: Backend of the timer engine that schedules the
+                timer's completion, see
+                :func:`~clockwise.models.engine.create_engine`
+
+        Raises:
+            ValueError: If the timer backend is unknown
+        """
+        self.path = path or socket_path()
+        self.persistence = persistence
+        self.history = history
+        self.save_interval = save_interval
+        self.sidecar = sidecar
+        self.clock = clock or SYSTEM_CLOCK
+
+        self.engine = create_engine(timer_backend, self.clock)
+        self._timer_id = self.engine.add(0)
+        self.timer = self.engine.get(self._timer_id)
+        self.stopwatch = Stopwatch(self.clock)
+        if persistence is not None:
+            timer_state = persistence.get_timer_state()
+            stopwatch_state = persistence.get_stopwatch_state()
+            if timer_state:
+                self.timer.set_state(timer_state)
+                self.engine.sync(self._timer_id)
+            if stopwatch_state:
+                self.stopwatch.set_state(stopwatch_state)
+        # Lap buffer and count of the laps subscribers have been sent
+        self._sent_laps = self.stopwatch.laps
+        self._sent_lap_count = len(self._sent_laps)
+
+        self.timer_preset = None
+        self.timer_started_at = None
+        self.stopwatch_started_at = None
+
+        self.state_writer = None
+        self._server = None
+        self._clients: Dict[asyncio.Queue, asyncio.Task] = {}
+        self._senders: Dict[asyncio.Queue, asyncio.Task] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._autosave: Optional[asyncio.TimerHandle] = None
+        self._closed: Optional[asyncio.Event] = None
+
+    async def start(self):
+        """
+        Start listening on the socket.
+
+        Raises:
+            DaemonError: If another daemon is already serving the socket, or
+                the platform has no Unix domain sockets
+        """
+        require_unix_sockets()
+        if os.path.exists(self.path):
+            if _is_listening(self.path):
+                raise DaemonError(f"A daemon is already running on {self.path}")
+            os.unlink(self.path)
+
+        self._closed = asyncio.Event()
+        self._server = await asyncio.start_unix_server(
+            self._serve_client, self.path, limit=READ_LIMIT
+        )
+        os.chmod(self.path, 0o600)
+
+        if self.persistence is not None:
+            from .state.writer import StateWriter
+
+            self.state_writer = StateWriter(self.persistence, self.save_interval)
+        self._publish_state()
+        self._schedule_wakeup()
+        self._schedule_autosave()
+
+    async def serve_forever(self):
+        """Start the daemon and serve until :meth:`close` is called."""
+        if self._server is None:
+            await self.start()
+        await self._closed.wait()
+
+    async def close(self):
+        """Stop serving, disconnect clients and save the final state."""
+        if self._server is None:
+            return
+        server = self._server
+        server.close()
+        self._server = None
+
+        for queue in list(self._senders):
+            if not _put_nowait(queue, None):
+                self._drop_client(queue)
+        handlers = list(self._clients.values())
+        if handlers:
+            _, stalled = await asyncio.wait(handlers, timeout=CLOSE_TIMEOUT)
+            if stalled:
+                for queue in list(self._senders):
+                    self._drop_client(queue)
+                await asyncio.wait(stalled)
+        await server.wait_closed()
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        if self._autosave is not None:
+            self._autosave.cancel()
+            self._autosave = None
+
+        if self.state_writer is not None:
+            self._save_state()
+            self.state_writer.close()
+            self.state_writer = None
+        if self.sidecar is not None:
+            self.sidecar.close()
+            self.sidecar = None
+        if self.history is not None:
+            self.history.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        self._closed.set()
+
+    def get_state(self, laps_from: int = 0) -> Dict[str, Any]:
+        """
+        Current timer and stopwatch state, as sent to clients.
+
+        Args:
+            laps_from: Index of the first lap to include, see
+                :meth:`~clockwise.models.stopwatch_model.Stopwatch.get_state`
+        """
+        return {"timer": self.timer.get_state(), "stopwatch": self.stopwatch.get_state(laps_from)}
+
+    def handle(self, request: Dict[str, Any], laps: bool = True) -> Dict[str, Any]:
+        """
+        Apply one request to the models.
+
+        Args:
+            request: Decoded request with ``cmd`` and its arguments
+            laps: Whether the state returned after a change carries the
+                laps, or only their count as ``laps_from``; the state
+                returned by ``status`` and ``subscribe`` always carries them
+
+        Returns:
+            The state after the request
+
+        Raises:
+            ValueError: If the request is malformed
+        """
+        cmd = request.get("cmd")
+        target = request.get("target", "timer")
+        if cmd not in COMMANDS:
+            raise ValueError(f"Unknown command: {cmd!r}")
+        if target not in TARGETS:
+            raise ValueError(f"Unknown target: {target!r}")
+
+        if cmd == "set":
+            self._set_timer(request)
+        elif cmd == "lap":
+            self.stopwatch.add_lap()
+        elif cmd in ("start", "pause", "toggle", "reset"):
+            if target == "timer":
+                self._control_timer(cmd)
+            else:
+                self._control_stopwatch(cmd)
+        else:
+            return self.get_state()
+
+        self._changed(cmd)
+        return self._response_state(laps)
+
+    def _response_state(self, laps: bool) -> Dict[str, Any]:
+        """State for a response, with all laps or none."""
+        return self.get_state(0 if laps else len(self.stopwatch.laps))
+
+    def _set_timer(self, request: Dict[str, Any]):
+        """Set a new timer duration and name."""
+        duration = request.get("duration")
+        if isinstance(duration, str):
+            from .utils.formatting import parse_time_input
+
+            duration = parse_time_input(duration)
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            raise ValueError(f"Invalid duration: {request.get('duration')!r}")
+        self.timer.set_duration(duration, request.get("name") or "Timer")
+        self.engine.sync(self._timer_id)
+        self.timer_preset = request.get("preset")
+        self.timer_started_at = None
+
+    def _control_timer(self, cmd: str):
+        """Start, pause, toggle or reset the timer."""
+        if cmd == "reset":
+            self.engine.reset(self._timer_id)
+            self.timer_started_at = None
+            return
+        getattr(self.engine, cmd)(self._timer_id)
+        if self.timer.running and self.timer_started_at is None:
+            self.timer_started_at = self.clock.time()
+
+    def _control_stopwatch(self, cmd: str):
+        """Start, pause, toggle or reset the stopwatch."""
+        if cmd == "reset":
+            if self.stopwatch.elapsed_ns:
+                from .state.history import stopwatch_session
+
+                self._record_session(stopwatch_session(self.stopwatch, self.stopwatch_started_at))
+            self.stopwatch.reset()
+            self.stopwatch_started_at = None
+            return
+        getattr(self.stopwatch, cmd)()
+        if self.stopwatch.running and self.stopwatch_started_at is None:
+            self.stopwatch_started_at = self.clock.time()
+
+    def _changed(self, cause: str):
+        """Persist, re-arm the completion wakeup and notify subscribers."""
+        self._publish_state()
+        self._save_state()
+        self._schedule_wakeup()
+        self._schedule_autosave()
+        laps_from = self._mark_laps_sent()
+        if not self._subscribers:
+            return
+        line = encode({"event": "state", "cause": cause, "state": self.get_state(laps_from)})
+        for queue in list(self._subscribers):
+            if not _put_nowait(queue, line):
+                self._drop_client(queue)
+
+    def _mark_laps_sent(self) -> int:
+        """Record that subscribers have every lap, returning how many they had before."""
+        laps = self.stopwatch.laps
+        sent = self._sent_lap_count if laps is self._sent_laps else 0
+        self._sent_laps = laps
+        self._sent_lap_count = len(laps)
+        return sent
+
+    def _drop_client(self, queue: asyncio.Queue):
+        """Disconnect a client that has stopped reading, discarding what it was sent."""
+        self._subscribers.discard(queue)
+        sender = self._senders.get(queue)
+        if sender is not None:
+            sender.cancel()
+
+    def _schedule_wakeup(self):
+        """Arm a single wakeup for when the running timer completes."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        deadline_ns = self.engine.next_deadline()
+        if deadline_ns is None or self._server is None:
+            return
+        delay = max(0, deadline_ns - self.clock.monotonic_ns()) / NS_PER_SECOND
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._timer_due)
+
+    def _timer_due(self):
+        """Complete the timer once its deadline has passed."""
+        self._wakeup = None
+        if self._timer_id not in self.engine.poll():
+            self._schedule_wakeup()
+            return
+        from .state.history import timer_session
+
+        self._record_session(timer_session(self.timer, self.timer_preset, self.timer_started_at))
+        self._changed("complete")
+
+    def _record_session(self, session: Dict[str, Any]):
+        """Add a finished session to the history database."""
+        if self.history is None:
+            return
+        try:
+            self.history.record(session)
+        except sqlite3.Error:
+            # Silently fail - history is not critical
+            pass
+
+    def _publish_state(self):
+        """Update the memory-mapped sidecar in place."""
+        if self.sidecar is not None:
+            self.sidecar.update(self.timer, self.stopwatch)
+
+    def _save_state(self):
+        """Hand the current state to the background writer."""
+        if self.state_writer is not None:
+            self.state_writer.submit(self.timer.get_state(), self.stopwatch.snapshot())
+
+    def _schedule_autosave(self):
+        """Arm the periodic save while a clock runs, and disarm it otherwise."""
+        running = self.timer.running or self.stopwatch.running
+        if not running or self.state_writer is None or self._server is None:
+            if self._autosave is not None:
+                self._autosave.cancel()
+                self._autosave = None
+        elif self._autosave is None:
+            loop = asyncio.get_running_loop()
+            self._autosave = loop.call_later(self.save_interval, self._autosave_due)
+
+    def _autosave_due(self):
+        """Save progress and re-arm the next save if a clock still runs."""
+        self._autosave = None
+        self._save_state()
+        self._schedule_autosave()
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer requests from one client until it disconnects."""
+        queue: asyncio.Queue = asyncio.Queue(CLIENT_QUEUE)
+        self._clients[queue] = asyncio.current_task()
+        sender = self._senders[queue] = asyncio.ensure_future(_send_queued(queue, writer))
+        try:
+            while not sender.done():
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    break
+                if not line:
+                    break
+                response = self._respond(line, queue)
+                if not _put_nowait(queue, encode(response)):
+                    break
+        finally:
+            if not _put_nowait(queue, None):
+                self._drop_client(queue)
+            self._subscribers.discard(queue)
+            # Cancelling the sender drops the connection, so this cannot hang
+            await asyncio.wait([sender])
+            self._clients.pop(queue, None)
+            self._senders.pop(queue, None)
+
+    def _respond(self, line: bytes, queue: asyncio.Queue) -> Dict[str, Any]:
+        """Build the response to one request line."""
+        request: Any = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            state = self.handle(request, laps=queue not in self._subscribers)
+        except (ValueError, TypeError) as e:
+            response = {"ok": False, "error": str(e)}
+        else:
+            response = {"ok": True, "state": state}
+            if request["cmd"] == "subscribe":
+                self._subscribers.add(queue)
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return response
+
+
+async def _send_queued(queue: asyncio.Queue, writer: asyncio.StreamWriter):
+    """
+    Write queued lines to a client; a None entry closes the connection.
+
+    Cancelling the task aborts the connection instead, without waiting
+    for the client to read the lines still buffered for it.
+    """
+    try:
+        while True:
+            line = await queue.get()
+            if line is None:
+                break
+            writer.write(line)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    except asyncio.CancelledError:
+        writer.transport.abort()
+    finally:
+        writer.close()
+
+
+def _put_nowait(queue: asyncio.Queue, item: Optional[bytes]) -> bool:
+    """Queue an outgoing line, returning False if the client has fallen behind."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        return False
+    return True
+
+
+def _is_listening(path: str) -> bool:
+    """Whether something accepts connections on a Unix socket path."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+class DaemonClient:
+    """
+    asyncio client for the daemon protocol.
+
+    Requests may be issued concurrently; responses are matched to them by
+    id. Events pushed after ``subscribe`` are passed to ``on_event``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.path = path or socket_path()
+        self.on_event = on_event
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._read_task: Optional[asyncio.Task] = None
+        # Why reading stopped, if it was not the daemon closing the connection
+        self.error: Optional[DaemonError] = None
+
+    async def connect(self):
+        """
+        Connect to the daemon.
+
+        Raises:
+            DaemonError: If no daemon is listening
+        """
+        require_unix_sockets()
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.path, limit=READ_LIMIT
+            )
+        except OSError as e:
+            raise DaemonError(f"Cannot connect to {self.path}: {e}") from e
+        self._read_task = asyncio.ensure_future(self._read_messages())
+
+    async def request(self, cmd: str, **args) -> Dict[str, Any]:
+        """
+        Send a request and wait for its response.
+
+        Returns:
+            The state the daemon returned
+
+        Raises:
+            DaemonError: If the daemon rejected the request or went away
+        """
+        if self._writer is None:
+            await self.connect()
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(encode(dict(args, cmd=cmd, id=request_id)))
+        await self._writer.drain()
+        response = await future
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Request failed"))
+        return response["state"]
+
+    async def wait_closed(self):
+        """
+        Wait until the daemon closes the connection.
+
+        Raises:
+            DaemonError: If the connection was dropped because a message
+                from the daemon could not be read
+        """
+        if self._read_task is not None:
+            await self._read_task
+        if self.error is not None:
+            raise self.error
+
+    async def close(self):
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._read_task is not None:
+            await self._read_task
+            self._read_task = None
+
+    async def _read_messages(self):
+        """Dispatch responses and events until the connection closes."""
+        try:
+            while True:
+                try:
+                    line = await self._reader.readline()
+                except ValueError as e:
+                    raise DaemonError(
+                        f"A message from the daemon is longer than {READ_LIMIT} bytes"
+                    ) from e
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError as e:
+                    raise DaemonError(f"Malformed message from the daemon: {e}") from e
+                if "event" in message:
+                    if self.on_event is not None:
+                        self.on_event(message)
+                elif message.get("id") in self._pending:
+                    self._pending.pop(message["id"]).set_result(message)
+        except ConnectionError:
+            pass
+        except DaemonError as e:
+            self.error = e
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            error = self.error or DaemonError("Connection to the daemon closed")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+
+def send_command(cmd: str, path: Optional[str] = None, timeout: float = 5.0, **args):
+    """
+    Send one request with a blocking socket, for scripts.
+
+    Args:
+        cmd: Command name
+        path: Socket path, defaults to :func:`socket_path`
+        timeout: Seconds to wait for the daemon
+        **args: Request arguments such as ``target`` or ``duration``
+
+    Returns:
+        The state the daemon returned
+
+    Raises:
+        DaemonError: If the daemon is unreachable or rejected the request
+    """
+    require_unix_sockets()
+    path = path or socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(encode(dict(args, cmd=cmd)))
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError as e:
+        raise DaemonError(f"Cannot reach the daemon on {path}: {e}") from e
+    if not line:
+        raise DaemonError("The daemon closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Request failed"))
+    return response["state"]
+
+
+def run_daemon(path: Optional[str] = None):
+    """
+    Run the daemon with the user's configuration until SIGINT or SIGTERM.
+
+    Raises:
+        DaemonError: If the platform has no Unix domain sockets, or another
+            daemon serves the socket
+    """
+    require_unix_sockets()
+    from .config.manager import ConfigManager
+    from .state.history import HistoryStore
+    from .state.persistence import create_persistence
+    from .state.sidecar import open_sidecar
+
+    config_manager = ConfigManager()
+    settings = config_manager.load_config().get("settings", {})
+    persistence = None
+    if settings.get("state_persistence", True):
+        persistence = create_persistence(config_manager.state_file, settings)
+    history = None
+    if settings.get("history", True):
+        try:
+            history = HistoryStore(config_manager.history_file)
+        except sqlite3.Error:
+            # History is optional - run without it
+            history = None
+
+    sidecar = None
+    if settings.get("state_sidecar", False):
+        sidecar = open_sidecar(config_manager.sidecar_file)
+
+    daemon = ClockwiseDaemon(
+        path,
+        persistence,
+        history,
+        settings.get("state_save_interval", 5),
+        sidecar,
+        timer_backend=settings.get("timer_backend", "heap"),
+    )
+
+    async def main():
+        await daemon.start()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, lambda: asyncio.ensure_future(daemon.close()))
+        await daemon.serve_forever()
+
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+"""Run timers and stopwatches from the command line without the TUI."""
+
+import sys
+from typing import Callable, Optional, TextIO
+
+from .models.clock import SYSTEM_CLOCK, Clock
+from .models.stopwatch_model import Stopwatch
+from .models.timer_model import NS_PER_SECOND, Timer
+from .utils.formatting import format_time, format_time_natural
+
+EXIT_OK = 0
+EXIT_INTERRUPTED = 130
+
+
+class LineRenderer:
+    """
+    Minimal status output for headless runs.
+
+    On a terminal the status line is redrawn in place every time the
+    displayed time changes. When output is redirected (CI logs, pipes)
+    only the first and final lines are written, so a 25 minute timer
+    does not produce 1500 lines of log.
+    """
+
+    def __init__(self, out: TextIO, quiet: bool = False):
+        self.out = out
+        self.quiet = quiet
+        self.live = out.isatty()
+        self._shown = False
+
+    def show(self, line: str):
+        """Display the current status."""
+        if self.quiet or (self._shown and not self.live):
+            return
+        if self.live:
+            self.out.write(f"\r{line}\x1b[K")
+        else:
+            self.out.write(f"{line}\n")
+        self.out.flush()
+        self._shown = True
+
+    def finish(self, line: str):
+        """Replace the status with a final line."""
+        if self.quiet:
+            return
+        if self.live:
+            self.out.write("\r\x1b[K")
+        self.out.write(f"{line}\n")
+        self.out.flush()
+
+
+def run_timer(
+    duration: int,
+    name: str = "Timer",
+    quiet: bool = False,
+    out: Optional[TextIO] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+    clock: Optional[Clock] = None,
+) -> int:
+    """
+    Count a timer down to zero.
+
+    Args:
+        duration: Timer duration in seconds
+        name: Name shown in the output
+        quiet: Suppress all output
+        out: Stream to write to, defaults to stdout
+        sleep: Function used to wait for the next display change,
+            defaults to the clock's ``sleep``
+        clock: Clock to measure time with, defaults to the system clock
+
+    Returns:
+        Exit status: 0 once the timer completes, 130 if interrupted
+    """
+    clock = clock or SYSTEM_CLOCK
+    sleep = sleep or clock.sleep
+    renderer = LineRenderer(out or sys.stdout, quiet)
+    timer = Timer(duration, name, clock)
+    timer.start()
+    try:
+        while True:
+            timer.update()
+            if timer.completed:
+                break
+            renderer.show(f"{name} {format_time(timer.remaining)}")
+            _sleep_until(timer.next_change_ns(), sleep, clock)
+    except KeyboardInterrupt:
+        timer.pause()
+        renderer.finish(f"{name} stopped, {format_time(timer.remaining)} left")
+        return EXIT_INTERRUPTED
+
+    renderer.finish(f"{name} complete ({format_time_natural(duration)})")
+    return EXIT_OK
+
+
+def run_stopwatch(
+    limit: Optional[int] = None,
+    quiet: bool = False,
+    out: Optional[TextIO] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+    clock: Optional[Clock] = None,
+) -> int:
+    """
+    Run a stopwatch until interrupted or until ``limit`` seconds pass.
+
+    Args:
+        limit: Seconds after which to stop, or None to run until Ctrl-C
+        quiet: Suppress all output
+        out: Stream to write to, defaults to stdout
+        sleep: Function used to wait for the next display change,
+            defaults to the clock's ``sleep``
+        clock: Clock to measure time with, defaults to the system clock
+
+    Returns:
+        Exit status, 0 when stopped either way
+    """
+    clock = clock or SYSTEM_CLOCK
+    sleep = sleep or clock.sleep
+    renderer = LineRenderer(out or sys.stdout, quiet)
+    stopwatch = Stopwatch(clock)
+    stopwatch.start()
+    limit_ns = None if limit is None else limit * NS_PER_SECOND
+    try:
+        while limit_ns is None or stopwatch.elapsed_ns < limit_ns:
+            renderer.show(f"Stopwatch {format_time(stopwatch.elapsed)}")
+            _sleep_until(stopwatch.next_change_ns(), sleep, clock)
+    except KeyboardInterrupt:
+        pass
+
+    stopwatch.pause()
+    renderer.finish(f"Stopwatch stopped at {format_time(stopwatch.elapsed)}")
+    return EXIT_OK
+
+
+def _sleep_until(deadline_ns: int, sleep: Callable[[float], None], clock: Clock):
+    """Sleep until the clock's monotonic reading reaches ``deadline_ns``."""
+    delay_ns = deadline_ns - clock.monotonic_ns()
+    if delay_ns > 0:
+        sleep(delay_ns / NS_PER_SECOND)
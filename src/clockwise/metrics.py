@@ -0,0 +1,212 @@
+"""Latency histograms for instrumenting the app's display ticks."""
+
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Each power of two is split into 2 ** (SUB_BUCKET_BITS - 1) linear
+# buckets, so every recorded value is kept to within 1 part in 64
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS >> 1
+# Values up to 2 ** 40 ns (about 18 minutes) get their own bucket
+MAX_BITS = 40
+BUCKETS = SUB_BUCKETS + (MAX_BITS - SUB_BUCKET_BITS) * HALF_BUCKETS
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# What the app measures on each display wakeup
+DRIFT = "drift"
+TIMER_TICK = "timer_tick"
+STOPWATCH_TICK = "stopwatch_tick"
+SAVE_STATE = "save_state"
+TICK_METRICS = (DRIFT, TIMER_TICK, STOPWATCH_TICK, SAVE_STATE)
+
+
+def _index(value_ns: int) -> int:
+    """Bucket holding a value."""
+    if value_ns < SUB_BUCKETS:
+        return value_ns
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS
+    return min(BUCKETS - 1, shift * HALF_BUCKETS + (value_ns >> shift))
+
+
+def _highest(index: int) -> int:
+    """Largest value that falls in a bucket."""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // HALF_BUCKETS - 1
+    return ((index - shift * HALF_BUCKETS + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Fixed-size histogram of nanosecond values in the style of HdrHistogram.
+
+    Small values are counted exactly and larger ones in buckets whose
+    width grows with the value, so percentiles keep about two significant
+    digits from nanoseconds to minutes in a fixed 2,240 counters.
+    Recording is a couple of integer operations with no allocation.
+    Values past the last bucket are counted in it, and the exact minimum
+    and maximum are kept alongside.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        """
+        Count one value.
+
+        Args:
+            value_ns: Value in nanoseconds; negative values count as 0
+        """
+        if value_ns < 0:
+            value_ns = 0
+        self.counts[_index(value_ns)] += 1
+        if not self.count or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def percentile(self, percent: float) -> int:
+        """
+        Get the value below which ``percent`` of the recorded values fall.
+
+        Args:
+            percent: Percentile from 0 to 100
+
+        Returns:
+            The highest value of the bucket the percentile falls in,
+            capped at the recorded maximum (which values past the last
+            bucket report), or 0 if nothing was recorded
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.max_ns if index == BUCKETS - 1 else min(_highest(index), self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean of the recorded values, 0 if there are none."""
+        return self.total_ns / self.count if self.count else 0.0
+
+    def reset(self):
+        """Forget every recorded value."""
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.count = self.total_ns = self.min_ns = self.max_ns = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarise the histogram.
+
+        Returns:
+            Dict with count, min_ns, max_ns, mean_ns and a ``pNN_ns``
+            entry for each of :data:`PERCENTILES`
+        """
+        summary = {
+            "count": self.count,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "mean_ns": self.mean_ns,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent:g}_ns"] = self.percentile(percent)
+        return summary
+
+    def buckets(self) -> List[List[int]]:
+        """
+        List the non-empty buckets.
+
+        Returns:
+            ``[highest_value_ns, count]`` pairs in increasing order
+        """
+        return [[_highest(i), count] for i, count in enumerate(self.counts) if count]
+
+
+class TickMetrics:
+    """
+    Named histograms of the app's per-tick timings.
+
+    ``drift`` is how late each display wakeup fired against its deadline;
+    ``timer_tick`` and ``stopwatch_tick`` are the time spent in each
+    widget's ``handle_tick``; ``save_state`` is the time spent handing
+    state to the sidecar and the background writer.
+    """
+
+    def __init__(self, names=TICK_METRICS):
+        """
+        Initialize empty histograms.
+
+        Args:
+            names: Names of the histograms to keep
+        """
+        self.histograms: Dict[str, Histogram] = {name: Histogram() for name in names}
+
+    def record(self, name: str, value_ns: int):
+        """Count a value in the named histogram."""
+        self.histograms[name].record(value_ns)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Summaries of every histogram, by name."""
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def format(self) -> str:
+        """Render p50, p99 and max of each histogram as an aligned table."""
+        lines = [f"{'':<16}{'count':>8}{'p50':>10}{'p99':>10}{'max':>10}"]
+        for name, histogram in self.histograms.items():
+            lines.append(
+                f"{name:<16}{histogram.count:>8}"
+                f"{format_ns(histogram.percentile(50)):>10}"
+                f"{format_ns(histogram.percentile(99)):>10}"
+                f"{format_ns(histogram.max_ns):>10}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path: Path):
+        """
+        Write every histogram to a JSON file.
+
+        Args:
+            path: File to write; each histogram is stored as its summary
+                plus its non-empty buckets
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        data = {
+            name: dict(histogram.summary(), buckets=histogram.buckets())
+            for name, histogram in self.histograms.items()
+        }
+        Path(path).write_text(json.dumps({"histograms": data}, indent=2) + "\n")
+
+
+def format_ns(value_ns: Optional[float]) -> str:
+    """
+    Format a duration for display with a unit that suits its size.
+
+    Args:
+        value_ns: Duration in nanoseconds
+
+    Returns:
+        E.g. "850ns", "12.3us", "4.56ms" or "1.2s"
+    """
+    value_ns = value_ns or 0
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value_ns >= scale:
+            value = value_ns / scale
+            return f"{value:.3g}{unit}" if value < 100 else f"{value:.0f}{unit}"
+    return f"{value_ns:.0f}ns"
@@ -1,4 +1,19 @@
-from .timer_model import Timer
-from .stopwatch_model import Stopwatch
+"""Timer and stopwatch models, loaded on first use."""
 
-__all__ = ["Timer", "Stopwatch"]
+from .._lazy import lazy_exports
+
+_LAZY = {
+    "Timer": ".timer_model",
+    "Stopwatch": ".stopwatch_model",
+    "TimerEngine": ".engine",
+    "WheelTimerEngine": ".timing_wheel",
+    "create_engine": ".engine",
+    "Clock": ".clock",
+    "SystemClock": ".clock",
+    "SimulatedClock": ".clock",
+    "SYSTEM_CLOCK": ".clock",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY)
@@ -0,0 +1,109 @@
+"""Clocks the models, persistence and app read time from."""
+
+import time
+from typing import Optional, Protocol, Union
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class Clock(Protocol):
+    """
+    Source of monotonic and wall-clock time.
+
+    Everything that reads the time takes a clock, defaulting to
+    :data:`SYSTEM_CLOCK`, so a :class:`SimulatedClock` can stand in for
+    the real one.
+    """
+
+    def monotonic_ns(self) -> int:
+        """Monotonic clock reading in nanoseconds, as ``time.monotonic_ns``."""
+
+    def time(self) -> float:
+        """Wall-clock time as a Unix timestamp, as ``time.time``."""
+
+    def now(self):
+        """Local wall-clock time as a naive datetime, as ``datetime.now``."""
+
+
+class SystemClock:
+    """The real clocks of the machine."""
+
+    monotonic_ns = staticmethod(time.monotonic_ns)
+    time = staticmethod(time.time)
+
+    @staticmethod
+    def now():
+        """Local wall-clock time as a naive datetime."""
+        from datetime import datetime
+
+        return datetime.now()
+
+    def sleep(self, seconds: float):
+        """Block for ``seconds`` of real time."""
+        time.sleep(seconds)
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class SimulatedClock:
+    """
+    A clock that only moves when told to.
+
+    Monotonic and wall-clock time advance together, by exactly the amount
+    passed to :meth:`advance`, so a day of use can be replayed in
+    microseconds and runs are reproducible. ``sleep`` advances the clock
+    instead of blocking, which makes it a drop-in for the ``sleep``
+    arguments of the headless runners.
+    """
+
+    def __init__(self, start=None, monotonic_ns: int = 0):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial wall-clock time, as a datetime or Unix
+                timestamp; defaults to the current time
+            monotonic_ns: Initial monotonic reading in nanoseconds
+        """
+        if start is None:
+            start = time.time()
+        elif not isinstance(start, (int, float)):
+            start = start.timestamp()
+        self._wall_ns = round(start * NS_PER_SECOND)
+        self._monotonic_ns = monotonic_ns
+
+    def monotonic_ns(self) -> int:
+        """Simulated monotonic clock reading in nanoseconds."""
+        return self._monotonic_ns
+
+    def time(self) -> float:
+        """Simulated wall-clock time as a Unix timestamp."""
+        return self._wall_ns / NS_PER_SECOND
+
+    def now(self):
+        """Simulated local wall-clock time as a naive datetime."""
+        from datetime import datetime
+
+        return datetime.fromtimestamp(self.time())
+
+    def advance(self, seconds: Union[int, float] = 0, ns: Optional[int] = None):
+        """
+        Move time forward.
+
+        Args:
+            seconds: Seconds to advance by
+            ns: Nanoseconds to advance by, added to ``seconds``
+
+        Raises:
+            ValueError: If asked to go back in time
+        """
+        step_ns = round(seconds * NS_PER_SECOND) + (ns or 0)
+        if step_ns < 0:
+            raise ValueError("A clock cannot go backwards")
+        self._monotonic_ns += step_ns
+        self._wall_ns += step_ns
+
+    def sleep(self, seconds: float):
+        """Advance by ``seconds`` without blocking."""
+        self.advance(max(0, seconds))
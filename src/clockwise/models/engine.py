@@ -0,0 +1,234 @@
+"""Scheduler for running many countdown timers at once."""
+
+import heapq
+import itertools
+from typing import Any, Dict, Iterator, List, Optional
+
+from .clock import SYSTEM_CLOCK, Clock
+from .timer_model import Timer
+
+
+class TimerEngine:
+    """
+    Owns any number of :class:`Timer` instances and tracks their deadlines.
+
+    Running timers are kept in a min-heap keyed by their monotonic deadline,
+    so finding the next timer to complete is O(1) and starting one is
+    O(log n). A scheduler tick only pops the timers that are actually due;
+    idle and running timers further out are never visited.
+
+    Pausing and cancelling mark the timer's heap entry as removed instead of
+    searching for it, and the heap is rebuilt once removed entries outnumber
+    live ones, which keeps both operations O(log n) amortised.
+
+    Timers must be started, paused and reset through the engine so that it
+    can keep its schedule in sync.
+    """
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Initialize an empty engine.
+
+        Args:
+            clock: Clock shared by the engine and its timers, defaults to
+                the system clock
+        """
+        self.clock = clock or SYSTEM_CLOCK
+        self._timers: Dict[int, Timer] = {}
+        self._ids = itertools.count(1)
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}
+        self._sequence = itertools.count()
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, timer_id: int) -> bool:
+        return timer_id in self._timers
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._timers)
+
+    def get(self, timer_id: int) -> Timer:
+        """
+        Get a timer by id.
+
+        Raises:
+            KeyError: If no timer has this id
+        """
+        return self._timers[timer_id]
+
+    def add(self, duration: int, name: str = "Timer", start: bool = False) -> int:
+        """
+        Create a timer owned by the engine.
+
+        Args:
+            duration: Timer duration in seconds
+            name: Name/label for the timer
+            start: Whether to start the timer right away
+
+        Returns:
+            Id of the new timer
+        """
+        timer_id = next(self._ids)
+        self._timers[timer_id] = Timer(duration, name, self.clock)
+        if start:
+            self.start(timer_id)
+        return timer_id
+
+    def start(self, timer_id: int):
+        """Start a timer and schedule its deadline."""
+        timer = self._timers[timer_id]
+        if timer.running:
+            return
+        timer.start()
+        if timer.running:
+            self._schedule(timer_id, timer.deadline_ns)
+
+    def pause(self, timer_id: int):
+        """Pause a timer and drop it from the schedule."""
+        timer = self._timers[timer_id]
+        if timer.running:
+            self._unschedule(timer_id)
+            timer.pause()
+
+    def toggle(self, timer_id: int):
+        """Toggle a timer between running and paused."""
+        if self._timers[timer_id].running:
+            self.pause(timer_id)
+        else:
+            self.start(timer_id)
+
+    def reset(self, timer_id: int):
+        """Reset a timer to its full duration."""
+        self.pause(timer_id)
+        self._timers[timer_id].reset()
+
+    def sync(self, timer_id: int):
+        """
+        Reschedule a timer that was changed directly rather than through the engine.
+
+        Call this after restoring a timer with ``set_state`` or giving it a
+        new duration, either of which can start, stop or move its deadline.
+        """
+        self._unschedule(timer_id)
+        timer = self._timers[timer_id]
+        if timer.running:
+            self._schedule(timer_id, timer.deadline_ns)
+
+    def cancel(self, timer_id: int) -> Timer:
+        """
+        Remove a timer from the engine.
+
+        Returns:
+            The removed timer
+        """
+        self._unschedule(timer_id)
+        return self._timers.pop(timer_id)
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        Get the monotonic time, in nanoseconds, of the next completion.
+
+        Returns:
+            Deadline of the earliest running timer, or None if none is running
+        """
+        return self._peek()
+
+    def poll(self, now_ns: Optional[int] = None) -> List[int]:
+        """
+        Complete every timer whose deadline has passed.
+
+        Args:
+            now_ns: Monotonic clock reading to check against, defaults to now
+
+        Returns:
+            Ids of the timers that completed, in deadline order
+        """
+        if now_ns is None:
+            now_ns = self.clock.monotonic_ns()
+        completed = []
+        for timer_id in self._pop_due(now_ns):
+            timer = self._timers[timer_id]
+            timer.update(now_ns)
+            if timer.completed:
+                completed.append(timer_id)
+            elif timer.running:
+                self._schedule(timer_id, timer.deadline_ns)
+        return completed
+
+    def _schedule(self, timer_id: int, deadline_ns: int):
+        """Add a deadline for a timer."""
+        entry = [deadline_ns, next(self._sequence), timer_id]
+        self._entries[timer_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _unschedule(self, timer_id: int):
+        """Drop a timer's deadline, if it has one."""
+        entry = self._entries.pop(timer_id, None)
+        if entry is None:
+            return
+        entry[2] = None
+        self._removed += 1
+        if self._removed > len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def _peek(self) -> Optional[int]:
+        """Get the earliest live deadline."""
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+            self._removed -= 1
+        return heap[0][0] if heap else None
+
+    def _pop_due(self, now_ns: int) -> Iterator[int]:
+        """Remove and yield the timers due at ``now_ns``."""
+        heap = self._heap
+        while heap and heap[0][0] <= now_ns:
+            _, _, timer_id = heapq.heappop(heap)
+            if timer_id is None:
+                self._removed -= 1
+                continue
+            del self._entries[timer_id]
+            yield timer_id
+
+
+ENGINE_BACKENDS = ("heap", "wheel")
+
+
+def create_engine(
+    backend: Optional[str] = None,
+    clock: Optional[Clock] = None,
+    settings: Optional[Dict[str, Any]] = None,
+) -> TimerEngine:
+    """
+    Create a timer engine for the configured scheduling backend.
+
+    Args:
+        backend: "heap" for a deadline heap, "wheel" for a hierarchical
+            timing wheel, which is cheaper when timers are created and
+            cancelled far more often than they fire. Defaults to the
+            ``timer_backend`` setting.
+        clock: Clock for the engine and its timers, defaults to the
+            system clock
+        settings: The ``[settings]`` table, read for ``timer_backend``
+            when no backend is given
+
+    Returns:
+        An empty timer engine
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend is None:
+        backend = (settings or {}).get("timer_backend", "heap")
+    if backend == "heap":
+        return TimerEngine(clock)
+    if backend == "wheel":
+        from .timing_wheel import WheelTimerEngine
+
+        return WheelTimerEngine(clock=clock)
+    raise ValueError(f"Unknown timer backend: {backend!r}")
@@ -1,24 +1,87 @@
 """Stopwatch model for elapsed time tracking."""
 
-from typing import List
+import base64
+import math
+import sys
+from array import array
+from typing import NamedTuple, Optional
+
+from .clock import NS_PER_SECOND, SYSTEM_CLOCK, Clock
 
 
 class Stopwatch:
-    """Stopwatch model with lap tracking."""
+    """
+    Stopwatch model with lap tracking.
 
-    def __init__(self):
-        """Initialize stopwatch."""
-        self.elapsed = 0
-        self.running = False
-        self.laps: List[int] = []
+    Like :class:`~clockwise.models.timer_model.Timer`, elapsed time is derived
+    from the clock's ``monotonic_ns()`` when read rather than accumulated per tick.
+
+    Laps are kept in an ``array('q')`` of elapsed nanoseconds, 8 bytes per
+    lap, and lap duration statistics are updated as each lap is added. The
+    buffer is only ever appended to; resetting or restoring the stopwatch
+    replaces it with a new one.
+    """
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Initialize stopwatch.
+
+        Args:
+            clock: Clock to measure time with, defaults to the system clock
+        """
+        self.clock = clock or SYSTEM_CLOCK
+        self.laps = array("q")
+        self._offset_ns = 0
+        self._started_ns: Optional[int] = None
+        self._lap_encoder = LapEncoder()
+        self._reset_lap_stats()
+
+    @property
+    def running(self) -> bool:
+        """Whether the stopwatch is currently counting."""
+        return self._started_ns is not None
+
+    @property
+    def elapsed_ns(self) -> int:
+        """Elapsed time in nanoseconds."""
+        if self._started_ns is None:
+            return self._offset_ns
+        return self._offset_ns + self.clock.monotonic_ns() - self._started_ns
+
+    @property
+    def elapsed(self) -> int:
+        """Elapsed time in whole seconds."""
+        return self.elapsed_ns // NS_PER_SECOND
+
+    @elapsed.setter
+    def elapsed(self, seconds: int):
+        self._offset_ns = int(seconds * NS_PER_SECOND)
+        if self._started_ns is not None:
+            self._started_ns = self.clock.monotonic_ns()
+
+    def next_change_ns(self) -> Optional[int]:
+        """
+        Get when the displayed elapsed seconds next change.
+
+        Returns:
+            Monotonic clock reading in nanoseconds, or None while not running
+        """
+        if self._started_ns is None:
+            return None
+        now_ns = self.clock.monotonic_ns()
+        elapsed_ns = self._offset_ns + now_ns - self._started_ns
+        return now_ns + NS_PER_SECOND - elapsed_ns % NS_PER_SECOND
 
     def start(self):
         """Start the stopwatch."""
-        self.running = True
+        if self._started_ns is None:
+            self._started_ns = self.clock.monotonic_ns()
 
     def pause(self):
         """Pause the stopwatch."""
-        self.running = False
+        if self._started_ns is not None:
+            self._offset_ns += self.clock.monotonic_ns() - self._started_ns
+            self._started_ns = None
 
     def toggle(self):
         """Toggle between running and paused."""
@@ -29,44 +92,245 @@ class Stopwatch:
 
     def reset(self):
         """Reset stopwatch to zero and clear laps."""
-        self.elapsed = 0
-        self.running = False
-        self.laps = []
+        self._offset_ns = 0
+        self._started_ns = None
+        self.laps = array("q")
+        self._reset_lap_stats()
 
-    def tick(self):
-        """Increase elapsed time by 1 second."""
+    def tick(self, seconds: int = 1):
+        """
+        Advance a running stopwatch without waiting for the clock.
+
+        Kept for callers that drive the model by hand; elapsed time is
+        otherwise read from the clock.
+
+        Args:
+            seconds: Seconds to skip ahead
+        """
         if self.running:
-            self.elapsed += 1
+            self._offset_ns += seconds * NS_PER_SECOND
 
     def add_lap(self):
         """Record current elapsed time as a lap."""
-        if self.elapsed > 0:
-            self.laps.append(self.elapsed)
+        elapsed_ns = self.elapsed_ns
+        if elapsed_ns > 0:
+            self._append_lap(elapsed_ns)
+
+    def _append_lap(self, elapsed_ns: int):
+        """Store a lap and fold its duration into the running statistics."""
+        duration_ns = elapsed_ns - self.laps[-1] if self.laps else elapsed_ns
+        self.laps.append(elapsed_ns)
+
+        # Welford's online update keeps mean and variance exact without
+        # revisiting earlier laps.
+        count = len(self.laps)
+        delta = duration_ns - self._lap_mean_ns
+        self._lap_mean_ns += delta / count
+        self._lap_m2 += delta * (duration_ns - self._lap_mean_ns)
+        if count == 1 or duration_ns < self._fastest_lap_ns:
+            self._fastest_lap_ns = duration_ns
+        if count == 1 or duration_ns > self._slowest_lap_ns:
+            self._slowest_lap_ns = duration_ns
+
+    def _reset_lap_stats(self):
+        """Clear the running lap statistics."""
+        self._lap_mean_ns = 0.0
+        self._lap_m2 = 0.0
+        self._fastest_lap_ns = 0
+        self._slowest_lap_ns = 0
+
+    def get_lap_stats(self) -> dict:
+        """
+        Get lap duration statistics.
+
+        Returns:
+            Dict with count, fastest_ns, slowest_ns, mean_ns and stddev_ns
+            (population standard deviation); durations are 0 without laps
+        """
+        count = len(self.laps)
+        return {
+            "count": count,
+            "fastest_ns": self._fastest_lap_ns,
+            "slowest_ns": self._slowest_lap_ns,
+            "mean_ns": self._lap_mean_ns,
+            "stddev_ns": math.sqrt(self._lap_m2 / count) if count else 0.0,
+        }
 
     def get_last_lap_time(self) -> int:
         """Get the time of the last lap (difference from previous)."""
         if not self.laps:
             return 0
         if len(self.laps) == 1:
-            return self.laps[0]
-        return self.laps[-1] - self.laps[-2]
+            return self.laps[0] // NS_PER_SECOND
+        return (self.laps[-1] - self.laps[-2]) // NS_PER_SECOND
 
     def get_current_lap_time(self) -> int:
         """Get time since last lap."""
         if not self.laps:
             return self.elapsed
-        return self.elapsed - self.laps[-1]
+        return (self.elapsed_ns - self.laps[-1]) // NS_PER_SECOND
 
-    def get_state(self) -> dict:
-        """Get current stopwatch state for persistence."""
-        return {
-            "elapsed": self.elapsed,
+    def get_state(self, laps_from: int = 0) -> dict:
+        """
+        Get current stopwatch state for persistence.
+
+        Only the laps added since the previous call are base64-encoded;
+        the encoding of earlier laps is reused.
+
+        Args:
+            laps_from: Index of the first lap to include; above 0 the state
+                carries ``laps_from`` and only the laps from there on, to
+                extend a copy that already holds the earlier ones
+        """
+        return self.snapshot().to_state(self._lap_encoder, laps_from)
+
+    def snapshot(self) -> "StopwatchSnapshot":
+        """
+        Capture the current state in constant time, without copying the laps.
+
+        Returns:
+            A snapshot to turn into the :meth:`get_state` dict later, for
+            example on a writer thread
+        """
+        return StopwatchSnapshot(self.elapsed_ns, self.running, self.laps, len(self.laps))
+
+    def set_state(self, state: dict):
+        """
+        Restore stopwatch state from persistence.
+
+        A state with ``laps_from`` extends the laps held instead of
+        replacing them.
+
+        Raises:
+            ValueError: If ``laps_from`` is not the number of laps held
+        """
+        laps_from = state.get("laps_from", 0)
+        if laps_from and laps_from != len(self.laps):
+            raise ValueError(f"Laps from {laps_from} do not follow the {len(self.laps)} laps held")
+        self._started_ns = None
+        if "elapsed_ns" in state:
+            self._offset_ns = state["elapsed_ns"]
+        else:
+            self.elapsed = state.get("elapsed", 0)
+        if state.get("running", False):
+            self._started_ns = self.clock.monotonic_ns()
+
+        if "laps_ns" in state:
+            laps = decode_laps(state["laps_ns"])
+        else:
+            # State written before laps were stored in nanoseconds
+            laps = array("q", (lap * NS_PER_SECOND for lap in state.get("laps", [])))
+        if not laps_from:
+            self.laps = array("q")
+            self._reset_lap_stats()
+        for lap_ns in laps:
+            self._append_lap(lap_ns)
+
+
+class StopwatchSnapshot(NamedTuple):
+    """
+    Stopwatch state as of one moment, holding the lap buffer by reference.
+
+    The buffer is only appended to until the stopwatch replaces it, so its
+    first ``lap_count`` laps stay the laps of this moment.
+    """
+
+    elapsed_ns: int
+    running: bool
+    laps: array
+    lap_count: int
+
+    def to_state(self, encoder: "LapEncoder", laps_from: int = 0) -> dict:
+        """
+        Build the state dict :meth:`Stopwatch.get_state` returns.
+
+        Args:
+            encoder: Encoder for the laps, reused between snapshots of the
+                same stopwatch so only new laps are encoded
+            laps_from: Index of the first lap to include, see
+                :meth:`Stopwatch.get_state`
+        """
+        state = {
+            "elapsed": self.elapsed_ns // NS_PER_SECOND,
+            "elapsed_ns": self.elapsed_ns,
             "running": self.running,
-            "laps": self.laps.copy(),
         }
+        if laps_from:
+            state["laps_from"] = laps_from
+            state["laps_ns"] = encode_laps(self.laps[laps_from : self.lap_count])
+        else:
+            state["laps_ns"] = encoder.encode(self.laps, self.lap_count)
+        return state
 
-    def set_state(self, state: dict):
-        """Restore stopwatch state from persistence."""
-        self.elapsed = state.get("elapsed", 0)
-        self.running = state.get("running", False)
-        self.laps = state.get("laps", []).copy()
+
+class LapEncoder:
+    """
+    Base64 encoding of an append-only lap buffer, extended as laps are added.
+
+    Base64 turns every 3 bytes into 4 characters on their own, so once a
+    multiple of 3 laps (24 bytes) is encoded, that prefix never changes
+    while the buffer only grows. Each call encodes just the laps added
+    since the previous one, plus the at most 2 laps past the last whole
+    group. A different buffer, as after a reset, starts over.
+
+    An encoder is not thread-safe; give each thread its own.
+    """
+
+    def __init__(self):
+        self._laps: Optional[array] = None
+        # Laps whose encoding is in _prefix, always a multiple of 3
+        self._aligned = 0
+        self._prefix = bytearray()
+        self._count = 0
+        self._text = ""
+
+    def encode(self, laps: array, count: Optional[int] = None) -> str:
+        """
+        Encode the first ``count`` laps as :func:`encode_laps` does.
+
+        Args:
+            laps: Lap buffer, which must only have been appended to since
+                it was last passed in
+            count: Number of laps to encode, defaults to all of them
+
+        Returns:
+            Base64 of the laps as little-endian int64 values
+        """
+        if count is None:
+            count = len(laps)
+        if laps is self._laps and count == self._count:
+            return self._text
+        if laps is not self._laps or count < self._aligned:
+            self._laps = laps
+            self._aligned = 0
+            self._prefix = bytearray()
+        aligned = count - count % 3
+        if aligned > self._aligned:
+            self._prefix += _encode_chunk(laps[self._aligned : aligned])
+            self._aligned = aligned
+        tail = _encode_chunk(laps[aligned:count])
+        self._text = self._prefix.decode("ascii") + tail.decode("ascii")
+        self._count = count
+        return self._text
+
+
+def encode_laps(laps: array) -> str:
+    """Serialise a lap buffer as base64 of little-endian int64 values."""
+    return _encode_chunk(laps).decode("ascii")
+
+
+def _encode_chunk(laps: array) -> bytes:
+    """Base64 of laps as little-endian int64 values."""
+    if sys.byteorder == "big":
+        laps = array("q", laps)
+        laps.byteswap()
+    return base64.b64encode(laps.tobytes())
+
+
+def decode_laps(data: str) -> array:
+    """Load a lap buffer written by :func:`encode_laps`."""
+    laps = array("q")
+    laps.frombytes(base64.b64decode(data))
+    if sys.byteorder == "big":
+        laps.byteswap()
+    return laps
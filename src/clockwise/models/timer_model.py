@@ -1,32 +1,107 @@
 """Timer model for countdown functionality."""
 
+from typing import Optional
+
+from .clock import NS_PER_SECOND, SYSTEM_CLOCK, Clock
+
 
 class Timer:
-    """Countdown timer model."""
+    """
+    Countdown timer model.
 
-    def __init__(self, duration: int = 0, name: str = "Timer"):
+    Time is measured with the clock's ``monotonic_ns()`` instead of being
+    counted tick by tick. The timer keeps the time consumed by previous runs in
+    ``_offset_ns`` and the clock reading of the current run in
+    ``_started_ns``; ``remaining`` is derived from both when read, so a late
+    or skipped UI refresh never loses time.
+    """
+
+    def __init__(self, duration: int = 0, name: str = "Timer", clock: Optional[Clock] = None):
         """
         Initialize timer.
 
         Args:
             duration: Timer duration in seconds
             name: Name/label for the timer
+            clock: Clock to measure time with, defaults to the system clock
         """
+        self.clock = clock or SYSTEM_CLOCK
         self.duration = duration
         self.name = name
-        self.remaining = duration
-        self.running = False
         self.completed = False
+        self._offset_ns = 0
+        self._started_ns: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the timer is currently counting down."""
+        return self._started_ns is not None
+
+    @property
+    def duration_ns(self) -> int:
+        """Timer duration in nanoseconds."""
+        return int(self.duration * NS_PER_SECOND)
+
+    @property
+    def elapsed_ns(self) -> int:
+        """Time consumed so far in nanoseconds."""
+        if self._started_ns is None:
+            return self._offset_ns
+        return self._offset_ns + self.clock.monotonic_ns() - self._started_ns
+
+    @property
+    def remaining_ns(self) -> int:
+        """Time left in nanoseconds, never negative."""
+        return max(0, self.duration_ns - self.elapsed_ns)
+
+    @property
+    def deadline_ns(self) -> Optional[int]:
+        """Monotonic clock reading at which a running timer completes."""
+        if self._started_ns is None:
+            return None
+        return self._started_ns + self.duration_ns - self._offset_ns
+
+    @property
+    def remaining(self) -> int:
+        """Time left in whole seconds, rounded up like a countdown display."""
+        return -(-self.remaining_ns // NS_PER_SECOND)
+
+    @remaining.setter
+    def remaining(self, seconds: int):
+        self._offset_ns = max(0, self.duration_ns - int(seconds * NS_PER_SECOND))
+        if self._started_ns is not None:
+            self._started_ns = self.clock.monotonic_ns()
+
+    def next_change_ns(self) -> Optional[int]:
+        """
+        Get when the displayed remaining seconds next change.
+
+        Returns:
+            Monotonic clock reading in nanoseconds, or None while not running
+        """
+        if self._started_ns is None:
+            return None
+        now_ns = self.clock.monotonic_ns()
+        remaining_ns = max(0, self.duration_ns - self._offset_ns - (now_ns - self._started_ns))
+        if remaining_ns == 0:
+            return now_ns
+        return now_ns + (remaining_ns - 1) % NS_PER_SECOND + 1
 
     def start(self):
         """Start the timer."""
-        if self.remaining > 0:
-            self.running = True
+        if self.running:
+            return
+        if self.remaining_ns > 0:
+            self._started_ns = self.clock.monotonic_ns()
             self.completed = False
 
     def pause(self):
         """Pause the timer."""
-        self.running = False
+        if self._started_ns is None:
+            return
+        self._offset_ns += self.clock.monotonic_ns() - self._started_ns
+        self._started_ns = None
+        self._check_completed()
 
     def toggle(self):
         """Toggle between running and paused."""
@@ -37,17 +112,46 @@ class Timer:
 
     def reset(self):
         """Reset timer to initial duration."""
-        self.remaining = self.duration
-        self.running = False
+        self._offset_ns = 0
+        self._started_ns = None
         self.completed = False
 
-    def tick(self):
-        """Decrease remaining time by 1 second."""
-        if self.running and self.remaining > 0:
-            self.remaining -= 1
-            if self.remaining == 0:
-                self.running = False
-                self.completed = True
+    def update(self, now_ns: Optional[int] = None):
+        """
+        Mark the timer completed once its deadline has passed.
+
+        Args:
+            now_ns: Monotonic clock reading to check against, defaults to now
+        """
+        if self._started_ns is None:
+            return
+        if now_ns is None:
+            self._check_completed()
+        elif now_ns >= self.deadline_ns:
+            self._offset_ns = self.duration_ns
+            self._started_ns = None
+            self.completed = True
+
+    def tick(self, seconds: int = 1):
+        """
+        Advance a running timer without waiting for the clock.
+
+        The app no longer counts time by ticking; this is kept for callers
+        that drive the model by hand, such as tests and scripted sessions.
+
+        Args:
+            seconds: Seconds to skip ahead
+        """
+        if self.running:
+            self._offset_ns += seconds * NS_PER_SECOND
+            self._check_completed()
+
+    def _check_completed(self):
+        """Stop the timer and flag completion when no time is left."""
+        if self.remaining_ns == 0 and self.duration_ns > 0:
+            self._offset_ns = self.duration_ns
+            self._started_ns = None
+            self.completed = True
 
     def set_duration(self, duration: int, name: str = "Timer"):
         """
@@ -78,6 +182,7 @@ class Timer:
             "duration": self.duration,
             "name": self.name,
             "remaining": self.remaining,
+            "remaining_ns": self.remaining_ns,
             "running": self.running,
             "completed": self.completed,
         }
@@ -86,6 +191,10 @@ class Timer:
         """Restore timer state from persistence."""
         self.duration = state.get("duration", 0)
         self.name = state.get("name", "Timer")
+        self._started_ns = None
         self.remaining = state.get("remaining", self.duration)
-        self.running = state.get("running", False)
+        if "remaining_ns" in state:
+            self._offset_ns = max(0, self.duration_ns - state["remaining_ns"])
         self.completed = state.get("completed", False)
+        if state.get("running", False):
+            self._started_ns = self.clock.monotonic_ns()
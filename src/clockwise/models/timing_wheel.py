@@ -0,0 +1,196 @@
+"""Hierarchical timing wheel backend for TimerEngine."""
+
+import heapq
+from typing import Dict, Iterator, List, Optional
+
+from .clock import Clock
+from .engine import TimerEngine
+
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+
+class WheelTimerEngine(TimerEngine):
+    """
+    :class:`TimerEngine` that schedules deadlines on a hierarchical timing wheel.
+
+    Time is cut into ticks of ``resolution_ns``. Level 0 has one slot per
+    tick for the next 256 ticks, and every level above covers 256 slots of
+    the level below, so four levels at the default 10 ms resolution reach
+    roughly 497 days ahead. Anything further out waits in the deadline heap
+    of :class:`TimerEngine` and moves onto the wheel once it is within reach,
+    so even a single-level wheel only handles each timer a few times. Each slot
+    is a dict, which makes inserting and cancelling a timer O(1) regardless
+    of how many are pending. Entries further out are cascaded down a level
+    when the wheel below wraps, so every timer moves at most once per level
+    before it expires.
+
+    Deadlines are exact: a timer is only reported once its deadline has
+    passed, the resolution just bounds how many slots a poll walks.
+    """
+
+    def __init__(
+        self, resolution_ns: int = 10_000_000, levels: int = 4, clock: Optional[Clock] = None
+    ):
+        """
+        Initialize the wheel.
+
+        Args:
+            resolution_ns: Length of one tick in nanoseconds
+            levels: Number of wheel levels
+            clock: Clock for the engine and its timers, defaults to the
+                system clock
+
+        Raises:
+            ValueError: If the resolution or the number of levels is below 1
+        """
+        if resolution_ns < 1:
+            raise ValueError(f"Resolution must be at least 1 ns, got {resolution_ns}")
+        if levels < 1:
+            raise ValueError(f"A timing wheel needs at least one level, got {levels}")
+        super().__init__(clock)
+        self.resolution_ns = resolution_ns
+        self._wheels: List[List[Dict[int, int]]] = [
+            [{} for _ in range(SLOTS)] for _ in range(levels)
+        ]
+        # Ticks ahead of the current one the top level can hold
+        self._reach = SLOTS << (SLOT_BITS * (levels - 1))
+        self._counts = [0] * levels
+        self._slots: Dict[int, Dict[int, int]] = {}
+        self._levels: Dict[int, int] = {}
+        self._current = self.clock.monotonic_ns() // resolution_ns
+
+    def _schedule(self, timer_id: int, deadline_ns: int):
+        """Add a deadline for a timer."""
+        self._place(timer_id, deadline_ns)
+
+    def _unschedule(self, timer_id: int):
+        """Drop a timer's deadline, if it has one."""
+        slot = self._slots.pop(timer_id, None)
+        if slot is not None:
+            del slot[timer_id]
+            self._counts[self._levels.pop(timer_id)] -= 1
+        else:
+            super()._unschedule(timer_id)
+
+    def _place(self, timer_id: int, deadline_ns: int):
+        """Put a deadline in the slot matching its distance from now."""
+        tick = max(deadline_ns // self.resolution_ns, self._current)
+        delta = tick - self._current
+        if delta >= self._reach:
+            # Beyond the top level: wait in the heap until it is within reach.
+            super()._schedule(timer_id, deadline_ns)
+            return
+        top = len(self._wheels) - 1
+        level = 0
+        while level < top and delta >= SLOTS << (SLOT_BITS * level):
+            level += 1
+        shift = SLOT_BITS * level
+        slot = self._wheels[level][(tick >> shift) & SLOT_MASK]
+        slot[timer_id] = deadline_ns
+        self._slots[timer_id] = slot
+        self._levels[timer_id] = level
+        self._counts[level] += 1
+
+    def _cascade(self, level: int, tick: int):
+        """Move one slot of ``level`` down to the levels below."""
+        slot = self._wheels[level][(tick >> (SLOT_BITS * level)) & SLOT_MASK]
+        if not slot:
+            return
+        entries = list(slot.items())
+        slot.clear()
+        self._counts[level] -= len(entries)
+        for timer_id, deadline_ns in entries:
+            self._place(timer_id, deadline_ns)
+
+    def _place_within_reach(self):
+        """Move deadlines from the heap onto the wheel once the top level can hold them."""
+        horizon = (self._current + self._reach) * self.resolution_ns
+        while True:
+            deadline_ns = super()._peek()
+            if deadline_ns is None or deadline_ns >= horizon:
+                return
+            _, _, timer_id = heapq.heappop(self._heap)
+            del self._entries[timer_id]
+            self._place(timer_id, deadline_ns)
+
+    def _peek(self) -> Optional[int]:
+        """Get the earliest live deadline."""
+        best = None
+        current = self._current
+        for level, wheel in enumerate(self._wheels):
+            if not self._counts[level]:
+                continue
+            shift = SLOT_BITS * level
+            # Level 0 holds the next 256 ticks from the current one; higher
+            # levels hold entries one to 256 slots past the current slot.
+            first = 0 if level == 0 else 1
+            for offset in range(first, first + SLOTS):
+                slot_tick = ((current >> shift) + offset) << shift
+                if best is not None and max(slot_tick, current) * self.resolution_ns >= best:
+                    break
+                slot = wheel[(slot_tick >> shift) & SLOT_MASK]
+                if slot:
+                    earliest = min(slot.values())
+                    if best is None or earliest < best:
+                        best = earliest
+                    break
+        earliest = super()._peek()
+        if earliest is not None and (best is None or earliest < best):
+            best = earliest
+        return best
+
+    def _pop_due(self, now_ns: int) -> Iterator[int]:
+        """Remove and yield the timers due at ``now_ns``."""
+        tick = self._current
+        target = max(tick, now_ns // self.resolution_ns)
+        if not self._slots and not self._entries:
+            self._current = target
+            return
+        wheel = self._wheels[0]
+        levels = len(self._wheels)
+        while tick <= target:
+            self._current = tick
+            if self._entries:
+                self._place_within_reach()
+            if tick & SLOT_MASK == 0:
+                level = 1
+                while level < levels and (tick >> (SLOT_BITS * (level - 1))) & SLOT_MASK == 0:
+                    level += 1
+                for upper in range(level - 1, 0, -1):
+                    self._cascade(upper, tick)
+            slot = wheel[tick & SLOT_MASK]
+            if slot:
+                for timer_id, deadline_ns in list(slot.items()):
+                    if deadline_ns <= now_ns:
+                        del slot[timer_id]
+                        del self._slots[timer_id]
+                        del self._levels[timer_id]
+                        self._counts[0] -= 1
+                        yield timer_id
+            if tick == target:
+                break
+            if not self._slots and not self._entries:
+                self._current = target
+                break
+            tick = min(target, self._next_busy_tick(tick))
+
+    def _next_busy_tick(self, tick: int) -> int:
+        """Get the next tick that may expire or cascade anything."""
+        level = 0
+        while level < len(self._wheels) and not self._counts[level]:
+            level += 1
+        if level == len(self._wheels):
+            # Only the heap has deadlines: go to where the first comes within reach.
+            earliest = super()._peek()
+            return max(tick + 1, earliest // self.resolution_ns - self._reach + 1)
+        if level == 0:
+            wheel = self._wheels[0]
+            boundary = (tick | SLOT_MASK) + 1
+            for busy in range(tick + 1, boundary):
+                if wheel[busy & SLOT_MASK]:
+                    return busy
+            return boundary
+        shift = SLOT_BITS * level
+        return ((tick >> shift) + 1) << shift
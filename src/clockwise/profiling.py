@@ -0,0 +1,256 @@
+"""Opt-in whole-session CPU and memory profiling, and reports on the results."""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Seconds between memory snapshots taken while a session runs
+SNAPSHOT_INTERVAL = 300.0
+# Frames kept per traced allocation
+TRACE_FRAMES = 5
+REPORT_LIMIT = 15
+
+# Allocations made by the tracing and import machinery rather than the app
+IGNORED_FILES = (
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def baseline_file(path: Path) -> Path:
+    """Where the snapshot taken when a session starts is kept next to ``path``."""
+    return path.with_name(path.name + ".start")
+
+
+class MemorySampler:
+    """
+    Takes tracemalloc snapshots from a background thread.
+
+    Every ``interval`` seconds the current snapshot is written to
+    ``path``, replacing the previous one, so a session that is killed
+    still leaves recent evidence behind. A baseline (see
+    :func:`baseline_file`) is written as soon as tracing starts, so
+    comparing against it shows what the session allocated and still
+    holds, however short the session was. Snapshots are taken off the
+    event loop, which only pays for tracemalloc's bookkeeping on each
+    allocation.
+    """
+
+    def __init__(self, path: Path, interval: float = SNAPSHOT_INTERVAL):
+        """
+        Initialize the sampler; :meth:`start` begins tracing.
+
+        Args:
+            path: File the latest snapshot is written to
+            interval: Seconds between snapshots
+        """
+        self.path = Path(path)
+        self.interval = interval
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="clockwise-memory", daemon=True)
+
+    def start(self):
+        """
+        Start tracing allocations, write the baseline and start the snapshot thread.
+
+        Raises:
+            OSError: If the baseline cannot be written
+        """
+        import tracemalloc
+
+        tracemalloc.start(TRACE_FRAMES)
+        try:
+            _dump_snapshot(tracemalloc.take_snapshot(), baseline_file(self.path))
+        except OSError:
+            tracemalloc.stop()
+            raise
+        self._thread.start()
+
+    def stop(self):
+        """Stop the thread, write a final snapshot and stop tracing."""
+        import tracemalloc
+
+        self._stop.set()
+        self._thread.join()
+        try:
+            self.sample()
+        finally:
+            tracemalloc.stop()
+
+    def sample(self):
+        """Write the current snapshot."""
+        import tracemalloc
+
+        _dump_snapshot(tracemalloc.take_snapshot(), self.path)
+        self.samples += 1
+
+    def _run(self):
+        """Sample at the configured interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+@contextmanager
+def profiling(
+    profile_file: Optional[Path] = None,
+    memory_file: Optional[Path] = None,
+    interval: float = SNAPSHOT_INTERVAL,
+) -> Iterator[None]:
+    """
+    Profile the code run inside the ``with`` block.
+
+    Args:
+        profile_file: File to write cProfile statistics to, or None
+        memory_file: File to write tracemalloc snapshots to, or None
+        interval: Seconds between memory snapshots
+
+    Raises:
+        OSError: If a result file cannot be written
+    """
+    profiler = sampler = None
+    if memory_file is not None:
+        sampler = MemorySampler(memory_file, interval)
+        sampler.start()
+    if profile_file is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        try:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(str(profile_file))
+        finally:
+            if sampler is not None:
+                sampler.stop()
+
+
+def profile_report(path: Path, limit: int = REPORT_LIMIT) -> str:
+    """
+    Summarise a cProfile file by cumulative time.
+
+    Args:
+        path: File written by ``--profile``
+        limit: Number of functions to list
+
+    Returns:
+        A table of the functions with the most cumulative time
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a profile
+    """
+    import pstats
+
+    try:
+        stats = pstats.Stats(str(path))
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError(f"Not a profile: {path} ({e})") from e
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    lines = [
+        f"Top {min(limit, len(rows))} of {len(rows)} functions by cumulative time, "
+        f"{stats.total_tt:.3f}s total",
+        f"{'cumulative':>11} {'own':>9} {'calls':>9}  function",
+    ]
+    for (filename, line, name), (_, calls, own, cumulative, _) in rows[:limit]:
+        lines.append(
+            f"{cumulative:>10.3f}s {own:>8.3f}s {calls:>9}  {_location(filename, line, name)}"
+        )
+    return "\n".join(lines)
+
+
+def memory_report(path: Path, limit: int = REPORT_LIMIT) -> str:
+    """
+    Summarise a tracemalloc snapshot by allocation site.
+
+    Lists the lines holding the most memory and, if the session's
+    baseline snapshot is next to the file, the lines that grew the most
+    since the session started.
+
+    Args:
+        path: File written by ``--trace-memory``
+        limit: Number of allocation sites to list
+
+    Returns:
+        The report text
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a snapshot
+    """
+    path = Path(path)
+    snapshot = _load_snapshot(path)
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    lines = [f"Top {min(limit, len(stats))} allocators, {_size(total)} traced in total"]
+    lines += [_statistic(stat.size, stat.count, stat.traceback) for stat in stats[:limit]]
+
+    baseline = baseline_file(path)
+    if baseline.exists():
+        diffs = snapshot.compare_to(_load_snapshot(baseline), "lineno")
+        grown = [diff for diff in diffs if diff.size_diff > 0][:limit]
+        growth = sum(diff.size_diff for diff in diffs)
+        lines += ["", f"Top {len(grown)} growers since the session started, {_size(growth)} net"]
+        lines += [
+            _statistic(diff.size_diff, diff.count_diff, diff.traceback, diff=True) for diff in grown
+        ]
+    return "\n".join(lines)
+
+
+def _dump_snapshot(snapshot, path: Path):
+    """Write a filtered snapshot, replacing ``path`` atomically."""
+    import tracemalloc
+
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+        + [tracemalloc.Filter(False, name) for name in IGNORED_FILES]
+    )
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    snapshot.dump(str(tmp_path))
+    os.replace(tmp_path, path)
+
+
+def _load_snapshot(path: Path):
+    """Load a snapshot, reporting files that are not one as ValueError."""
+    import pickle
+    import tracemalloc
+
+    try:
+        snapshot = tracemalloc.Snapshot.load(str(path))
+    except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError) as e:
+        raise ValueError(f"Not a memory snapshot: {path} ({e})") from e
+    if not isinstance(snapshot, tracemalloc.Snapshot):
+        raise ValueError(f"Not a memory snapshot: {path}")
+    return snapshot
+
+
+def _statistic(size: int, count: int, traceback, diff: bool = False) -> str:
+    """Format one allocation site, or its growth if ``diff`` is set."""
+    frame = traceback[0]
+    if diff:
+        return f"{_size(size, True):>11} {count:>+9} blocks  {frame.filename}:{frame.lineno}"
+    return f"{_size(size):>11} {count:>9} blocks  {frame.filename}:{frame.lineno}"
+
+
+def _location(filename: str, line: int, name: str) -> str:
+    """Format a profiled function as file:line(name), or its name for builtins."""
+    if filename == "~":
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def _size(size: float, signed: bool = False) -> str:
+    """Format a byte count, with a leading + for growth if ``signed``."""
+    sign = "+" if signed and size > 0 else ""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
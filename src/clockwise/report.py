@@ -0,0 +1,70 @@
+"""Text reports over the session history."""
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from .utils.formatting import format_time_natural
+
+RELATIVE = re.compile(r"^(\d+)([dw])$")
+
+
+def parse_since(value: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse a ``--since`` value.
+
+    Accepts an ISO date ("2024-01-31"), "today", or a number of days or
+    weeks back ("7d", "4w").
+
+    Args:
+        value: The value to parse, or None for no lower bound
+        now: Reference time for relative values
+
+    Returns:
+        Start of the reporting period, or None
+
+    Raises:
+        ValueError: If the value is not in a supported format
+    """
+    if value is None:
+        return None
+    value = value.strip().lower()
+    now = now or datetime.now()
+    today = datetime(now.year, now.month, now.day)
+    if value == "today":
+        return today
+    match = RELATIVE.match(value)
+    if match:
+        count, unit = int(match.group(1)), match.group(2)
+        return today - timedelta(days=count * (7 if unit == "w" else 1))
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value!r} (use YYYY-MM-DD, today, 7d or 4w)") from None
+
+
+def format_report(rows: List[Dict[str, Any]], group_by: str) -> str:
+    """
+    Render report rows as an aligned text table.
+
+    Args:
+        rows: Rows returned by :meth:`HistoryStore.report`
+        group_by: The grouping the rows were built with
+
+    Returns:
+        The table, with a total line at the bottom
+    """
+    if not rows:
+        return "No sessions recorded"
+
+    header = {"preset": "Preset", "day": "Day", "week": "Week of"}[group_by]
+    width = max(len(header), *(len(row["bucket"]) for row in rows))
+    lines = [f"{header:<{width}}  {'Sessions':>8}  Total"]
+    for row in rows:
+        total = format_time_natural(int(row["duration"]))
+        lines.append(f"{row['bucket']:<{width}}  {row['sessions']:>8}  {total}")
+
+    sessions = sum(row["sessions"] for row in rows)
+    total = format_time_natural(int(sum(row["duration"] for row in rows)))
+    lines.append(f"{'Total':<{width}}  {sessions:>8}  {total}")
+    return "\n".join(lines)
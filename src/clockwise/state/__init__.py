@@ -1,3 +1,19 @@
-from .persistence import StatePersistence
+"""State persistence and history, loaded on first use."""
 
-__all__ = ["StatePersistence"]
+from .._lazy import lazy_exports
+
+_LAZY = {
+    "HistoryStore": ".history",
+    "SidecarReader": ".sidecar",
+    "StateJournal": ".journal",
+    "StatePersistence": ".persistence",
+    "StateSidecar": ".sidecar",
+    "StateWatcher": ".watch",
+    "StateWriter": ".writer",
+    "create_persistence": ".persistence",
+    "read_sidecar": ".sidecar",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY)
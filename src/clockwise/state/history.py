@@ -0,0 +1,465 @@
+"""SQLite-backed history of completed timer and stopwatch sessions."""
+
+import sqlite3
+import sys
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+Timestamp = Union[datetime, float, None]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT,
+    preset TEXT,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    laps BLOB
+);
+CREATE INDEX IF NOT EXISTS sessions_started_at ON sessions (started_at);
+CREATE INDEX IF NOT EXISTS sessions_preset ON sessions (preset, started_at);
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    day TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (day, kind, preset)
+);
+CREATE TABLE IF NOT EXISTS weekly_rollups (
+    week TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (week, kind, preset)
+);
+CREATE TABLE IF NOT EXISTS preset_rollups (
+    kind TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (kind, preset)
+);
+"""
+
+INSERT = """
+INSERT INTO sessions (kind, name, preset, started_at, ended_at, duration, laps)
+VALUES (:kind, :name, :preset, :started_at, :ended_at, :duration, :laps)
+"""
+
+UPSERT_ROLLUP = """
+INSERT INTO {table} VALUES (?, ?, ?, ?, ?)
+ON CONFLICT ({bucket}, kind, preset) DO UPDATE SET
+    sessions = sessions + excluded.sessions,
+    duration = duration + excluded.duration
+"""
+
+UPSERT_PRESET_ROLLUP = """
+INSERT INTO preset_rollups VALUES (?, ?, ?, ?)
+ON CONFLICT (kind, preset) DO UPDATE SET
+    sessions = sessions + excluded.sessions,
+    duration = duration + excluded.duration
+"""
+
+GROUP_BY = ("preset", "day", "week")
+
+
+class HistoryStore:
+    """
+    Records finished timer and stopwatch sessions in a SQLite database.
+
+    Each session is one row holding its kind ("timer" or "stopwatch"),
+    name, preset id, wall-clock start and end as Unix timestamps, active
+    duration in seconds and laps as packed nanoseconds. Rows are indexed
+    by start time and by preset, so totals over a time range scan only
+    the matching slice of history. The database runs in WAL mode so
+    readers such as reports never block the app recording a session.
+
+    Alongside the raw sessions the store keeps per-day and per-week
+    rollups of session count and duration for each kind and preset, and
+    all-time totals per kind and preset, updated in the same transaction
+    that records a session. Reports read only the rollups, so their cost
+    depends on the number of buckets, not on the number of sessions
+    behind them.
+    """
+
+    def __init__(self, db_file: Path):
+        """
+        Open (and create if needed) the history database.
+
+        Args:
+            db_file: Path of the SQLite database file
+        """
+        self.db_file = db_file
+        self._conn = sqlite3.connect(str(db_file))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+        if self._missing_rollups():
+            self.rebuild_rollups()
+
+    def record(self, session: Dict[str, Any]) -> int:
+        """
+        Record a single session.
+
+        Args:
+            session: Session with ``kind``, ``started_at``, ``ended_at`` and
+                ``duration``, and optionally ``name``, ``preset`` and ``laps``
+
+        Returns:
+            Row id of the new session
+        """
+        row = _row(session)
+        with self._conn:
+            row_id = self._conn.execute(INSERT, row).lastrowid
+            self._add_to_rollups([row])
+        return row_id
+
+    def record_many(self, sessions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Record several sessions in a single transaction.
+
+        Returns:
+            Number of sessions recorded
+        """
+        rows = [_row(session) for session in sessions]
+        with self._conn:
+            self._conn.executemany(INSERT, rows)
+            self._add_to_rollups(rows)
+        return len(rows)
+
+    def sessions(
+        self,
+        since: Timestamp = None,
+        until: Timestamp = None,
+        preset: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List sessions that started in ``[since, until)``, newest first.
+
+        Args:
+            since: Earliest start time, as a datetime or Unix timestamp
+            until: Start time to stop before
+            preset: Only sessions started from this preset
+            kind: Only "timer" or only "stopwatch" sessions
+            limit: Maximum number of sessions to return
+
+        Returns:
+            Session dicts; ``laps`` is an ``array('q')`` of nanoseconds
+        """
+        where, params = _filters(since, until, preset, kind)
+        query = f"SELECT * FROM sessions{where} ORDER BY started_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_session(row) for row in self._conn.execute(query, params)]
+
+    def total_duration(
+        self,
+        since: Timestamp = None,
+        until: Timestamp = None,
+        preset: Optional[str] = None,
+        kind: Optional[str] = None,
+    ) -> float:
+        """Total active seconds of the sessions matching the filters."""
+        where, params = _filters(since, until, preset, kind)
+        (total,) = self._conn.execute(
+            f"SELECT COALESCE(SUM(duration), 0) FROM sessions{where}", params
+        ).fetchone()
+        return total
+
+    def report(self, since: Timestamp = None, group_by: str = "preset") -> List[Dict[str, Any]]:
+        """
+        Summarise sessions from the rollup tables.
+
+        Args:
+            since: Only count sessions from this day on; week buckets start
+                at the week containing it. Without it, the preset grouping
+                reads one row per preset from the all-time totals.
+            group_by: "preset" for one row per kind and preset, "day" or
+                "week" for one row per calendar day or ISO week
+
+        Returns:
+            Rows with ``bucket``, ``kind`` and ``preset`` (preset grouping
+            only), ``sessions`` and ``duration`` in seconds, in bucket order
+
+        Raises:
+            ValueError: If ``group_by`` is not a known grouping
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Unknown grouping: {group_by!r}")
+
+        if group_by == "preset" and since is None:
+            return _preset_rows(
+                self._conn.execute(
+                    "SELECT kind, preset, sessions, duration FROM preset_rollups "
+                    "ORDER BY kind DESC, preset"
+                )
+            )
+
+        table, column = (
+            ("weekly_rollups", "week") if group_by == "week" else ("daily_rollups", "day")
+        )
+        where, params = "", []
+        if since is not None:
+            first = _day(since) if group_by != "week" else _week(since)
+            where, params = f" WHERE {column} >= ?", [first]
+
+        if group_by == "preset":
+            query = (
+                "SELECT kind, preset, SUM(sessions) AS sessions, SUM(duration) AS duration "
+                f"FROM {table}{where} GROUP BY kind, preset ORDER BY kind DESC, preset"
+            )
+            return _preset_rows(self._conn.execute(query, params))
+
+        query = (
+            f"SELECT {column} AS bucket, SUM(sessions) AS sessions, "
+            f"SUM(duration) AS duration FROM {table}{where} GROUP BY {column} ORDER BY {column}"
+        )
+        return [dict(row) for row in self._conn.execute(query, params)]
+
+    def rebuild_rollups(self):
+        """Recompute all rollups from the raw sessions in one streaming pass."""
+        daily: Dict[tuple, List[float]] = {}
+        weekly: Dict[tuple, List[float]] = {}
+        presets: Dict[tuple, List[float]] = {}
+        with self._conn:
+            self._conn.execute("DELETE FROM daily_rollups")
+            self._conn.execute("DELETE FROM weekly_rollups")
+            self._conn.execute("DELETE FROM preset_rollups")
+            cursor = self._conn.execute("SELECT kind, preset, started_at, duration FROM sessions")
+            for kind, preset, started_at, duration in cursor:
+                _accumulate(daily, weekly, presets, kind, preset, started_at, duration)
+            self._write_rollups(daily, weekly, presets)
+
+    def count(self) -> int:
+        """Number of recorded sessions."""
+        return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def _missing_rollups(self) -> bool:
+        """Whether sessions exist that were recorded before all rollups were kept."""
+        query = "SELECT EXISTS (SELECT 1 FROM {})"
+        (sessions,) = self._conn.execute(query.format("sessions")).fetchone()
+        if not sessions:
+            return False
+        for table in ("daily_rollups", "preset_rollups"):
+            (rollups,) = self._conn.execute(query.format(table)).fetchone()
+            if not rollups:
+                return True
+        return False
+
+    def _add_to_rollups(self, rows: List[Dict[str, Any]]):
+        """Fold newly inserted rows into the rollup tables."""
+        daily: Dict[tuple, List[float]] = {}
+        weekly: Dict[tuple, List[float]] = {}
+        presets: Dict[tuple, List[float]] = {}
+        for row in rows:
+            _accumulate(
+                daily,
+                weekly,
+                presets,
+                row["kind"],
+                row["preset"],
+                row["started_at"],
+                row["duration"],
+            )
+        self._write_rollups(daily, weekly, presets)
+
+    def _write_rollups(
+        self,
+        daily: Dict[tuple, List[float]],
+        weekly: Dict[tuple, List[float]],
+        presets: Dict[tuple, List[float]],
+    ):
+        """Add accumulated bucket totals to the rollup tables."""
+        for table, bucket, buckets in (
+            ("daily_rollups", "day", daily),
+            ("weekly_rollups", "week", weekly),
+        ):
+            self._conn.executemany(
+                UPSERT_ROLLUP.format(table=table, bucket=bucket),
+                (key + tuple(totals) for key, totals in buckets.items()),
+            )
+        self._conn.executemany(
+            UPSERT_PRESET_ROLLUP, (key + tuple(totals) for key, totals in presets.items())
+        )
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+def timer_session(
+    timer, preset: Optional[str] = None, started_at: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Describe a completed timer as a session to record.
+
+    Args:
+        timer: The completed :class:`~clockwise.models.timer_model.Timer`
+        preset: Id of the preset the timer was started from
+        started_at: Unix time the timer was first started, if known
+
+    Returns:
+        Session dict for :meth:`HistoryStore.record`, ending now by the
+        timer's clock
+    """
+    ended_at = timer.clock.time()
+    return {
+        "kind": "timer",
+        "name": timer.name,
+        "preset": preset,
+        "started_at": started_at or ended_at - timer.duration,
+        "ended_at": ended_at,
+        "duration": timer.duration,
+    }
+
+
+def stopwatch_session(stopwatch, started_at: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Describe a stopwatch run as a session to record.
+
+    Args:
+        stopwatch: The :class:`~clockwise.models.stopwatch_model.Stopwatch`
+            about to be reset
+        started_at: Unix time the stopwatch was first started, if known
+
+    Returns:
+        Session dict for :meth:`HistoryStore.record`, ending now by the
+        stopwatch's clock
+    """
+    ended_at = stopwatch.clock.time()
+    duration = stopwatch.elapsed_ns / 1_000_000_000
+    return {
+        "kind": "stopwatch",
+        "name": "Stopwatch",
+        "started_at": started_at or ended_at - duration,
+        "ended_at": ended_at,
+        "duration": duration,
+        "laps": stopwatch.laps,
+    }
+
+
+def _timestamp(value: Timestamp) -> Optional[float]:
+    """Convert a datetime to a Unix timestamp, passing numbers through."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def _day(value: Timestamp) -> str:
+    """Local calendar day of a timestamp, as an ISO date."""
+    if not isinstance(value, datetime):
+        value = datetime.fromtimestamp(value)
+    return value.date().isoformat()
+
+
+def _week(value: Timestamp) -> str:
+    """Monday of the local ISO week containing a timestamp, as an ISO date."""
+    if not isinstance(value, datetime):
+        value = datetime.fromtimestamp(value)
+    day = value.date()
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _accumulate(
+    daily: Dict[tuple, List[float]],
+    weekly: Dict[tuple, List[float]],
+    presets: Dict[tuple, List[float]],
+    kind: str,
+    preset: Optional[str],
+    started_at: float,
+    duration: float,
+):
+    """Add one session to per-day, per-week and all-time bucket totals."""
+    started = datetime.fromtimestamp(started_at)
+    preset = preset or ""
+    for buckets, key in (
+        (daily, (_day(started), kind, preset)),
+        (weekly, (_week(started), kind, preset)),
+        (presets, (kind, preset)),
+    ):
+        totals = buckets.setdefault(key, [0, 0.0])
+        totals[0] += 1
+        totals[1] += duration
+
+
+def _preset_rows(cursor: Iterable[sqlite3.Row]) -> List[Dict[str, Any]]:
+    """Report rows grouped by preset, labelled by preset or, without one, by kind."""
+    rows = []
+    for row in cursor:
+        row = dict(row)
+        row["preset"] = row["preset"] or None
+        row["bucket"] = row["preset"] or row["kind"]
+        rows.append(row)
+    return rows
+
+
+def _filters(
+    since: Timestamp, until: Timestamp, preset: Optional[str], kind: Optional[str]
+) -> tuple:
+    """Build a WHERE clause and its parameters from query filters."""
+    clauses = []
+    params: List[Any] = []
+    if preset is not None:
+        clauses.append("preset = ?")
+        params.append(preset)
+    if kind is not None:
+        clauses.append("kind = ?")
+        params.append(kind)
+    if since is not None:
+        clauses.append("started_at >= ?")
+        params.append(_timestamp(since))
+    if until is not None:
+        clauses.append("started_at < ?")
+        params.append(_timestamp(until))
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
+
+def _row(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a session dict to insert parameters."""
+    laps = session.get("laps")
+    return {
+        "kind": session["kind"],
+        "name": session.get("name"),
+        "preset": session.get("preset"),
+        "started_at": _timestamp(session["started_at"]),
+        "ended_at": _timestamp(session["ended_at"]),
+        "duration": session["duration"],
+        "laps": _pack_laps(laps) if laps else None,
+    }
+
+
+def _session(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a database row to a session dict."""
+    session = dict(row)
+    session["laps"] = _unpack_laps(session["laps"])
+    return session
+
+
+def _pack_laps(laps: Iterable[int]) -> bytes:
+    """Pack lap times in nanoseconds as little-endian int64."""
+    packed = array("q", laps)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_laps(data: Optional[bytes]) -> array:
+    """Unpack lap times written by :func:`_pack_laps`."""
+    laps = array("q")
+    if data:
+        laps.frombytes(data)
+        if sys.byteorder == "big":
+            laps.byteswap()
+    return laps
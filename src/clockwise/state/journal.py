@@ -0,0 +1,262 @@
+"""Append-only state journal with periodic compaction."""
+
+import base64
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.clock import Clock
+from .locking import bump_generation, file_lock
+from .persistence import StatePersistence, write_file
+
+COMPACT_BYTES = 256 * 1024
+
+
+class StateJournal(StatePersistence):
+    """
+    State persistence as a snapshot plus an append-only event log.
+
+    ``save_state`` compares the new state with the last one persisted and
+    appends one small record per model that changed (start, pause, lap,
+    reset, set_duration, ...). Laps are appended as just the new lap
+    values, so a save costs I/O proportional to what changed rather than
+    to the number of laps recorded.
+
+    Loading replays the journal on top of the snapshot. Once the journal
+    grows past ``compact_bytes`` the current state is written as a new
+    snapshot and the journal starts over. Every record carries a sequence
+    number and the snapshot stores the last one it includes, so records
+    left behind by a crash during compaction are not applied twice.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        durability: str = "rename",
+        compact_bytes: int = COMPACT_BYTES,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            state_file: Path of the JSON snapshot; the journal is written
+                next to it with a ``.journal`` suffix
+            durability: Crash safety of writes, see
+                :func:`~clockwise.state.persistence.write_file`
+            compact_bytes: Journal size that triggers compaction
+            clock: Clock that timestamps saves, defaults to the system clock
+        """
+        super().__init__(state_file, durability, clock)
+        self.journal_file = state_file.with_name(state_file.name + ".journal")
+        self.compact_bytes = compact_bytes
+        self._seq = 0
+        self._last: Optional[Dict[str, Any]] = None
+        self._last_laps = b""
+
+    def _write_state(
+        self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any], timestamp: str
+    ):
+        """
+        Append what changed since the last save to the journal.
+
+        The first save of a session, any save after another instance
+        wrote, and any save once the journal has outgrown
+        ``compact_bytes`` writes a full snapshot instead.
+        """
+        if self._last is None or self._journal_size() >= self.compact_bytes:
+            self._write_snapshot(timer_state, stopwatch_state, timestamp)
+        else:
+            self._append(self._diff(timer_state, stopwatch_state, timestamp))
+
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        """Load the snapshot and replay the journal on top of it."""
+        state = super()._read_state()
+        records = self._read_journal()
+        if state is None and not records:
+            return None
+
+        state = state or {}
+        seq = state.pop("journal_seq", 0)
+        stopwatch = state.get("stopwatch") or {}
+        laps = base64.b64decode(stopwatch.get("laps_ns", ""))
+        for record in records:
+            if record.get("seq", 0) <= seq:
+                continue
+            seq = record["seq"]
+            state["timestamp"] = record.get("timestamp")
+            if record["target"] == "timer":
+                state["timer"] = record["state"]
+                continue
+            stopwatch = record["state"]
+            if "laps_ns" in record:
+                laps = base64.b64decode(record["laps_ns"])
+            if "laps_append" in record:
+                laps += base64.b64decode(record["laps_append"])
+
+        if stopwatch:
+            stopwatch = dict(stopwatch, laps_ns=base64.b64encode(laps).decode("ascii"))
+            state["stopwatch"] = stopwatch
+        self._seq = max(self._seq, seq)
+        # Later saves diff against what is on disk, not what we last wrote
+        if state.get("timer") is not None and state.get("stopwatch") is not None:
+            self._remember(state["timer"], state["stopwatch"])
+        else:
+            self._last = None
+        return state
+
+    def compact(self):
+        """Fold the journal into a new snapshot."""
+        with self._sync, file_lock(self.lock_file):
+            current = self._read_signature() == self._signature
+            state = self._read_state()
+            if state is None:
+                return
+            write_file(
+                self.state_file,
+                json.dumps(dict(state, journal_seq=self._seq), indent=2),
+                self.durability,
+            )
+            self._truncate_journal()
+            bump_generation(self.lock_file)
+            if current:
+                # The state itself is unchanged; only its files were rewritten
+                self._signature = self._read_signature()
+
+    def clear_state(self):
+        """Clear the saved snapshot and journal."""
+        with self._sync, file_lock(self.lock_file):
+            super().clear_state()
+            self._truncate_journal()
+            self._last = None
+
+    def state_files(self) -> Tuple[Path, ...]:
+        """The snapshot and the journal."""
+        return (self.state_file, self.journal_file)
+
+    def _foreign_write(self):
+        """Start over from a snapshot; the journal's diff base is stale."""
+        self._last = None
+
+    def _write_snapshot(
+        self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any], timestamp: str
+    ):
+        """Write the full state as a snapshot and start a new journal."""
+        state = {
+            "timer": timer_state,
+            "stopwatch": stopwatch_state,
+            "timestamp": timestamp,
+            "journal_seq": self._seq,
+        }
+        write_file(self.state_file, json.dumps(state, indent=2), self.durability)
+        self._truncate_journal()
+        self._remember(timer_state, stopwatch_state)
+
+    def _diff(
+        self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any], timestamp: str
+    ) -> List[Dict[str, Any]]:
+        """Build journal records for the models that changed."""
+        records = []
+        last_timer = self._last["timer"]
+        if timer_state != last_timer:
+            records.append(
+                {
+                    "event": _timer_event(last_timer, timer_state),
+                    "target": "timer",
+                    "state": timer_state,
+                }
+            )
+
+        stopwatch = {k: v for k, v in stopwatch_state.items() if k != "laps_ns"}
+        last_stopwatch = self._last["stopwatch"]
+        record: Dict[str, Any] = {"target": "stopwatch", "state": stopwatch}
+        laps = base64.b64decode(stopwatch_state.get("laps_ns", ""))
+        if laps != self._last_laps:
+            if laps.startswith(self._last_laps):
+                record["event"] = "lap"
+                new_laps = laps[len(self._last_laps) :]
+                record["laps_append"] = base64.b64encode(new_laps).decode("ascii")
+            else:
+                record["event"] = "reset"
+                record["laps_ns"] = stopwatch_state.get("laps_ns", "")
+        elif stopwatch != last_stopwatch:
+            record["event"] = _stopwatch_event(last_stopwatch, stopwatch)
+        if "event" in record:
+            records.append(record)
+
+        for record in records:
+            self._seq += 1
+            record["seq"] = self._seq
+            record["timestamp"] = timestamp
+        self._remember(timer_state, stopwatch_state)
+        return records
+
+    def _remember(self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any]):
+        """Keep the persisted state to diff the next save against."""
+        self._last = {
+            "timer": timer_state,
+            "stopwatch": {k: v for k, v in stopwatch_state.items() if k != "laps_ns"},
+        }
+        self._last_laps = base64.b64decode(stopwatch_state.get("laps_ns", ""))
+
+    def _append(self, records: List[Dict[str, Any]]):
+        """Append records to the journal, one JSON object per line."""
+        if not records:
+            return
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self.journal_file, "a") as f:
+            f.write(data)
+            if self.durability == "fsync":
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """Read journal records, stopping at the first torn or corrupt line."""
+        records = []
+        try:
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            pass
+        return records
+
+    def _journal_size(self) -> int:
+        """Current journal size in bytes."""
+        try:
+            return self.journal_file.stat().st_size
+        except OSError:
+            return 0
+
+    def _truncate_journal(self):
+        """Start a new, empty journal."""
+        try:
+            self.journal_file.unlink()
+        except OSError:
+            pass
+
+
+def _timer_event(old: Dict[str, Any], new: Dict[str, Any]) -> str:
+    """Name the timer change between two states."""
+    if (old.get("duration"), old.get("name")) != (new.get("duration"), new.get("name")):
+        return "set_duration"
+    if new.get("completed") and not old.get("completed"):
+        return "complete"
+    if new.get("running") != old.get("running"):
+        return "start" if new.get("running") else "pause"
+    if new.get("remaining") == new.get("duration") and not new.get("running"):
+        return "reset"
+    return "progress"
+
+
+def _stopwatch_event(old: Dict[str, Any], new: Dict[str, Any]) -> str:
+    """Name the stopwatch change between two states, laps aside."""
+    if new.get("running") != old.get("running"):
+        return "start" if new.get("running") else "pause"
+    if not new.get("elapsed_ns", new.get("elapsed")):
+        return "reset"
+    return "progress"
@@ -0,0 +1,90 @@
+"""Advisory file locks shared by every process using the same state."""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+_held = threading.local()
+
+
+@contextmanager
+def file_lock(path: Path, exclusive: bool = True):
+    """
+    Hold an advisory ``flock`` on ``path`` for the duration of the block.
+
+    The lock lives on a dedicated file rather than on the state file
+    itself, because atomic writes replace the state file's inode and a
+    lock on the old inode would no longer exclude anyone. Where ``fcntl``
+    is unavailable, or the lock file cannot be created, the block runs
+    unlocked. Nested blocks on the same path in one thread reuse the
+    outer lock instead of deadlocking on it.
+
+    Args:
+        path: Lock file, created if missing
+        exclusive: Take an exclusive (write) lock instead of a shared one
+    """
+    held = _held.__dict__.setdefault("paths", set())
+    key = os.fspath(path)
+    if fcntl is None or key in held:
+        yield
+        return
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        yield
+        return
+    held.add(key)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        held.discard(key)
+        os.close(fd)
+
+
+def read_generation(path: Path) -> int:
+    """
+    Read the write counter kept in a lock file.
+
+    File times are too coarse, and inode numbers are reused too readily,
+    to tell every write apart, so writers bump this counter instead.
+
+    Args:
+        path: Lock file
+
+    Returns:
+        The counter, 0 if it was never bumped
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(8)
+    except OSError:
+        return 0
+    return int.from_bytes(data, "little") if len(data) == 8 else 0
+
+
+def bump_generation(path: Path) -> int:
+    """
+    Increment the write counter in a lock file.
+
+    The caller holds the exclusive lock.
+
+    Args:
+        path: Lock file
+
+    Returns:
+        The new counter
+    """
+    generation = read_generation(path) + 1
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, generation.to_bytes(8, "little"))
+    finally:
+        os.close(fd)
+    return generation
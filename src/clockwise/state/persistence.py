@@ -1,52 +1,209 @@
 """State persistence for Clockwise."""
 
 import json
+import os
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.clock import SYSTEM_CLOCK, Clock
+from .locking import bump_generation, file_lock, read_generation
+
+DURABILITY_MODES = ("none", "rename", "fsync")
+
+
+def write_file(path: Path, data: str, durability: str = "rename"):
+    """
+    Write a text file with the requested crash safety.
+
+    Args:
+        path: File to write
+        data: Complete new contents
+        durability: "none" truncates and rewrites the file in place;
+            "rename" writes a temporary file in the same directory and
+            atomically replaces ``path`` with it, so readers see either the
+            old or the new contents; "fsync" also flushes the file and its
+            directory to disk before returning
+
+    Raises:
+        ValueError: If the durability mode is unknown
+        OSError: If the file cannot be written
+    """
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"Unknown durability mode: {durability!r}")
+
+    if durability == "none":
+        with open(path, "w") as f:
+            f.write(data)
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+            if durability == "fsync":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durability == "fsync" and os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+# Fields that change just because a clock is running
+PROGRESS_FIELDS = frozenset({"remaining", "remaining_ns", "elapsed", "elapsed_ns"})
+
+
+def _controls(state: Dict[str, Any]) -> Dict[str, Any]:
+    """A model's state without the fields a running clock advances."""
+    return {key: value for key, value in state.items() if key not in PROGRESS_FIELDS}
+
+
+def merge_model_state(
+    base: Optional[Dict[str, Any]],
+    ours: Dict[str, Any],
+    theirs: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Three-way merge of one model's state shared between instances.
+
+    Args:
+        base: This instance's model state when it last synced with disk
+        ours: This instance's model state now
+        theirs: The model's state on disk
+
+    Returns:
+        ``theirs`` if only another instance changed the model (ours has at
+        most counted time since ``base``), otherwise ``ours``. When both
+        changed it, the last writer wins.
+    """
+    if base is None or theirs is None:
+        return ours
+    if _controls(ours) != _controls(base):
+        return ours
+    return theirs if _controls(theirs) != _controls(base) else ours
 
 
 class StatePersistence:
-    """Manages application state persistence."""
+    """
+    Manages application state persistence.
 
-    def __init__(self, state_file: Path):
+    Several Clockwise instances may share one state file. Reads take a
+    shared ``flock`` and writes an exclusive one, so nobody sees a write in
+    progress. Saves merge per model with :func:`merge_model_state`: a model
+    this instance has not changed keeps another instance's update instead
+    of overwriting it, and :meth:`reload` then hands that update back so
+    the caller can apply it.
+    """
+
+    def __init__(self, state_file: Path, durability: str = "rename", clock: Optional[Clock] = None):
+        """
+        Initialize state persistence.
+
+        Args:
+            state_file: Path of the JSON state file
+            durability: Crash safety of writes, see :func:`write_file`
+            clock: Clock that timestamps saves, defaults to the system clock
+
+        Raises:
+            ValueError: If the durability mode is unknown
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability!r}")
         self.state_file = state_file
+        self.durability = durability
+        self.clock = clock or SYSTEM_CLOCK
+        self.lock_file = state_file.with_name(state_file.name + ".lock")
+        self._sync = threading.RLock()
+        # Our models as of the last sync, and the models on disk since then
+        self._base: Dict[str, Optional[Dict[str, Any]]] = {"timer": None, "stopwatch": None}
+        self._disk: Dict[str, Optional[Dict[str, Any]]] = {"timer": None, "stopwatch": None}
+        self._signature: Optional[tuple] = None
+        self._stale = False
 
-    def save_state(self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any]):
-        """Save current application state."""
-        state = {
-            "timer": timer_state,
-            "stopwatch": stopwatch_state,
-            "timestamp": datetime.now().isoformat(),
-        }
+    def save_state(
+        self,
+        timer_state: Dict[str, Any],
+        stopwatch_state: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+    ):
+        """
+        Save current application state.
 
+        Args:
+            timer_state: Timer state from ``Timer.get_state``
+            stopwatch_state: Stopwatch state from ``Stopwatch.get_state``
+            timestamp: When the state was captured, defaults to now
+        """
+        timestamp = (timestamp or self.clock.now()).isoformat()
+        ours = {"timer": timer_state, "stopwatch": stopwatch_state}
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            with self._sync, file_lock(self.lock_file):
+                disk = self._disk
+                if self._signature is not None and self._read_signature() != self._signature:
+                    disk = self._read_state() or {}
+                    self._foreign_write()
+                merged = {}
+                for model, state in ours.items():
+                    merged[model] = merge_model_state(self._base[model], state, disk.get(model))
+                    if merged[model] is state:
+                        self._base[model] = state
+                    else:
+                        self._stale = True
+                self._write_state(merged["timer"], merged["stopwatch"], timestamp)
+                bump_generation(self.lock_file)
+                self._disk = merged
+                self._signature = self._read_signature()
         except Exception:
             # Silently fail - state persistence is not critical
             pass
 
     def load_state(self) -> Optional[Dict[str, Any]]:
         """Load saved application state."""
-        if not self.state_file.exists():
-            return None
-
-        try:
-            with open(self.state_file, "r") as f:
-                state = json.load(f)
+        with self._sync, file_lock(self.lock_file, exclusive=False):
+            state = self._read_state()
+            models = state or {}
+            self._base = {"timer": models.get("timer"), "stopwatch": models.get("stopwatch")}
+            self._disk = dict(self._base)
+            self._signature = self._read_signature()
+            self._stale = False
             return state
-        except Exception:
-            # If state is corrupted, return None
-            return None
+
+    def reload(self) -> Optional[Dict[str, Any]]:
+        """
+        Load state written by another instance.
+
+        Returns:
+            The saved state if another instance changed it since this one
+            last loaded it, otherwise None
+        """
+        with self._sync:
+            if not self._stale and self._read_signature() == self._signature:
+                return None
+            return self.load_state()
 
     def clear_state(self):
         """Clear saved state."""
-        if self.state_file.exists():
-            try:
-                self.state_file.unlink()
-            except Exception:
-                pass
+        with self._sync, file_lock(self.lock_file):
+            if self.state_file.exists():
+                try:
+                    self.state_file.unlink()
+                except Exception:
+                    pass
+            bump_generation(self.lock_file)
+            self._signature = None
 
     def get_timer_state(self) -> Optional[Dict[str, Any]]:
         """Get saved timer state."""
@@ -57,3 +214,70 @@ class StatePersistence:
         """Get saved stopwatch state."""
         state = self.load_state()
         return state.get("stopwatch") if state else None
+
+    def state_files(self) -> Tuple[Path, ...]:
+        """Files whose contents make up the saved state."""
+        return (self.state_file,)
+
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        """Read the state file; the caller holds the lock."""
+        if not self.state_file.exists():
+            return None
+
+        try:
+            with open(self.state_file, "r") as f:
+                state = json.load(f)
+            return state
+        except Exception:
+            # If state is corrupted, return None
+            return None
+
+    def _write_state(
+        self, timer_state: Dict[str, Any], stopwatch_state: Dict[str, Any], timestamp: str
+    ):
+        """Write the state file; the caller holds the lock."""
+        state = {
+            "timer": timer_state,
+            "stopwatch": stopwatch_state,
+            "timestamp": timestamp,
+        }
+        write_file(self.state_file, json.dumps(state, indent=2), self.durability)
+
+    def _foreign_write(self):
+        """Hook called when another instance wrote since the last sync."""
+
+    def _read_signature(self) -> tuple:
+        """Identity of the saved files, which changes with every write."""
+        signature = [read_generation(self.lock_file)]
+        for path in self.state_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+
+def create_persistence(
+    state_file: Path, settings: Dict[str, Any], clock: Optional[Clock] = None
+) -> StatePersistence:
+    """
+    Build the persistence backend selected by the settings.
+
+    Args:
+        state_file: Path of the JSON state file
+        settings: The ``[settings]`` table, read for ``state_mode`` and
+            ``state_durability``
+        clock: Clock that timestamps saves, defaults to the system clock
+
+    Returns:
+        A :class:`StatePersistence`, or a
+        :class:`~clockwise.state.journal.StateJournal` in journal mode
+    """
+    durability = settings.get("state_durability", "rename")
+    if settings.get("state_mode", "snapshot") == "journal":
+        from .journal import StateJournal
+
+        return StateJournal(state_file, durability, clock=clock)
+    return StatePersistence(state_file, durability, clock)
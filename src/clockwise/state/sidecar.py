@@ -0,0 +1,242 @@
+"""Memory-mapped binary state for readers that poll often."""
+
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+MAGIC = b"CWST"
+VERSION = 1
+NAME_BYTES = 64
+
+# magic, version, size of the whole file, seqlock counter
+HEADER = struct.Struct("<4sHHQ")
+SEQ = struct.Struct("<Q")
+SEQ_OFFSET = 8
+# updated_ns, timer flags, duration_ns, remaining_ns, name length, name,
+# stopwatch flags, lap count, elapsed_ns, last lap's elapsed_ns
+BODY = struct.Struct(f"<qIqqI{NAME_BYTES}sIIqq")
+SIZE = HEADER.size + BODY.size
+
+RUNNING = 1
+COMPLETED = 2
+READ_ATTEMPTS = 1000
+
+
+class StateSidecar:
+    """
+    Writes timer and stopwatch state into a fixed-layout shared file.
+
+    The file starts with a versioned header holding a seqlock counter,
+    followed by the fields in :data:`BODY`. The writer makes the counter
+    odd, updates the fields in place through ``mmap`` and makes it even
+    again, so an update costs a few memory stores and no system calls.
+    Times are stored as of ``updated_ns``, a ``time.monotonic_ns()``
+    reading that is shared by every process on the machine, so readers
+    can count on from there without the file being rewritten every
+    second.
+
+    Only one process writes at a time: the writer holds an exclusive
+    ``flock`` on the file, and an instance that cannot get it leaves the
+    sidecar to the one that has it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Map the sidecar, creating it if needed.
+
+        Args:
+            path: Sidecar file
+
+        Raises:
+            OSError: If the file cannot be created, mapped or locked
+        """
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if os.fstat(self._fd).st_size != SIZE:
+                os.ftruncate(self._fd, SIZE)
+            self._map = mmap.mmap(self._fd, SIZE, access=mmap.ACCESS_WRITE)
+        except OSError:
+            os.close(self._fd)
+            raise
+        magic, version, size, seq = HEADER.unpack_from(self._map, 0)
+        if (magic, version, size) != (MAGIC, VERSION, SIZE):
+            seq = 0
+        # Round up to even in case a previous writer died mid-update
+        self._seq = seq + (seq & 1)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, SIZE, self._seq)
+
+    def update(self, timer, stopwatch):
+        """
+        Publish the current state.
+
+        Args:
+            timer: The :class:`~clockwise.models.Timer`
+            stopwatch: The :class:`~clockwise.models.Stopwatch`
+        """
+        name = timer.name.encode("utf-8")[:NAME_BYTES]
+        laps = stopwatch.laps
+        self._seq += 1
+        SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+        BODY.pack_into(
+            self._map,
+            HEADER.size,
+            time.monotonic_ns(),
+            RUNNING * timer.running | COMPLETED * timer.completed,
+            timer.duration_ns,
+            timer.remaining_ns,
+            len(name),
+            name,
+            RUNNING * stopwatch.running,
+            len(laps),
+            stopwatch.elapsed_ns,
+            laps[-1] if laps else 0,
+        )
+        self._seq += 1
+        SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+
+    def close(self):
+        """Unmap the sidecar and give up the writer lock."""
+        self._map.close()
+        os.close(self._fd)
+
+
+class SidecarReader:
+    """
+    Reads a :class:`StateSidecar` without parsing or system calls.
+
+    The file is opened and mapped once; every :meth:`read` then copies
+    the fields straight out of shared memory, retrying while the writer
+    is midway through an update.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Map the sidecar for reading.
+
+        Args:
+            path: Sidecar file
+
+        Raises:
+            OSError: If the file does not exist or cannot be mapped
+            ValueError: If the file is not a sidecar of this version
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size, _ = HEADER.unpack_from(self._map, 0)
+        if (magic, version, size) != (MAGIC, VERSION, SIZE) or len(self._map) < SIZE:
+            self._map.close()
+            raise ValueError(f"Not a version {VERSION} state sidecar: {path}")
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """
+        Read a consistent snapshot of the state.
+
+        Running clocks are advanced to now, so the values are live even
+        while the writer is idle.
+
+        Returns:
+            Dict with ``timer`` and ``stopwatch`` states shaped like the
+            models' ``get_state``, or None if the writer kept the file
+            busy for too long (e.g. it died mid-update)
+        """
+        for _ in range(READ_ATTEMPTS):
+            (seq,) = SEQ.unpack_from(self._map, SEQ_OFFSET)
+            if seq & 1:
+                continue
+            fields = BODY.unpack_from(self._map, HEADER.size)
+            if SEQ.unpack_from(self._map, SEQ_OFFSET)[0] == seq:
+                return _state(fields, time.monotonic_ns())
+        return None
+
+    def close(self):
+        """Unmap the sidecar."""
+        self._map.close()
+
+    def __enter__(self) -> "SidecarReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_sidecar(path: Path) -> Optional[StateSidecar]:
+    """
+    Open a sidecar for writing if possible.
+
+    Args:
+        path: Sidecar file
+
+    Returns:
+        The sidecar, or None if it cannot be mapped or another instance
+        is already writing it
+    """
+    try:
+        return StateSidecar(path)
+    except OSError:
+        return None
+
+
+def read_sidecar(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a sidecar once.
+
+    Args:
+        path: Sidecar file
+
+    Returns:
+        State as returned by :meth:`SidecarReader.read`, or None if there
+        is no usable sidecar
+    """
+    try:
+        with SidecarReader(path) as reader:
+            return reader.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _state(fields: tuple, now_ns: int) -> Dict[str, Any]:
+    """Build model-shaped state from unpacked sidecar fields."""
+    (
+        updated_ns,
+        timer_flags,
+        duration_ns,
+        remaining_ns,
+        name_length,
+        name,
+        stopwatch_flags,
+        lap_count,
+        elapsed_ns,
+        last_lap_ns,
+    ) = fields
+    since_ns = max(0, now_ns - updated_ns)
+    if timer_flags & RUNNING:
+        remaining_ns = max(0, remaining_ns - since_ns)
+    if stopwatch_flags & RUNNING:
+        elapsed_ns += since_ns
+    return {
+        "timer": {
+            "name": name[:name_length].decode("utf-8", "ignore"),
+            "duration_ns": duration_ns,
+            "remaining_ns": remaining_ns,
+            "running": bool(timer_flags & RUNNING) and remaining_ns > 0,
+            "completed": bool(timer_flags & COMPLETED) or remaining_ns == 0 < duration_ns,
+        },
+        "stopwatch": {
+            "elapsed_ns": elapsed_ns,
+            "running": bool(stopwatch_flags & RUNNING),
+            "lap_count": lap_count,
+            "last_lap_ns": last_lap_ns,
+        },
+        "updated_ns": updated_ns,
+    }
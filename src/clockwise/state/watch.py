@@ -0,0 +1,168 @@
+"""Change notification for the shared state file."""
+
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify():
+    """Load the inotify functions from libc, or None where unavailable."""
+    if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class StateWatcher:
+    """
+    Calls back from a background thread when the state files change.
+
+    On Linux the watcher asks inotify about writes and renames in the
+    state directory, so it sleeps until another instance actually saves.
+    Elsewhere, or if inotify cannot be set up, it polls the files' stat
+    signature, starting at ``min_interval`` and backing off to
+    ``max_interval`` while nothing changes.
+
+    The callback runs on the watcher thread and also fires for this
+    instance's own writes; :meth:`StatePersistence.reload` tells the two
+    apart.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        callback: Callable[[], None],
+        min_interval: float = 0.25,
+        max_interval: float = 4.0,
+        use_inotify: bool = True,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Files to watch; they must share one directory
+            callback: Called with no arguments after a change
+            min_interval: Shortest polling interval in seconds
+            max_interval: Longest polling interval in seconds
+            use_inotify: Whether to try inotify before polling
+        """
+        self.paths = [Path(path) for path in paths]
+        self.callback = callback
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.use_inotify = use_inotify
+        self.backend: Optional[str] = None
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching in a daemon thread."""
+        fd = self._watch_inotify() if self.use_inotify else None
+        self.backend = "poll" if fd is None else "inotify"
+        target = self._poll if fd is None else self._read_events
+        self._thread = threading.Thread(
+            target=target, args=() if fd is None else (fd,), name="clockwise-watch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the thread to exit."""
+        self._stop.set()
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _watch_inotify(self) -> Optional[int]:
+        """Set up an inotify watch on the state directory."""
+        libc = _inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.fsencode(self.paths[0].parent)
+        if libc.inotify_add_watch(fd, directory, IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _read_events(self, fd: int):
+        """Wait for inotify events and call back for the watched names."""
+        names = {os.fsencode(path.name) for path in self.paths}
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd, self._wake_r], [], [])
+                if self._stop.is_set():
+                    return
+                if fd not in ready:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                if any(name in names for name in _event_names(data)):
+                    self.callback()
+        finally:
+            os.close(fd)
+
+    def _poll(self):
+        """Poll the files' stat signature with exponential backoff."""
+        interval = self.min_interval
+        last = self._signature()
+        while not self._stop.wait(interval):
+            current = self._signature()
+            if current != last:
+                last = current
+                interval = self.min_interval
+                self.callback()
+            else:
+                interval = min(interval * 2, self.max_interval)
+
+    def _signature(self) -> Tuple[Optional[Tuple[int, int, int]], ...]:
+        """Inode, size and modification time of each watched file."""
+        signature = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+
+def _event_names(data: bytes) -> Iterable[bytes]:
+    """File names in a buffer of ``struct inotify_event`` records."""
+    offset = 0
+    while offset + _EVENT.size <= len(data):
+        _, _, _, length = _EVENT.unpack_from(data, offset)
+        offset += _EVENT.size
+        yield data[offset : offset + length].rstrip(b"\0")
+        offset += length
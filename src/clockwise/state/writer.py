@@ -0,0 +1,133 @@
+"""Background writer that coalesces state saves."""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..models.stopwatch_model import LapEncoder, StopwatchSnapshot
+from .persistence import StatePersistence
+
+StopwatchState = Union[Dict[str, Any], StopwatchSnapshot]
+
+
+class StateWriter:
+    """
+    Saves state from a dedicated thread instead of the UI event loop.
+
+    ``submit`` only records the latest snapshot, and ignores one equal to
+    the snapshot submitted before it. The writer thread sleeps until a
+    snapshot arrives, waits ``interval`` seconds to coalesce any snapshots
+    submitted after it, then hands the newest one to
+    :class:`StatePersistence` if it differs from the last snapshot written.
+    An unchanged state is never rewritten and an idle writer never wakes.
+    ``flush`` and ``close`` write whatever is pending right away.
+
+    The stopwatch may be submitted as a
+    :class:`~clockwise.models.stopwatch_model.StopwatchSnapshot`, which
+    the caller takes in constant time; its laps are then encoded on the
+    writer thread, and only the laps added since the previous write.
+    """
+
+    def __init__(self, persistence: StatePersistence, interval: float = 5.0):
+        """
+        Start the writer thread.
+
+        Args:
+            persistence: Persistence backend that performs the writes
+            interval: Seconds between writes of pending state
+        """
+        self.persistence = persistence
+        self.interval = interval
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[Dict[str, Any], StopwatchState, datetime]] = None
+        self._last_submitted: Optional[Tuple[Dict[str, Any], StopwatchState]] = None
+        self._last_written: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        self._lap_encoder = LapEncoder()
+        self._flush_requests = 0
+        self._flushed = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="clockwise-state", daemon=True)
+        self._thread.start()
+
+    def submit(self, timer_state: Dict[str, Any], stopwatch_state: StopwatchState):
+        """
+        Queue a snapshot, replacing any snapshot not yet written.
+
+        Args:
+            timer_state: Timer state from ``Timer.get_state``
+            stopwatch_state: Stopwatch state from ``Stopwatch.get_state``,
+                or ``Stopwatch.snapshot`` to encode it on the writer thread
+        """
+        with self._condition:
+            if (timer_state, stopwatch_state) == self._last_submitted:
+                return
+            self._last_submitted = (timer_state, stopwatch_state)
+            first = self._pending is None
+            self._pending = (timer_state, stopwatch_state, self.persistence.clock.now())
+            if first:
+                self._condition.notify()
+
+    def flush(self):
+        """Write pending state now and wait until it is on disk."""
+        with self._condition:
+            if self._closed:
+                return
+            self._flush_requests += 1
+            request = self._flush_requests
+            self._condition.notify()
+            while self._flushed < request:
+                self._condition.wait()
+
+    def close(self):
+        """Write pending state and stop the writer thread."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        """Write pending snapshots at the configured cadence."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._interrupted():
+                    self._condition.wait()
+                deadline = time.monotonic() + self.interval
+                while not self._interrupted():
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                pending, self._pending = self._pending, None
+                requests = self._flush_requests
+                closed = self._closed
+
+            if pending is not None:
+                self._write(*pending)
+
+            with self._condition:
+                self._flushed = requests
+                self._condition.notify_all()
+            if closed:
+                return
+
+    def _interrupted(self) -> bool:
+        """Whether a flush or close is waiting on the writer."""
+        return self._closed or self._flushed < self._flush_requests
+
+    def _write(
+        self,
+        timer_state: Dict[str, Any],
+        stopwatch_state: StopwatchState,
+        timestamp: datetime,
+    ):
+        """Save a snapshot unless it matches the last one written."""
+        if isinstance(stopwatch_state, StopwatchSnapshot):
+            stopwatch_state = stopwatch_state.to_state(self._lap_encoder)
+        snapshot = (timer_state, stopwatch_state)
+        if snapshot == self._last_written:
+            return
+        self.persistence.save_state(timer_state, stopwatch_state, timestamp)
+        self._last_written = snapshot
@@ -0,0 +1,242 @@
+"""Fast ``clockwise status`` for shell prompts and status bars.
+
+tmux and shell prompts run this every few seconds, so it is dispatched by
+the entry point before click is imported and sticks to modules the
+interpreter has already loaded: no Textual, no platformdirs, and not even
+``json`` or ``typing``, whose import of ``re`` and ``enum`` alone costs
+more than the rest of the command.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from .utils.formatting import format_time
+
+try:
+    from _json import make_scanner
+except ImportError:  # pragma: no cover - interpreters without the C accelerator
+    make_scanner = None
+
+APP_NAME = "clockwise"
+NS_PER_SECOND = 1_000_000_000
+DEFAULT_FORMAT = "{name} {remaining}"
+FIELDS = (
+    "name",
+    "remaining",
+    "remaining_s",
+    "duration",
+    "progress",
+    "status",
+    "elapsed",
+    "elapsed_s",
+    "stopwatch",
+)
+USAGE = f"""Usage: clockwise status [--format FORMAT]
+
+  Print the current timer and stopwatch state.
+
+Options:
+  -f, --format TEXT  Output format  [default: {DEFAULT_FORMAT}]
+                     Fields: {", ".join("{" + field + "}" for field in FIELDS)}
+  --help             Show this message and exit.
+"""
+
+
+class _Decoder:
+    """Settings for the C JSON scanner, matching ``json.loads`` defaults."""
+
+    strict = True
+    object_hook = None
+    object_pairs_hook = None
+    parse_float = float
+    parse_int = int
+    parse_constant = {"NaN": float("nan"), "Infinity": float("inf")}.__getitem__
+
+
+def _loads(text: str) -> object:
+    """Parse a JSON document."""
+    if make_scanner is None:
+        import json
+
+        return json.loads(text)
+    text = text.strip()
+    value, end = make_scanner(_Decoder())(text, 0)
+    if end != len(text):
+        raise ValueError("Extra data")
+    return value
+
+
+def data_dir() -> str:
+    """
+    Locate the Clockwise data directory.
+
+    Mirrors ``platformdirs.user_data_dir("clockwise")`` for Linux, macOS
+    and Windows without importing platformdirs.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, APP_NAME, APP_NAME)
+    if sys.platform == "darwin":
+        return os.path.expanduser(f"~/Library/Application Support/{APP_NAME}")
+    base = os.environ.get("XDG_DATA_HOME", "").strip() or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_NAME)
+
+
+def state_file() -> str:
+    """Path of the saved state."""
+    return os.path.join(data_dir(), "state.json")
+
+
+def read_state(path: str) -> dict | None:
+    """
+    Read saved state, including changes still in the journal.
+
+    Only the newest timer and stopwatch journal records matter for
+    status, so just those two lines are parsed.
+
+    Args:
+        path: Path of the state snapshot
+
+    Returns:
+        State with ``timer``, ``stopwatch`` and ``timestamp``, or None
+    """
+    try:
+        with open(path, "r") as f:
+            state = _loads(f.read())
+    except (OSError, ValueError):
+        state = {}
+
+    try:
+        with open(path + ".journal", "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        lines = []
+    latest = {}
+    for line in lines:
+        if '"target":"timer"' in line:
+            latest["timer"] = line
+        elif '"target":"stopwatch"' in line:
+            latest["stopwatch"] = line
+    seq = state.get("journal_seq", 0)
+    for target, line in latest.items():
+        try:
+            record = _loads(line)
+        except ValueError:
+            continue
+        if record.get("seq", 0) > seq:
+            state[target] = record["state"]
+            state["timestamp"] = record["timestamp"]
+
+    return state or None
+
+
+def _parse_timestamp(text: str) -> float:
+    """Convert a naive ``datetime.isoformat()`` string to a Unix timestamp."""
+    date, _, clock = text.partition("T")
+    year, month, day = (int(part) for part in date.split("-"))
+    clock, _, fraction = clock.partition(".")
+    hour, minute, second = (int(part) for part in clock.split(":"))
+    seconds = time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
+    return seconds + (float("0." + fraction) if fraction else 0.0)
+
+
+def status_fields(state: dict, now: float | None = None) -> dict:
+    """
+    Compute display fields from saved state.
+
+    A running timer or stopwatch keeps counting from when the state was
+    saved, so the values are live even though the file is written only
+    every few seconds.
+
+    Args:
+        state: State as returned by :func:`read_state`
+        now: Unix timestamp to compute against, defaults to now
+
+    Returns:
+        Values for every name in ``FIELDS``
+    """
+    now = time.time() if now is None else now
+    since_save_ns = 0
+    if state.get("timestamp"):
+        since_save_ns = max(0, int((now - _parse_timestamp(state["timestamp"])) * NS_PER_SECOND))
+
+    timer = state.get("timer") or {}
+    duration = timer.get("duration", 0)
+    remaining_ns = timer.get("remaining_ns")
+    if remaining_ns is None:
+        remaining_ns = int(timer.get("remaining", duration) * NS_PER_SECOND)
+    if timer.get("running"):
+        remaining_ns = max(0, remaining_ns - since_save_ns)
+    # Whole seconds rounded up, as the app shows them
+    remaining = -(-remaining_ns // NS_PER_SECOND)
+    if timer.get("completed") or (timer.get("running") and remaining_ns == 0):
+        status = "done"
+    elif timer.get("running"):
+        status = "running"
+    elif remaining < duration:
+        status = "paused"
+    else:
+        status = "idle"
+
+    stopwatch = state.get("stopwatch") or {}
+    elapsed_ns = stopwatch.get("elapsed_ns", stopwatch.get("elapsed", 0) * NS_PER_SECOND)
+    elapsed = elapsed_ns // NS_PER_SECOND
+    if stopwatch.get("running"):
+        elapsed = (elapsed_ns + since_save_ns) // NS_PER_SECOND
+        stopwatch_status = "running"
+    else:
+        stopwatch_status = "paused" if elapsed_ns else "idle"
+
+    return {
+        "name": timer.get("name", "Timer"),
+        "remaining": format_time(remaining, show_hours=remaining >= 3600),
+        "remaining_s": remaining,
+        "duration": format_time(duration, show_hours=duration >= 3600),
+        "progress": int((duration - remaining) / duration * 100) if duration else 0,
+        "status": status,
+        "elapsed": format_time(elapsed, show_hours=elapsed >= 3600),
+        "elapsed_s": elapsed,
+        "stopwatch": stopwatch_status,
+    }
+
+
+def main(argv: list) -> int:
+    """
+    Run ``clockwise status``.
+
+    Args:
+        argv: Arguments after ``status``
+
+    Returns:
+        Exit status: 0 on success, 1 when no state is saved, 2 on bad usage
+    """
+    fmt = DEFAULT_FORMAT
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-f", "--format"):
+            fmt = next(args, None)
+            if fmt is None:
+                sys.stderr.write(f"Error: Option '{arg}' requires an argument.\n")
+                return 2
+        elif arg.startswith("--format="):
+            fmt = arg[len("--format=") :]
+        elif arg == "--help":
+            sys.stdout.write(USAGE)
+            return 0
+        else:
+            sys.stderr.write(f"{USAGE}\nError: No such option: {arg}\n")
+            return 2
+
+    state = read_state(state_file())
+    if state is None:
+        return 1
+    try:
+        line = fmt.format(**status_fields(state))
+    except (KeyError, IndexError, ValueError) as e:
+        sys.stderr.write(f"Error: Invalid format {fmt!r}: {e}\n")
+        return 2
+    sys.stdout.write(line + "\n")
+    return 0
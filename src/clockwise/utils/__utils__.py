@@ -1,3 +1,19 @@
-from .formatting import format_time, format_time_natural, parse_time_input
+from .formatting import (
+    DurationParseError,
+    format_time,
+    format_time_natural,
+    format_times,
+    format_times_natural,
+    parse_time_input,
+    parse_time_inputs,
+)
 
-__all__ = ["format_time", "format_time_natural", "parse_time_input"]
+__all__ = [
+    "DurationParseError",
+    "format_time",
+    "format_time_natural",
+    "format_times",
+    "format_times_natural",
+    "parse_time_input",
+    "parse_time_inputs",
+]
@@ -1,10 +1,44 @@
 """Utility functions for time formatting."""
 
+from __future__ import annotations
+
+import sys
+
+# "00" to "99", so clock fields are looked up instead of formatted
+_PAIRS = tuple(f"{i:02d}" for i in range(100))
+# Strings format_time and format_time_natural have built, per format;
+# each is cleared when it fills up
+FORMAT_CACHE_SIZE = 4096
+_clock_hms: dict = {}
+_clock_ms: dict = {}
+_natural: dict = {}
+
+
+def _pair(value: int) -> str:
+    """Zero-pad a clock field to two digits."""
+    return _PAIRS[value] if value < 100 else str(value)
+
+
+def _build_clock(seconds: int, show_hours: bool) -> str:
+    """Build an HH:MM:SS or MM:SS string."""
+    seconds = max(0, seconds)
+    if show_hours:
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
+        return _pair(hours) + ":" + _PAIRS[minutes] + ":" + _PAIRS[secs]
+    # Convert all time to minutes:seconds format
+    minutes, secs = divmod(seconds, 60)
+    return _pair(minutes) + ":" + _PAIRS[secs]
+
 
 def format_time(seconds: int, show_hours: bool = True) -> str:
     """
     Format seconds into HH:MM:SS or MM:SS format.
 
+    Results are cached, so the widgets redrawing the same values every
+    tick, and lap tables showing the same lap times, build each string
+    once.
+
     Args:
         seconds: Total seconds to format
         show_hours: Whether to show hours even if 0
@@ -12,95 +46,384 @@ def format_time(seconds: int, show_hours: bool = True) -> str:
     Returns:
         Formatted time string
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-
-    if show_hours:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    else:
-        # Convert all time to minutes:seconds format
-        total_minutes = seconds // 60
-        secs = seconds % 60
-        return f"{total_minutes:02d}:{secs:02d}"
+    cache = _clock_hms if show_hours else _clock_ms
+    text = cache.get(seconds)
+    if text is None:
+        if len(cache) >= FORMAT_CACHE_SIZE:
+            cache.clear()
+        text = cache[seconds] = _build_clock(int(seconds), show_hours)
+    return text
 
 
-def format_time_natural(seconds: int) -> str:
+def format_times(seconds, show_hours: bool = True) -> list:
     """
-    Format seconds into natural language (e.g., "5m 30s").
+    Format a sequence of seconds, e.g. a lap table or an export column.
+
+    Values go through the same cache as :func:`format_time`, without a
+    function call per value. A NumPy array is first reduced to its
+    distinct values, which are split into fields with vectorised
+    ``divmod`` and formatted once each. NumPy is never imported here,
+    only used if the caller passes one of its arrays.
 
     Args:
-        seconds: Total seconds to format
+        seconds: Iterable or NumPy array of total seconds
+        show_hours: Whether to show hours even if 0
 
     Returns:
-        Natural language time string
+        One formatted string per value, as :func:`format_time` formats it
     """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(seconds, numpy.ndarray):
+        return _format_array(numpy, seconds, _clock_fields, show_hours)
+
+    cache = _clock_hms if show_hours else _clock_ms
+    lookup = cache.get
+    results = []
+    append = results.append
+    for value in seconds:
+        text = lookup(value)
+        if text is None:
+            text = format_time(value, show_hours)
+        append(text)
+    return results
+
+
+def _clock_fields(numpy, values, show_hours: bool) -> list:
+    """Format non-negative integer seconds with vectorised field splitting."""
+    if show_hours:
+        hours, rest = numpy.divmod(values, 3600)
+        if len(values) and hours.max() >= 100:
+            return [_build_clock(value, True) for value in values.tolist()]
+        minutes, secs = numpy.divmod(rest, 60)
+        pairs = _PAIRS
+        return [
+            pairs[h] + ":" + pairs[m] + ":" + pairs[s]
+            for h, m, s in zip(hours.tolist(), minutes.tolist(), secs.tolist())
+        ]
+    minutes, secs = numpy.divmod(values, 60)
+    if len(values) and minutes.max() >= 100:
+        return [_build_clock(value, False) for value in values.tolist()]
+    pairs = _PAIRS
+    return [pairs[m] + ":" + pairs[s] for m, s in zip(minutes.tolist(), secs.tolist())]
+
+
+def _format_array(numpy, seconds, format_values, *args) -> list:
+    """Format each distinct value of a NumPy array once, then expand."""
+    values = numpy.maximum(seconds.astype(numpy.int64).ravel(), 0)
+    distinct, inverse = numpy.unique(values, return_inverse=True)
+    texts = numpy.array(format_values(numpy, distinct, *args), dtype=object)
+    return texts[inverse].tolist()
+
+
+def _build_natural(seconds) -> str:
+    """Build a natural language duration, keeping the milliseconds of fractional input."""
+    seconds, millis = divmod(round(seconds * 1000), 1000)
     if seconds == 0:
-        return "0s"
+        return f"{millis}ms" if millis else "0s"
 
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
 
     parts = []
     if hours > 0:
         parts.append(f"{hours}h")
     if minutes > 0:
         parts.append(f"{minutes}m")
-    if secs > 0 or not parts:
+    if millis:
+        parts.append(f"{secs}.{millis:03d}".rstrip("0") + "s")
+    elif secs > 0 or not parts:
         parts.append(f"{secs}s")
 
     return " ".join(parts)
 
 
-def parse_time_input(time_str: str) -> int:
+def format_time_natural(seconds: float) -> str:
+    """
+    Format seconds into natural language (e.g., "5m 30s").
+
+    Fractional durations keep their milliseconds ("1.5s", "500ms"), as
+    parsed from input like ``1.5s`` or ``500ms``.
+
+    Args:
+        seconds: Total seconds to format
+
+    Returns:
+        Natural language time string
+    """
+    text = _natural.get(seconds)
+    if text is None:
+        if len(_natural) >= FORMAT_CACHE_SIZE:
+            _natural.clear()
+        text = _natural[seconds] = _build_natural(seconds)
+    return text
+
+
+def format_times_natural(seconds) -> list:
+    """
+    Format a sequence of seconds in natural language.
+
+    Args:
+        seconds: Iterable or NumPy array of total seconds
+
+    Returns:
+        One string per value, as :func:`format_time_natural` formats it
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(seconds, numpy.ndarray):
+        return _format_array(numpy, seconds, _natural_values)
+
+    lookup = _natural.get
+    results = []
+    append = results.append
+    for value in seconds:
+        text = lookup(value)
+        if text is None:
+            text = format_time_natural(value)
+        append(text)
+    return results
+
+
+def _natural_values(numpy, values) -> list:
+    """Format distinct non-negative integer seconds in natural language."""
+    return [format_time_natural(value) for value in values.tolist()]
+
+
+class DurationParseError(ValueError):
+    """A time string that is not a valid duration."""
+
+    def __init__(self, text: str, position: int, reason: str):
+        """
+        Initialize the error.
+
+        Args:
+            text: The string that failed to parse
+            position: Index in ``text`` where parsing failed
+            reason: What was expected at ``position``
+        """
+        super().__init__(f"Invalid duration {text!r} at position {position}: {reason}")
+        self.text = text
+        self.position = position
+        self.reason = reason
+        # Set by parse_time_inputs to the failing item's index
+        self.index: int | None = None
+
+
+NS_PER_SECOND = 1_000_000_000
+UNIT_NS = {
+    "d": 86_400 * NS_PER_SECOND,
+    "h": 3_600 * NS_PER_SECOND,
+    "m": 60 * NS_PER_SECOND,
+    "s": NS_PER_SECOND,
+    "ms": 1_000_000,
+}
+_UNITS = tuple(UNIT_NS)
+_UNIT_SCALES = tuple(UNIT_NS.values())
+# Strings parse_time_input has seen; cleared when it fills up
+PARSE_CACHE_SIZE = 4096
+_parsed: dict = {}
+_NUMBER = r"(\d+(?:\.\d*)?|\.\d+)"
+_CLOCK = r"(?:(?:(\d+):)?(\d+):)?(\d+)(\.\d*)?\s*"
+_grammar = None
+_compact = None
+_clock = None
+_token = None
+_lead = None
+
+
+def _compile():
+    """Compile the duration grammar on first use."""
+    global _grammar, _compact, _clock, _token, _lead
+    # re is imported here, not at module level: ``clockwise status``
+    # imports this module and cannot afford re's import time
+    import re
+
+    units = "".join(rf"(?:{_NUMBER}\s*{unit}\s*)?" for unit in ("d", "h", "m(?!s)", "s", "ms"))
+    _grammar = re.compile(rf"\s*(?:{units}|{_CLOCK})", re.ASCII | re.IGNORECASE)
+    # The forms people usually type, each matched without backtracking
+    # through the optional spaces, decimals and cases of the full grammar
+    _compact = re.compile(
+        r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m(?!s))?(?:(\d+)s)?(?:(\d+)ms)?", re.ASCII
+    )
+    _clock = re.compile(rf"\s*{_CLOCK}", re.ASCII)
+    _token = re.compile(rf"\s*{_NUMBER}\s*(ms|d|h|m|s)\s*", re.ASCII | re.IGNORECASE)
+    _lead = re.compile(rf"\s*{_NUMBER}\s*", re.ASCII)
+
+
+def _number_ns(number: str, unit_ns: int) -> int:
+    """Convert a decimal number of units to nanoseconds without float error."""
+    whole, _, fraction = number.partition(".")
+    total = int(whole or 0) * unit_ns
+    if fraction:
+        total += int(fraction) * unit_ns // 10 ** len(fraction)
+    return total
+
+
+def _syntax_error(text: str) -> DurationParseError:
+    """Locate where ``text`` departs from the duration grammar."""
+    position = len(text) - len(text.lstrip())
+    if position == len(text):
+        return DurationParseError(text, position, "expected a duration")
+
+    if ":" in text:
+        colons = [index for index, char in enumerate(text) if char == ":"]
+        if len(colons) > 2:
+            return DurationParseError(text, colons[2], "too many ':'")
+        fields = text.strip().split(":")
+        for index, field in enumerate(fields):
+            last = index == len(fields) - 1
+            whole = field.partition(".")[0] if last else field
+            if not (whole.isascii() and whole.isdigit()):
+                return DurationParseError(text, position, "expected a whole number")
+            position += len(whole)
+            if last and whole != field and not field[len(whole) + 1 :].isdigit():
+                return DurationParseError(text, position + 1, "expected fractional seconds")
+            position += 1
+        return DurationParseError(text, 0, "expected [[H:]M:]S[.fff]")
+
+    seen = -1
+    while position < len(text):
+        match = _token.match(text, position)
+        if match is None:
+            number = _lead.match(text, position)
+            if number is None:
+                position += len(text[position:]) - len(text[position:].lstrip())
+                return DurationParseError(text, position, "expected a number")
+            return DurationParseError(text, number.end(), "expected a unit: d, h, m, s or ms")
+        unit = _UNITS.index(match.group(2).lower())
+        if unit <= seen:
+            return DurationParseError(
+                text, match.start(2), "units must appear once each, largest first"
+            )
+        seen = unit
+        position = match.end()
+    return DurationParseError(text, 0, "expected a duration")
+
+
+def parse_time_input(time_str: str) -> int | float:
     """
     Parse time input string into seconds.
-    Supports formats: "25m", "1h30m", "90", "1:30:00"
+
+    Accepts units ("25m", "1h30m", "1d2h", "1.5h", "90s", "250ms") or a
+    clock ("90", "1:30", "1:30:00.250"). Units may be separated by spaces,
+    must appear largest first, and letters are case insensitive.
 
     Args:
         time_str: Time string to parse
 
     Returns:
-        Total seconds
+        Total seconds, an int when whole and a float otherwise
 
     Raises:
-        ValueError: If format is invalid
+        DurationParseError: If the string is not a valid duration; its
+            ``position`` says where parsing failed
     """
-    time_str = time_str.strip().lower()
-
-    # Check for natural format (25m, 1h30m, etc.)
-    if any(unit in time_str for unit in ["h", "m", "s"]):
-        total_seconds = 0
-        current_num = ""
-
-        for char in time_str:
-            if char.isdigit():
-                current_num += char
-            elif char in "hms":
-                if current_num:
-                    num = int(current_num)
-                    if char == "h":
-                        total_seconds += num * 3600
-                    elif char == "m":
-                        total_seconds += num * 60
-                    elif char == "s":
-                        total_seconds += num
-                    current_num = ""
-
-        return total_seconds
-
-    # Check for colon format (HH:MM:SS or MM:SS)
+    seconds = _parsed.get(time_str)
+    if seconds is None:
+        if len(_parsed) >= PARSE_CACHE_SIZE:
+            _parsed.clear()
+        seconds = _parsed[time_str] = _parse(time_str)
+    return seconds
+
+
+def _parse(time_str: str) -> int | float:
+    """Parse a time string with the compiled grammar."""
+    if time_str.isdigit() and time_str.isascii():
+        return int(time_str)
+    if _grammar is None:
+        _compile()
+
     if ":" in time_str:
-        parts = time_str.split(":")
-        if len(parts) == 2:
-            minutes, seconds = map(int, parts)
-            return minutes * 60 + seconds
-        elif len(parts) == 3:
-            hours, minutes, seconds = map(int, parts)
-            return hours * 3600 + minutes * 60 + seconds
-        else:
-            raise ValueError("Invalid time format")
-
-    # Just a number, assume seconds
-    return int(time_str)
+        match = _clock.fullmatch(time_str)
+        if match is None:
+            raise _syntax_error(time_str)
+        return _clock_seconds(time_str, match, 1)
+
+    match = _compact.fullmatch(time_str)
+    if match is not None and match.lastindex is not None:
+        days, hours, minutes, seconds, millis = match.groups()
+        total = int(days) * 24 if days is not None else 0
+        if hours is not None:
+            total += int(hours)
+        total *= 60
+        if minutes is not None:
+            total += int(minutes)
+        total *= 60
+        if seconds is not None:
+            total += int(seconds)
+        if millis is None:
+            return total
+        return _whole_or_float(total * NS_PER_SECOND + int(millis) * UNIT_NS["ms"])
+
+    match = _grammar.fullmatch(time_str)
+    if match is None:
+        raise _syntax_error(time_str)
+    if match.group(8) is not None:
+        return _clock_seconds(time_str, match, 6)
+
+    total_ns = 0
+    matched = False
+    for number, unit_ns in zip(match.groups()[:5], _UNIT_SCALES):
+        if number is not None:
+            if "." in number:
+                total_ns += _number_ns(number, unit_ns)
+            else:
+                total_ns += int(number) * unit_ns
+            matched = True
+    if not matched:
+        raise _syntax_error(time_str)
+    return _whole_or_float(total_ns)
+
+
+def _clock_seconds(time_str: str, match, group: int) -> int | float:
+    """Convert a matched [[H:]M:]S[.fff] clock whose hours are group ``group``."""
+    hours, minutes, seconds, fraction = match.group(group, group + 1, group + 2, group + 3)
+    if minutes is not None and int(seconds) >= 60:
+        raise DurationParseError(time_str, match.start(group + 2), "seconds must be below 60")
+    if hours is not None and int(minutes) >= 60:
+        raise DurationParseError(time_str, match.start(group + 1), "minutes must be below 60")
+    total = (int(hours or 0) * 60 + int(minutes or 0)) * 60 + int(seconds)
+    if not fraction or fraction == ".":
+        return total
+    return _whole_or_float(total * NS_PER_SECOND + _number_ns("0" + fraction, NS_PER_SECOND))
+
+
+def _whole_or_float(total_ns: int) -> int | float:
+    """Seconds in ``total_ns``, an int when whole and a float otherwise."""
+    if total_ns % NS_PER_SECOND:
+        return total_ns / NS_PER_SECOND
+    return total_ns // NS_PER_SECOND
+
+
+def parse_time_inputs(time_strs) -> list:
+    """
+    Parse many time strings, e.g. a column imported from a spreadsheet.
+
+    Bulk data repeats the same few values, so each distinct string is
+    parsed once and later occurrences are looked up in a memo local to
+    the call, which unlike :func:`parse_time_input`'s cache is not
+    bounded and costs no function call per row.
+
+    Args:
+        time_strs: Iterable of time strings
+
+    Returns:
+        Seconds for each string, as :func:`parse_time_input` returns them
+
+    Raises:
+        DurationParseError: For the first invalid string; its ``index``
+            is the string's position in ``time_strs``
+    """
+    parsed = {}
+    lookup = parsed.get
+    results = []
+    append = results.append
+    for time_str in time_strs:
+        seconds = lookup(time_str)
+        if seconds is None:
+            try:
+                seconds = parsed[time_str] = _parse(time_str)
+            except DurationParseError as e:
+                e.index = len(results)
+                raise
+        append(seconds)
+    return results
@@ -1,5 +1,16 @@
-from .timer import TimerWidget
-from .stopwatch import StopwatchWidget
-from .preset_manager import PresetListScreen, NewTimerScreen
+"""Textual widgets for Clockwise, loaded on first use."""
 
-__all__ = ["TimerWidget", "StopwatchWidget", "PresetListScreen", "NewTimerScreen"]
+from .._lazy import lazy_exports
+
+_LAZY = {
+    "TimerWidget": ".timer",
+    "StopwatchWidget": ".stopwatch",
+    "LapList": ".lap_list",
+    "MetricsOverlay": ".metrics_overlay",
+    "PresetListScreen": ".preset_manager",
+    "NewTimerScreen": ".preset_manager",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY)
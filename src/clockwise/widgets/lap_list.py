@@ -0,0 +1,78 @@
+"""Virtualized lap list for the stopwatch widget."""
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ..models.stopwatch_model import Stopwatch
+from ..models.timer_model import NS_PER_SECOND
+from ..utils.formatting import format_time
+
+
+class LapList(ScrollView):
+    """
+    Scrollable list of stopwatch laps.
+
+    Rows are never built up front: the list only tracks how many laps the
+    stopwatch holds and formats the handful of rows that are on screen when
+    they are painted. Syncing on every tick is a length comparison, so the
+    cost stays the same with ten laps or a hundred thousand.
+    """
+
+    DEFAULT_CSS = """
+    LapList {
+        height: auto;
+        max-height: 8;
+        scrollbar-size-vertical: 1;
+    }
+    """
+
+    def __init__(self, stopwatch: Stopwatch, **kwargs):
+        super().__init__(**kwargs)
+        self.stopwatch = stopwatch
+        self.lap_count = 0
+        self.virtual_size = Size(0, 1)
+        self._laps = stopwatch.laps
+
+    def sync(self):
+        """Pick up laps added or cleared since the last sync."""
+        laps = self.stopwatch.laps
+        count = len(laps)
+        if count == self.lap_count and laps is self._laps:
+            return
+        grew = count > self.lap_count
+        self.lap_count = count
+        self._laps = laps
+        self.virtual_size = Size(0, max(count, 1))
+        self.refresh()
+        if grew:
+            self.scroll_end(animate=False)
+
+    def format_lap(self, index: int) -> str:
+        """Format the lap at ``index`` (0-based) as a display row."""
+        laps = self.stopwatch.laps
+        lap_ns = laps[index]
+        duration_ns = lap_ns - laps[index - 1] if index else lap_ns
+        time_str = format_time(lap_ns // NS_PER_SECOND, show_hours=False)
+        duration_str = format_time(duration_ns // NS_PER_SECOND, show_hours=False)
+        return f"Lap {index + 1}: {time_str} (+{duration_str})"
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row."""
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        style = self.rich_style
+        width = self.scrollable_content_region.width
+
+        if not self.lap_count:
+            segment = Segment("No laps recorded", style + Style(dim=True)) if index == 0 else None
+        elif index < self.lap_count:
+            segment = Segment(self.format_lap(index), style)
+        else:
+            segment = None
+
+        if segment is None:
+            return Strip.blank(width, style)
+        return Strip([segment]).crop(scroll_x).adjust_cell_length(width, style)
@@ -0,0 +1,36 @@
+"""Debug overlay showing per-tick latency and drift."""
+
+from textual.widgets import Static
+
+from ..metrics import TickMetrics
+
+
+class MetricsOverlay(Static):
+    """Table of p50, p99 and max for each of the app's tick histograms."""
+
+    DEFAULT_CSS = """
+    MetricsOverlay {
+        dock: bottom;
+        width: auto;
+        height: auto;
+        margin-bottom: 1;
+        padding: 0 1;
+        background: $panel;
+        border: solid $accent;
+        color: $text;
+    }
+    """
+
+    def __init__(self, metrics: TickMetrics, **kwargs):
+        """
+        Initialize the overlay.
+
+        Args:
+            metrics: Histograms to show
+        """
+        super().__init__(metrics.format(), **kwargs)
+        self.metrics = metrics
+
+    def refresh_metrics(self):
+        """Redraw the table from the current histograms."""
+        self.update(self.metrics.format())
@@ -80,7 +80,7 @@ class PresetListScreen(ModalScreen):
         if event.button.id == "close-button":
             self.dismiss(None)
         elif event.button.id and event.button.id.startswith("preset-"):
-            preset_data = event.button.preset_data
+            preset_data = dict(event.button.preset_data, id=event.button.preset_id)
             self.dismiss(preset_data)
 
 
@@ -183,5 +183,5 @@ class NewTimerScreen(ModalScreen):
                     return
 
                 self.dismiss({"name": name, "duration": duration})
-            except ValueError:
-                self.notify("Invalid duration format", severity="error")
+            except ValueError as e:
+                self.notify(str(e), severity="error")
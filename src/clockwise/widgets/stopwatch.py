@@ -1,12 +1,13 @@
 """Stopwatch widget for Textual UI."""
 
 from textual.app import ComposeResult
-from textual.containers import Container, Vertical, VerticalScroll
+from textual.containers import Container, Vertical
 from textual.widgets import Static
-from textual.reactive import reactive
+from textual.reactive import var
 
 from ..models.stopwatch_model import Stopwatch
 from ..utils.formatting import format_time
+from .lap_list import LapList
 
 
 class StopwatchWidget(Container):
@@ -64,88 +65,89 @@ class StopwatchWidget(Container):
         color: $accent;
     }
 
+    StopwatchWidget #laps-list {
+        max-height: 5;
+    }
+
     StopwatchWidget .lap-entry {
         color: $text;
     }
     """
 
-    elapsed_time = reactive(0)
-    is_running = reactive(False)
-    lap_count = reactive(0)
+    elapsed_time = var(0)
+    is_running = var(False)
+    lap_count = var(0)
 
     def __init__(self, stopwatch: Stopwatch, **kwargs):
         super().__init__(**kwargs)
         self.stopwatch = stopwatch
         self.can_focus = True
+        self._rendered = {}
 
     def compose(self) -> ComposeResult:
         """Compose the stopwatch widget."""
         yield Static("⏱️  STOPWATCH", id="stopwatch-title")
+        self._display = Static(id="stopwatch-display")
+        self._current_lap_display = Static(id="stopwatch-current-lap")
+        self._status = Static(id="stopwatch-status")
+        self._laps_list = LapList(self.stopwatch, id="laps-list")
         with Vertical():
-            yield Static(id="stopwatch-display")
-            yield Static(id="stopwatch-current-lap")
-            yield Static(id="stopwatch-status")
-            with VerticalScroll(id="laps-container"):
+            yield self._display
+            yield self._current_lap_display
+            yield self._status
+            with Vertical(id="laps-container"):
                 yield Static("📊 Laps", id="laps-title")
-                yield Static(id="laps-list")
+                yield self._laps_list
 
     def on_mount(self) -> None:
         """Set up the widget when mounted."""
         self.update_display()
 
+    def _changed(self, field: str, value) -> bool:
+        """Remember ``value`` as rendered for ``field``; True if it is new."""
+        if field in self._rendered and self._rendered[field] == value:
+            return False
+        self._rendered[field] = value
+        return True
+
     def update_display(self):
-        """Update the display with current stopwatch state."""
-        self.elapsed_time = self.stopwatch.elapsed
-        self.is_running = self.stopwatch.running
+        """Update the display, pushing only the parts that changed."""
+        elapsed = self.stopwatch.elapsed
+        running = self.stopwatch.running
+        self.elapsed_time = elapsed
+        self.is_running = running
         self.lap_count = len(self.stopwatch.laps)
 
         # Update main display
-        display = self.query_one("#stopwatch-display", Static)
-        time_str = format_time(self.stopwatch.elapsed, show_hours=True)
-        color = "#00ff00" if self.stopwatch.running else "#888888"
-        display.update(f"[bold {color}]{time_str}[/]")
+        time_str = format_time(elapsed, show_hours=True)
+        color = "#00ff00" if running else "#888888"
+        text = f"[bold {color}]{time_str}[/]"
+        if self._changed("display", text):
+            self._display.update(text)
 
         # Update current lap time
-        current_lap_display = self.query_one("#stopwatch-current-lap", Static)
         current_lap_time = self.stopwatch.get_current_lap_time()
-        current_lap_display.update(
-            f"Current Lap: {format_time(current_lap_time, show_hours=False)}"
-        )
+        text = f"Current Lap: {format_time(current_lap_time, show_hours=False)}"
+        if self._changed("current_lap", text):
+            self._current_lap_display.update(text)
 
         # Update status
-        status = self.query_one("#stopwatch-status", Static)
-        if self.stopwatch.running:
-            status.update("▶️  Running - Press SPACE to pause, 'l' for lap")
-        elif self.stopwatch.elapsed > 0:
-            status.update("⏸️  Paused - Press SPACE to resume")
+        if running:
+            status = "▶️  Running - Press SPACE to pause, 'l' for lap"
+        elif elapsed > 0:
+            status = "⏸️  Paused - Press SPACE to resume"
         else:
-            status.update("Press SPACE to start")
+            status = "Press SPACE to start"
+        if self._changed("status", status):
+            self._status.update(status)
 
         # Update laps list
         self.update_laps_list()
 
     def update_laps_list(self):
         """Update the laps list display."""
-        laps_list = self.query_one("#laps-list", Static)
-
-        if not self.stopwatch.laps:
-            laps_list.update("[dim]No laps recorded[/]")
-            return
-
-        lines = []
-        for i, lap_time in enumerate(self.stopwatch.laps, 1):
-            if i == 1:
-                lap_duration = lap_time
-            else:
-                lap_duration = lap_time - self.stopwatch.laps[i - 2]
-
-            time_str = format_time(lap_time, show_hours=False)
-            duration_str = format_time(lap_duration, show_hours=False)
-            lines.append(f"Lap {i}: {time_str} (+{duration_str})")
-
-        laps_list.update("\n".join(lines))
+        self._laps_list.sync()
 
     def handle_tick(self):
         """Handle stopwatch tick."""
-        self.stopwatch.tick()
         self.update_display()
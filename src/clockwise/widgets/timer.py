@@ -3,7 +3,7 @@
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
 from textual.widgets import Static, ProgressBar
-from textual.reactive import reactive
+from textual.reactive import var
 
 from ..models.timer_model import Timer
 from ..utils.formatting import format_time
@@ -66,68 +66,82 @@ class TimerWidget(Container):
     }
     """
 
-    time_remaining = reactive(0)
-    is_running = reactive(False)
-    is_completed = reactive(False)
-    timer_name = reactive("Timer")
-    progress = reactive(0.0)
+    time_remaining = var(0)
+    is_running = var(False)
+    is_completed = var(False)
+    timer_name = var("Timer")
+    progress = var(0.0)
 
     def __init__(self, timer: Timer, **kwargs):
         super().__init__(**kwargs)
         self.timer = timer
         self.can_focus = True
+        self._rendered = {}
 
     def compose(self) -> ComposeResult:
         """Compose the timer widget."""
         yield Static("⏲️  TIMER", id="timer-title")
+        self._display = Static(id="timer-display")
+        self._progress_bar = ProgressBar(total=100, show_eta=False, id="timer-progress")
+        self._name_display = Static(id="timer-name")
+        self._status = Static(id="timer-status")
         with Vertical():
-            yield Static(id="timer-display")
-            yield ProgressBar(total=100, show_eta=False, id="timer-progress")
-            yield Static(id="timer-name")
-            yield Static(id="timer-status")
+            yield self._display
+            yield self._progress_bar
+            yield self._name_display
+            yield self._status
 
     def on_mount(self) -> None:
         """Set up the widget when mounted."""
         self.update_display()
 
+    def _changed(self, field: str, value) -> bool:
+        """Remember ``value`` as rendered for ``field``; True if it is new."""
+        if field in self._rendered and self._rendered[field] == value:
+            return False
+        self._rendered[field] = value
+        return True
+
     def update_display(self):
-        """Update the display with current timer state."""
-        self.time_remaining = self.timer.remaining
+        """Update the display, pushing only the parts that changed."""
+        remaining = self.timer.remaining
+        self.time_remaining = remaining
         self.is_running = self.timer.running
         self.is_completed = self.timer.completed
         self.timer_name = self.timer.name
         self.progress = self.timer.get_progress()
 
         # Update display
-        display = self.query_one("#timer-display", Static)
-        time_str = format_time(self.timer.remaining, show_hours=False)
-        display.update(
-            f"[bold #00ff00]{time_str}[/]" if self.timer.remaining > 0 else "[bold #ff0000]00:00[/]"
-        )
+        time_str = format_time(remaining, show_hours=False)
+        text = f"[bold #00ff00]{time_str}[/]" if remaining > 0 else "[bold #ff0000]00:00[/]"
+        if self._changed("display", text):
+            self._display.update(text)
 
         # Update progress bar
-        progress_bar = self.query_one("#timer-progress", ProgressBar)
-        progress_bar.update(progress=self.progress * 100)
+        progress = self.progress * 100
+        if self._changed("progress", progress):
+            self._progress_bar.update(progress=progress)
 
         # Update name
-        name_display = self.query_one("#timer-name", Static)
-        name_display.update(self.timer.name)
+        if self._changed("name", self.timer.name):
+            self._name_display.update(self.timer.name)
 
         # Update status
-        status = self.query_one("#timer-status", Static)
         if self.timer.completed:
-            status.update("⏰ Timer Complete! Press 'd' to dismiss")
-            self.add_class("completed")
+            status = "⏰ Timer Complete! Press 'd' to dismiss"
+        elif self.timer.running:
+            status = "▶️  Running - Press SPACE to pause"
+        elif remaining > 0:
+            status = "⏸️  Paused - Press SPACE to resume"
         else:
-            self.remove_class("completed")
-            if self.timer.running:
-                status.update("▶️  Running - Press SPACE to pause")
-            elif self.timer.remaining > 0:
-                status.update("⏸️  Paused - Press SPACE to resume")
-            else:
-                status.update("Press 'p' for presets or 'n' for new timer")
+            status = "Press 'p' for presets or 'n' for new timer"
+        if self._changed("status", status):
+            self._status.update(status)
+
+        if self._changed("completed", self.timer.completed):
+            self.set_class(self.timer.completed, "completed")
 
     def handle_tick(self):
         """Handle timer tick."""
-        self.timer.tick()
+        self.timer.update()
         self.update_display()
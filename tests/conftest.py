@@ -0,0 +1,17 @@
+"""Shared fixtures for Clockwise tests.
+
+``app_dirs`` lives in the repository's top-level conftest.py, which the
+benchmark suite shares.
+"""
+
+import pytest
+
+from clockwise.models.clock import SystemClock
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze the system monotonic clock; set ``frozen_clock[0]`` to move it, in ns."""
+    now = [0]
+    monkeypatch.setattr(SystemClock, "monotonic_ns", staticmethod(lambda: now[0]))
+    return now
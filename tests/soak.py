@@ -0,0 +1,225 @@
+"""
+Memory soak harness: a simulated multi-day session of the app.
+
+Drives :class:`~clockwise.app.ClockwiseApp` headlessly on a
+:class:`~clockwise.models.clock.SimulatedClock`. The timer runs back to
+back Pomodoros, the stopwatch runs throughout, and a lap is taken every
+minute. The clock jumps ahead ``step`` simulated seconds (a minute by
+default) before each tick of the app, so only one in ``step`` of the
+wakeups the real app would have is run, and a week of use takes minutes
+instead of a week. Memory is sampled every simulated hour with
+tracemalloc and from the process RSS. :func:`check` fails if either
+keeps growing once the session has warmed up.
+
+``tests/test_soak.py`` runs a short soak when pytest is given ``--soak``.
+Run a long one with ``python -m tests.soak --hours 168``.
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import List, NamedTuple, Optional
+
+HOUR = 3600
+# Growth allowed per simulated hour once warmed up. Only the laps taken
+# in that hour should add anything: their storage, and their rows in the
+# lap table and its render caches.
+TRACED_LIMIT = 16 * 1024
+RSS_LIMIT = 256 * 1024
+
+
+class Sample(NamedTuple):
+    """Memory use at one point of the session."""
+
+    hour: float
+    traced: int
+    rss: Optional[int]
+    laps: int
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def soak(
+    hours: float = 24.0,
+    step: int = 60,
+    lap_every: int = 60,
+    pomodoro: int = 1500,
+) -> List[Sample]:
+    """
+    Run a simulated session and sample memory every hour.
+
+    Must run with the app's config and data directories pointed somewhere
+    disposable.
+
+    Args:
+        hours: Simulated length of the session
+        step: Simulated seconds the clock advances between ticks of the
+            app; the display wakes up every second, so anything above 1
+            skips wakeups
+        lap_every: Simulated seconds between laps
+        pomodoro: Timer duration in seconds; the timer is restarted each
+            time it completes
+
+    Returns:
+        One sample at the start and one per simulated hour
+    """
+    from clockwise.app import ClockwiseApp
+    from clockwise.models import SimulatedClock
+
+    clock = SimulatedClock()
+    samples: List[Sample] = []
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    async def session():
+        app = ClockwiseApp(clock=clock)
+        async with app.run_test() as pilot:
+            app._handle_preset_selection(
+                {"id": "pomodoro", "name": "Pomodoro", "duration": pomodoro}
+            )
+            app.action_toggle_active()
+            app.action_switch_focus()
+            app.action_toggle_active()
+            app.action_switch_focus()
+
+            elapsed = 0
+            while True:
+                if elapsed % HOUR == 0:
+                    await pilot.pause()
+                    samples.append(_sample(elapsed / HOUR, len(app.stopwatch.laps)))
+                if elapsed >= hours * HOUR:
+                    break
+                clock.advance(step)
+                elapsed += step
+                if elapsed % lap_every == 0:
+                    app.stopwatch.add_lap()
+                app.tick_update()
+                if app.timer.completed:
+                    app.action_dismiss_alert()
+                    app.action_toggle_active()
+                # Let Textual process the refreshes the tick queued
+                await asyncio.sleep(0)
+
+    try:
+        asyncio.run(session())
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return samples
+
+
+def clear_bounded_caches():
+    """
+    Empty the caches that are capped by construction.
+
+    The time-string caches and rich's cell width cache keep filling for
+    days at a wakeup a minute before they reach their cap, which would
+    read as growth. Emptying them before each sample leaves only memory
+    that nothing bounds.
+    """
+    from rich.cells import cached_cell_len
+
+    from clockwise.utils import formatting
+
+    for cache in (formatting._clock_hms, formatting._clock_ms, formatting._natural):
+        cache.clear()
+    cached_cell_len.cache_clear()
+
+
+def _sample(hour: float, laps: int) -> Sample:
+    """Measure memory after emptying bounded caches and collecting garbage."""
+    clear_bounded_caches()
+    gc.collect()
+    return Sample(hour, tracemalloc.get_traced_memory()[0], rss_bytes(), laps)
+
+
+def growth_per_hour(samples: List[Sample], field: str) -> float:
+    """Least-squares slope of a memory field, in bytes per hour."""
+    points = [(s.hour, getattr(s, field)) for s in samples if getattr(s, field) is not None]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def check(
+    samples: List[Sample],
+    warmup: float = 2.0,
+    traced_limit: float = TRACED_LIMIT,
+    rss_limit: Optional[float] = RSS_LIMIT,
+):
+    """
+    Fail if memory keeps growing after the warm-up.
+
+    Args:
+        samples: Samples from :func:`soak`
+        warmup: Simulated hours ignored while caches fill
+        traced_limit: Allowed tracemalloc growth in bytes per hour
+        rss_limit: Allowed RSS growth in bytes per hour, or None not to
+            check RSS, which moves in whole allocator arenas and needs a
+            long run to show a trend
+
+    Raises:
+        AssertionError: If either growth rate is over its limit
+    """
+    steady = [s for s in samples if s.hour >= warmup]
+    traced = growth_per_hour(steady, "traced")
+    rss = growth_per_hour(steady, "rss")
+    summary = f"traced {traced:+.0f} B/h, rss {rss:+.0f} B/h after {warmup:g}h warm-up\n" + (
+        format_samples(samples)
+    )
+    assert traced <= traced_limit, summary
+    assert rss_limit is None or rss <= rss_limit, summary
+
+
+def format_samples(samples: List[Sample]) -> str:
+    """Render the samples as a table."""
+    lines = [f"{'hour':>6} {'traced KiB':>11} {'rss KiB':>9} {'laps':>7}"]
+    for s in samples:
+        rss = "-" if s.rss is None else f"{s.rss / 1024:.0f}"
+        lines.append(f"{s.hour:>6g} {s.traced / 1024:>11.1f} {rss:>9} {s.laps:>7}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run a soak from the command line in throwaway app directories."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=72.0, help="simulated hours (72)")
+    parser.add_argument("--step", type=int, default=60, help="seconds between ticks (60)")
+    parser.add_argument("--lap-every", type=int, default=60, help="seconds between laps (60)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="hours to ignore (2)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CONFIG_HOME"] = os.path.join(tmp, "config")
+        os.environ["XDG_DATA_HOME"] = os.path.join(tmp, "data")
+        samples = soak(args.hours, args.step, args.lap_every)
+    print(format_samples(samples))
+    for field in ("traced", "rss"):
+        steady = [s for s in samples if s.hour >= args.warmup]
+        print(f"{field} growth: {growth_per_hour(steady, field):+.0f} B/h")
+    try:
+        check(samples, args.warmup)
+    except AssertionError:
+        print("FAIL: memory grows in steady state", file=sys.stderr)
+        return 1
+    print("OK: steady-state memory is flat")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Tests for the Clockwise application."""
+
+import asyncio
+import threading
+from datetime import datetime
+
+from clockwise.app import ClockwiseApp
+from clockwise.models import SimulatedClock
+from clockwise.state import StatePersistence
+
+
+def run_app(scenario):
+    """Run ``scenario(app, pilot)`` against a headless app."""
+
+    async def main():
+        app = ClockwiseApp()
+        async with app.run_test() as pilot:
+            await scenario(app, pilot)
+
+    asyncio.run(main())
+
+
+def test_idle_app_arms_no_wakeup(app_dirs):
+    """Test nothing is scheduled while timer and stopwatch are stopped."""
+
+    async def scenario(app, pilot):
+        await pilot.pause()
+        assert app._wakeup is None
+
+    run_app(scenario)
+
+
+def test_running_timer_arms_single_wakeup(app_dirs):
+    """Test starting and pausing arms and disarms the next wakeup."""
+
+    async def scenario(app, pilot):
+        app.timer.set_duration(30, "Test")
+        app.action_toggle_active()
+        wakeup = app._wakeup
+        assert wakeup is not None
+
+        app.action_switch_focus()
+        app.action_toggle_active()
+        assert app._wakeup is not wakeup
+
+        app.action_toggle_active()
+        app.action_switch_focus()
+        app.action_toggle_active()
+        assert app._wakeup is None
+
+    run_app(scenario)
+
+
+def test_direct_tick_replaces_pending_wakeup(app_dirs):
+    """Test a tick run outside the wakeup stops the wakeup it supersedes."""
+
+    async def scenario(app, pilot):
+        app.timer.set_duration(30, "Test")
+        app.action_toggle_active()
+        wakeup = app._wakeup
+        app.tick_update()
+        assert app._wakeup is not wakeup
+        assert wakeup._task is None
+
+    run_app(scenario)
+
+
+def test_wakeup_updates_display(app_dirs):
+    """Test the display follows the clock once the wakeup fires."""
+
+    async def scenario(app, pilot):
+        app.timer.set_duration(1, "Short")
+        app.action_toggle_active()
+        await pilot.pause(1.2)
+        assert app.timer.completed is True
+        assert app.timer_widget.has_class("completed")
+        assert app._wakeup is None
+
+    run_app(scenario)
+
+
+def test_lap_list_shows_latest_laps(app_dirs):
+    """Test the lap list follows new laps and clears on reset."""
+
+    async def scenario(app, pilot):
+        stopwatch = app.stopwatch
+        stopwatch.start()
+        for _ in range(10_000):
+            stopwatch.tick(2)
+            stopwatch.add_lap()
+        app.stopwatch_widget.update_display()
+        await pilot.pause()
+
+        lap_list = app.stopwatch_widget.query_one("#laps-list")
+        last_row = lap_list.render_line(lap_list.size.height - 1).text
+        assert last_row.rstrip() == "Lap 10000: 333:20 (+00:02)"
+
+        stopwatch.reset()
+        app.stopwatch_widget.update_display()
+        await pilot.pause()
+        assert lap_list.render_line(0).text.strip() == "No laps recorded"
+
+    run_app(scenario)
+
+
+def test_unchanged_display_pushes_no_updates(app_dirs, monkeypatch):
+    """Test widgets only push fields whose rendered value changed."""
+    from textual.widgets import Static
+
+    async def scenario(app, pilot):
+        app.timer.set_duration(90, "Test")
+        app.timer_widget.update_display()
+        app.stopwatch_widget.update_display()
+        await pilot.pause()
+
+        pushed = []
+        update = Static.update
+        monkeypatch.setattr(Static, "update", lambda self, *a, **kw: pushed.append(self.id))
+        app.timer_widget.update_display()
+        app.stopwatch_widget.update_display()
+        assert pushed == []
+
+        app.timer.start()
+        app.timer.tick()
+        app.timer_widget.update_display()
+        assert sorted(pushed) == ["timer-display", "timer-status"]
+        monkeypatch.setattr(Static, "update", update)
+
+    run_app(scenario)
+
+
+def test_ticks_leave_lap_encoding_to_the_writer(app_dirs, monkeypatch):
+    """Test a tick captures the stopwatch without encoding its laps on the event loop."""
+    from clockwise.models.stopwatch_model import LapEncoder
+
+    async def scenario(app, pilot):
+        stopwatch = app.stopwatch
+        stopwatch.start()
+        for _ in range(1000):
+            stopwatch.tick(1)
+            stopwatch.add_lap()
+
+        loop_thread = threading.get_ident()
+        encode = LapEncoder.encode
+        encoded_on = []
+
+        def tracking_encode(self, laps, count=None):
+            encoded_on.append(threading.get_ident())
+            return encode(self, laps, count)
+
+        monkeypatch.setattr(LapEncoder, "encode", tracking_encode)
+        app.tick_update()
+        app.state_writer.flush()
+        assert encoded_on and loop_thread not in encoded_on
+
+        saved = app.state_persistence.get_stopwatch_state()
+        assert saved["laps_ns"] == stopwatch.get_state()["laps_ns"]
+
+    run_app(scenario)
+
+
+def test_finished_sessions_are_recorded(app_dirs):
+    """Test a completed preset timer and a reset stopwatch land in the history."""
+
+    async def scenario(app, pilot):
+        app._handle_preset_selection({"id": "quick", "name": "Quick", "duration": 1})
+        app.action_toggle_active()
+        await pilot.pause(1.2)
+        assert app.timer.completed is True
+
+        app.action_switch_focus()
+        app.action_toggle_active()
+        app.stopwatch.tick(3)
+        app.stopwatch.add_lap()
+        app.action_reset_active()
+        app.action_reset_active()
+
+        sessions = app.history.sessions()
+        assert [s["kind"] for s in sessions] == ["stopwatch", "timer"]
+        stopwatch, timer = sessions
+        assert (timer["name"], timer["preset"], timer["duration"]) == ("Quick", "quick", 1)
+        assert stopwatch["duration"] >= 3
+        assert len(stopwatch["laps"]) == 1
+
+    run_app(scenario)
+
+
+def test_picks_up_state_from_other_instance(app_dirs):
+    """Test a timer renamed by another instance shows up in the running app."""
+
+    async def scenario(app, pilot):
+        other = StatePersistence(app.state_persistence.state_file)
+        other.load_state()
+        other.save_state(dict(app.timer.get_state(), name="Elsewhere"), app.stopwatch.get_state())
+        for _ in range(50):
+            await pilot.pause(0.1)
+            if app.timer.name == "Elsewhere":
+                break
+        assert app.timer.name == "Elsewhere"
+
+    run_app(scenario)
+
+
+def test_simulated_clock_drives_the_app(app_dirs):
+    """Test a day of simulated time plays through the app without waiting for it."""
+    clock = SimulatedClock(datetime(2024, 1, 1, 9))
+
+    async def main():
+        app = ClockwiseApp(clock=clock)
+        async with app.run_test() as pilot:
+            app._handle_preset_selection({"id": "day", "name": "Day", "duration": 86_400})
+            app.action_toggle_active()
+            clock.advance(86_399)
+            app.tick_update()
+            assert app.timer_widget.time_remaining == 1
+            clock.advance(1)
+            app.tick_update()
+            await pilot.pause()
+            assert app.timer.completed is True
+            assert app._wakeup is None
+
+            (session,) = app.history.sessions()
+            assert session["started_at"] == datetime(2024, 1, 1, 9).timestamp()
+            assert session["ended_at"] == datetime(2024, 1, 2, 9).timestamp()
+
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""Tests for the command line interface."""
+
+import socket
+from datetime import datetime
+
+from click.testing import CliRunner
+
+from clockwise.cli import cli
+from clockwise.config.manager import ConfigManager
+from clockwise.report import parse_since
+from clockwise.state import HistoryStore
+
+
+def record_sessions():
+    """Record two Pomodoros and a stopwatch session in the app's history."""
+    history = HistoryStore(ConfigManager().history_file)
+    start = datetime(2024, 1, 1, 9).timestamp()
+    history.record_many(
+        {
+            "kind": kind,
+            "preset": preset,
+            "started_at": start + offset,
+            "ended_at": start + offset + duration,
+            "duration": duration,
+        }
+        for kind, preset, offset, duration in (
+            ("timer", "pomodoro", 0, 1500),
+            ("timer", "pomodoro", 86400, 1500),
+            ("stopwatch", None, 3600, 90),
+        )
+    )
+    history.close()
+
+
+def test_report_by_preset(app_dirs):
+    """Test the report command prints one row per preset and a total."""
+    record_sessions()
+    result = CliRunner().invoke(cli, ["report"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[1].split() == ["pomodoro", "2", "50m"]
+    assert lines[2].split() == ["stopwatch", "1", "1m", "30s"]
+    assert lines[-1].split() == ["Total", "3", "51m", "30s"]
+
+
+def test_report_by_day_since(app_dirs):
+    """Test --since and --group-by day."""
+    record_sessions()
+    result = CliRunner().invoke(cli, ["report", "--since", "2024-01-02", "--group-by", "day"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[1].split() == ["2024-01-02", "1", "25m"]
+
+
+def test_report_rejects_bad_since(app_dirs):
+    """Test an unparseable --since is a usage error."""
+    result = CliRunner().invoke(cli, ["report", "--since", "last tuesday"])
+    assert result.exit_code == 2
+    assert "--since" in result.output
+
+
+def test_rebuild_report(app_dirs):
+    """Test the rebuild command recomputes rollups."""
+    record_sessions()
+    result = CliRunner().invoke(cli, ["rebuild-report"])
+    assert result.exit_code == 0, result.output
+    assert "3 sessions" in result.output
+
+
+def test_parse_since():
+    """Test supported --since formats."""
+    now = datetime(2024, 1, 10, 15, 30)
+    assert parse_since(None) is None
+    assert parse_since("today", now) == datetime(2024, 1, 10)
+    assert parse_since("7d", now) == datetime(2024, 1, 3)
+    assert parse_since("2w", now) == datetime(2023, 12, 27)
+    assert parse_since("2024-01-05", now) == datetime(2024, 1, 5)
+
+
+def test_timer_rejects_bad_duration():
+    """Test the headless timer refuses durations it cannot run."""
+    for duration in ("abc", "0"):
+        result = CliRunner().invoke(cli, ["timer", duration])
+        assert result.exit_code == 2
+        assert "Invalid duration" in result.output
+
+
+def test_daemon_commands_fail_cleanly_without_unix_sockets(app_dirs, monkeypatch):
+    """Test platforms without Unix sockets get an error message, not a traceback."""
+    monkeypatch.delattr(socket, "AF_UNIX", raising=False)
+    for args in (["daemon"], ["ctl", "status"], ["--attach"]):
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 1, result.output
+        assert "needs Unix domain sockets" in result.output
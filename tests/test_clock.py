@@ -0,0 +1,147 @@
+"""Tests for the injectable clocks and multi-day runs on simulated time."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from clockwise.models import SYSTEM_CLOCK, SimulatedClock, Stopwatch, Timer, create_engine
+from clockwise.report import parse_since
+from clockwise.state import HistoryStore, StatePersistence, StateWriter
+from clockwise.state.history import stopwatch_session, timer_session
+
+NS_PER_SECOND = 1_000_000_000
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def clock():
+    """A simulated clock starting on Monday 2024-01-01 at 09:00 local time."""
+    return SimulatedClock(datetime(2024, 1, 1, 9))
+
+
+def test_system_clock_reads_real_time():
+    """Test the system clock is the real monotonic and wall clock."""
+    before = time.monotonic_ns()
+    assert before <= SYSTEM_CLOCK.monotonic_ns() <= time.monotonic_ns()
+    assert abs(SYSTEM_CLOCK.time() - time.time()) < 5
+    assert abs(SYSTEM_CLOCK.now() - datetime.now()) < timedelta(seconds=5)
+
+
+def test_simulated_clock_advances_on_request(clock):
+    """Test monotonic and wall time move together, and only when told to."""
+    start = clock.time()
+    assert clock.monotonic_ns() == 0
+    assert clock.now() == datetime(2024, 1, 1, 9)
+
+    clock.advance(1.5)
+    clock.advance(ns=250)
+    clock.sleep(DAY)
+    assert clock.monotonic_ns() == (DAY + 1.5) * NS_PER_SECOND + 250
+    assert clock.time() == pytest.approx(start + DAY + 1.5)
+    assert clock.now().date() == datetime(2024, 1, 2).date()
+
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+    assert SimulatedClock(0, monotonic_ns=7).time() == 0
+    assert SimulatedClock(0, monotonic_ns=7).monotonic_ns() == 7
+
+
+def test_day_of_stopwatch_laps_in_simulated_time(clock):
+    """Test a 24 hour session with a lap every 90 seconds runs without waiting."""
+    stopwatch = Stopwatch(clock)
+    stopwatch.start()
+    started = time.perf_counter()
+    for _ in range(DAY // 90):
+        clock.advance(90)
+        stopwatch.add_lap()
+    assert time.perf_counter() - started < 5
+
+    assert stopwatch.elapsed == DAY
+    assert len(stopwatch.laps) == 960
+    stats = stopwatch.get_lap_stats()
+    assert stats["fastest_ns"] == stats["slowest_ns"] == 90 * NS_PER_SECOND
+
+
+def test_engine_shares_its_clock(clock):
+    """Test timers created by an engine follow the engine's clock."""
+    engine = create_engine("wheel", clock)
+    short = engine.add(60, start=True)
+    long = engine.add(DAY, start=True)
+    clock.advance(3600)
+    assert engine.poll() == [short]
+    clock.advance(DAY)
+    assert engine.poll() == [long]
+    assert engine.get(long).clock is clock
+
+
+def test_saves_are_timestamped_by_the_clock(tmp_path, clock):
+    """Test saved state and the background writer use the injected clock."""
+    persistence = StatePersistence(tmp_path / "state.json", clock=clock)
+    persistence.save_state(Timer(60, clock=clock).get_state(), Stopwatch(clock).get_state())
+    saved = json.loads(persistence.state_file.read_text())
+    assert saved["timestamp"] == "2024-01-01T09:00:00"
+
+    clock.advance(2 * DAY)
+    writer = StateWriter(persistence, interval=0)
+    writer.submit(Timer(30, clock=clock).get_state(), Stopwatch(clock).get_state())
+    writer.close()
+    saved = json.loads(persistence.state_file.read_text())
+    assert saved["timestamp"] == "2024-01-03T09:00:00"
+
+
+def test_restore_after_simulated_restart(tmp_path, clock):
+    """Test a running timer saved before a restart keeps counting after it."""
+    timer = Timer(2 * 3600, "Deep work", clock)
+    timer.start()
+    clock.advance(1800)
+    persistence = StatePersistence(tmp_path / "state.json", clock=clock)
+    persistence.save_state(timer.get_state(), Stopwatch(clock).get_state())
+
+    # The next instance starts on a fresh monotonic clock
+    clock = SimulatedClock(clock.now(), monotonic_ns=10 * NS_PER_SECOND)
+    restored = Timer(clock=clock)
+    restored.set_state(StatePersistence(tmp_path / "state.json").get_timer_state())
+    assert restored.running is True
+    assert restored.remaining == 5400
+    clock.advance(5399)
+    restored.update()
+    assert restored.remaining == 1
+    clock.advance(1)
+    restored.update()
+    assert restored.completed is True
+
+
+def test_sessions_across_midnight_roll_over(tmp_path, clock):
+    """Test three simulated days of pomodoros land in one bucket per day."""
+    history = HistoryStore(tmp_path / "history.db")
+    timer = Timer(1500, "Pomodoro", clock)
+    stopwatch = Stopwatch(clock)
+    clock.advance(13 * 3600)  # 22:00 on day one
+    for _ in range(3):
+        for _ in range(6):  # Four sessions before midnight, two after
+            started_at = clock.time()
+            timer.reset()
+            timer.start()
+            clock.advance(1500)
+            timer.update()
+            assert timer.completed is True
+            history.record(timer_session(timer, "pomodoro", started_at))
+            clock.advance(300)
+        stopwatch.start()
+        clock.advance(600)
+        history.record(stopwatch_session(stopwatch))
+        stopwatch.reset()
+        clock.advance(DAY - 6 * 1800 - 600)
+
+    by_day = [(row["bucket"], row["sessions"]) for row in history.report(group_by="day")]
+    assert by_day == [
+        ("2024-01-01", 4),
+        ("2024-01-02", 7),
+        ("2024-01-03", 7),
+        ("2024-01-04", 3),
+    ]
+    since = parse_since("today", now=clock.now())
+    assert [row["bucket"] for row in history.report(since, group_by="day")] == ["2024-01-04"]
+    history.close()
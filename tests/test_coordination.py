@@ -0,0 +1,222 @@
+"""Tests for several instances sharing one state file."""
+
+import base64
+import json
+import multiprocessing
+import threading
+from array import array
+
+import pytest
+
+from clockwise.state import StateJournal, StatePersistence, StateWatcher, locking
+from clockwise.state.locking import bump_generation, file_lock, read_generation
+from clockwise.state.persistence import merge_model_state
+
+TIMER = {"duration": 60, "name": "Tea", "remaining": 60, "running": False}
+STOPWATCH = {"elapsed_ns": 0, "running": False, "laps_ns": ""}
+WRITERS = 3
+LAPS = 40
+RENAMES = 30
+
+# Without fcntl file_lock runs blocks unlocked, so nothing excludes other writers
+needs_flock = pytest.mark.skipif(locking.fcntl is None, reason="file locks need fcntl")
+
+
+def encode_laps(count):
+    """Encode laps 1..count like ``Stopwatch.get_state``."""
+    return base64.b64encode(array("q", range(1, count + 1)).tobytes()).decode("ascii")
+
+
+def decode_laps(text):
+    """Decode ``laps_ns`` into a list of lap times."""
+    return list(array("q", base64.b64decode(text)))
+
+
+def make_persistence(kind, path):
+    """Build the persistence backend under test."""
+    return StateJournal(path) if kind == "journal" else StatePersistence(path)
+
+
+def test_merge_keeps_their_change_when_ours_only_counted():
+    """Test a model that only counted time yields to another instance's change."""
+    base = dict(TIMER, running=True)
+    ours = dict(base, remaining=50)
+    theirs = dict(base, running=False, remaining=55)
+
+    assert merge_model_state(base, ours, theirs) == theirs
+
+
+def test_merge_keeps_our_change():
+    """Test our own control change wins, even over theirs."""
+    base = dict(TIMER)
+    ours = dict(TIMER, running=True)
+
+    assert merge_model_state(base, ours, dict(TIMER, name="Coffee")) == ours
+    assert merge_model_state(base, ours, base) == ours
+    assert merge_model_state(None, ours, base) == ours
+
+
+def test_merge_keeps_our_progress_when_theirs_only_counted():
+    """Test two instances counting the same running timer keep our progress."""
+    base = dict(TIMER, running=True)
+    ours = dict(base, remaining=40)
+
+    assert merge_model_state(base, ours, dict(base, remaining=45)) == ours
+
+
+@needs_flock
+def test_generation_counter(tmp_path):
+    """Test the lock file counts writes."""
+    lock = tmp_path / "state.json.lock"
+    assert read_generation(lock) == 0
+    with file_lock(lock):
+        with file_lock(lock, exclusive=False):
+            assert bump_generation(lock) == 1
+        assert bump_generation(lock) == 2
+    assert read_generation(lock) == 2
+
+
+@pytest.mark.parametrize("kind", ["snapshot", "journal"])
+def test_reload_ignores_own_writes(tmp_path, kind):
+    """Test reload reports only state another instance saved."""
+    path = tmp_path / "state.json"
+    ours = make_persistence(kind, path)
+    theirs = make_persistence(kind, path)
+    ours.save_state(TIMER, STOPWATCH)
+    assert ours.reload() is None
+
+    theirs.load_state()
+    theirs.save_state(dict(TIMER, name="Coffee"), STOPWATCH)
+    assert ours.reload()["timer"]["name"] == "Coffee"
+    assert ours.reload() is None
+
+
+@pytest.mark.parametrize("kind", ["snapshot", "journal"])
+def test_save_does_not_clobber_other_instance(tmp_path, kind):
+    """Test each instance's change survives the other's next save."""
+    path = tmp_path / "state.json"
+    a = make_persistence(kind, path)
+    b = make_persistence(kind, path)
+    a.save_state(TIMER, STOPWATCH)
+    b.load_state()
+
+    a.save_state(TIMER, dict(STOPWATCH, laps_ns=encode_laps(1)))
+    b.save_state(dict(TIMER, name="Coffee"), STOPWATCH)
+    # a has not applied b's rename yet; its stale timer must not win
+    a.save_state(TIMER, dict(STOPWATCH, laps_ns=encode_laps(2)))
+
+    state = make_persistence(kind, path).load_state()
+    assert state["timer"]["name"] == "Coffee"
+    assert decode_laps(state["stopwatch"]["laps_ns"]) == [1, 2]
+
+    # a learns about the rename even though it wrote last
+    assert a.reload()["timer"]["name"] == "Coffee"
+
+
+def test_journal_snapshots_after_foreign_write(tmp_path):
+    """Test a journal whose diff base is stale writes a snapshot instead."""
+    path = tmp_path / "state.json"
+    a = StateJournal(path)
+    b = StateJournal(path)
+    a.save_state(TIMER, STOPWATCH)
+    a.save_state(dict(TIMER, running=True), STOPWATCH)
+    assert a.journal_file.exists()
+
+    b.load_state()
+    b.save_state(dict(TIMER, running=True), dict(STOPWATCH, running=True))
+    a.save_state(dict(TIMER, running=False), STOPWATCH)
+
+    assert not a.journal_file.exists()
+    state = json.loads(path.read_text())
+    assert state["timer"]["running"] is False
+    assert state["stopwatch"]["running"] is True
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_reports_changes(tmp_path, use_inotify):
+    """Test the watcher calls back when another instance saves."""
+    path = tmp_path / "state.json"
+    changed = threading.Event()
+    watcher = StateWatcher(
+        [path], changed.set, min_interval=0.01, max_interval=0.05, use_inotify=use_inotify
+    )
+    watcher.start()
+    try:
+        (tmp_path / "unrelated.txt").write_text("x")
+        assert not changed.wait(0.1)
+        StatePersistence(path).save_state(TIMER, STOPWATCH)
+        assert changed.wait(5)
+    finally:
+        watcher.stop()
+    if not use_inotify:
+        assert watcher.backend == "poll"
+
+
+def _lap_writer(kind, path, start):
+    """Record laps one at a time, like a stopwatch in one instance."""
+    persistence = make_persistence(kind, path)
+    state = persistence.load_state()
+    timer, stopwatch = state["timer"], state["stopwatch"]
+    start.wait()
+    for lap in range(1, LAPS + 1):
+        state = persistence.reload()
+        if state is not None:
+            timer, stopwatch = state["timer"], state["stopwatch"]
+        assert len(decode_laps(stopwatch["laps_ns"])) == lap - 1
+        stopwatch = dict(stopwatch, laps_ns=encode_laps(lap))
+        persistence.save_state(timer, stopwatch)
+
+
+def _timer_writer(kind, path, start, index):
+    """Rename the timer over and over, like a user in another instance."""
+    persistence = make_persistence(kind, path)
+    state = persistence.load_state()
+    timer, stopwatch = state["timer"], state["stopwatch"]
+    start.wait()
+    for step in range(RENAMES):
+        state = persistence.reload()
+        if state is not None:
+            timer, stopwatch = state["timer"], state["stopwatch"]
+        timer = dict(timer, name=f"writer-{index}-{step}")
+        persistence.save_state(timer, stopwatch)
+
+
+def _reader(kind, path, start, done, errors):
+    """Check every read sees a complete state."""
+    persistence = make_persistence(kind, path)
+    start.wait()
+    while not done.is_set():
+        state = persistence.load_state()
+        if state is None or set(state) != {"timer", "stopwatch", "timestamp"}:
+            errors.put(repr(state))
+            return
+
+
+@needs_flock
+@pytest.mark.parametrize("kind", ["snapshot", "journal"])
+def test_concurrent_processes(tmp_path, kind):
+    """Test N processes sharing a state file lose no update and never tear it."""
+    path = tmp_path / "state.json"
+    make_persistence(kind, path).save_state(TIMER, STOPWATCH)
+
+    ctx = multiprocessing.get_context("spawn")
+    start, done, errors = ctx.Event(), ctx.Event(), ctx.Queue()
+    workers = [ctx.Process(target=_lap_writer, args=(kind, path, start))]
+    workers += [
+        ctx.Process(target=_timer_writer, args=(kind, path, start, index))
+        for index in range(WRITERS)
+    ]
+    reader = ctx.Process(target=_reader, args=(kind, path, start, done, errors))
+    for process in workers + [reader]:
+        process.start()
+    start.set()
+    for process in workers:
+        process.join(60)
+    done.set()
+    reader.join(60)
+
+    assert [process.exitcode for process in workers + [reader]] == [0] * (WRITERS + 2)
+    assert errors.empty()
+    state = make_persistence(kind, path).load_state()
+    assert decode_laps(state["stopwatch"]["laps_ns"]) == list(range(1, LAPS + 1))
+    assert state["timer"]["name"] in {f"writer-{index}-{RENAMES - 1}" for index in range(WRITERS)}
@@ -0,0 +1,354 @@
+"""Tests for the daemon and its Unix socket protocol."""
+
+import asyncio
+import json
+import socket
+import sys
+
+import pytest
+
+from clockwise.app import ClockwiseApp
+from clockwise.daemon import ClockwiseDaemon, DaemonClient, DaemonError, send_command
+from clockwise.state import StatePersistence
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def sock(tmp_path):
+    return str(tmp_path / "clockwise.sock")
+
+
+def run_daemon(scenario, daemon):
+    """Run ``scenario(daemon)`` while ``daemon`` serves."""
+
+    async def main():
+        await daemon.start()
+        try:
+            await scenario(daemon)
+        finally:
+            await daemon.close()
+
+    asyncio.run(main())
+
+
+async def until(condition, timeout=2.0):
+    """Wait for ``condition()`` to become true."""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+def test_commands(sock):
+    """Test requests drive the models and return the new state."""
+
+    async def scenario(daemon):
+        client = DaemonClient(sock)
+        state = await client.request("set", duration="25m", name="Focus", preset="pomodoro")
+        assert state["timer"]["duration"] == 1500
+        assert state["timer"]["name"] == "Focus"
+
+        state = await client.request("start")
+        assert state["timer"]["running"] is True
+        assert daemon.timer.running
+
+        await client.request("start", target="stopwatch")
+        await client.request("lap")
+        state = await client.request("status")
+        assert state["stopwatch"]["running"] is True
+        assert state["stopwatch"]["laps_ns"]
+
+        await client.request("reset")
+        assert not daemon.timer.running
+        await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_bad_requests(sock):
+    """Test malformed requests are answered with errors, not disconnects."""
+
+    async def scenario(daemon):
+        reader, writer = await asyncio.open_unix_connection(sock)
+        for line in (b"not json\n", b"[1]\n", b'{"id": 7, "cmd": "explode"}\n'):
+            writer.write(line)
+            response = json.loads(await reader.readline())
+            assert response["ok"] is False
+        assert response["id"] == 7
+
+        client = DaemonClient(sock)
+        with pytest.raises(DaemonError, match="Invalid duration"):
+            await client.request("set", duration=0)
+        with pytest.raises(DaemonError, match="Unknown target"):
+            await client.request("start", target="oven")
+        await client.close()
+        writer.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_subscribers_receive_each_change_once(sock):
+    """Test one change is pushed to every subscriber, without polling."""
+
+    async def scenario(daemon):
+        events = [[] for _ in range(50)]
+        clients = [DaemonClient(sock, received.append) for received in events]
+        for client in clients:
+            await client.request("subscribe")
+
+        controller = DaemonClient(sock)
+        await controller.request("start", target="stopwatch")
+        await until(lambda: all(events))
+        await asyncio.sleep(0.1)
+
+        assert all(len(received) == 1 for received in events)
+        assert events[0][0]["cause"] == "start"
+        assert events[0][0]["state"]["stopwatch"]["running"] is True
+
+        for client in clients + [controller]:
+            await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def stalled_subscriber(sock):
+    """Connect and subscribe, then never read anything."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(sock)
+    client.sendall(b'{"cmd": "subscribe"}\n')
+    return client
+
+
+def fill_laps(daemon, count=200_000):
+    """Make the full state sent on subscribe large enough to fill socket buffers."""
+    daemon.stopwatch.start()
+    for _ in range(count):
+        daemon.stopwatch.add_lap()
+    daemon._changed("lap")
+
+
+def test_stalled_subscriber_is_dropped(sock, monkeypatch):
+    """Test a subscriber that stops reading is disconnected and close() still returns."""
+    monkeypatch.setattr("clockwise.daemon.CLIENT_QUEUE", 4)
+
+    async def scenario(daemon):
+        fill_laps(daemon)
+        stalled = stalled_subscriber(sock)
+        events = []
+        reader = DaemonClient(sock, events.append)
+        await reader.request("subscribe")
+
+        controller = DaemonClient(sock)
+        for _ in range(20):
+            await controller.request("toggle", target="stopwatch")
+        await until(lambda: len(daemon._clients) == 2)
+        await until(lambda: len(events) == 20)
+
+        await asyncio.wait_for(daemon.close(), 5)
+        assert not daemon._clients
+        stalled.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_close_drops_clients_that_do_not_read(sock, monkeypatch):
+    """Test close() gives up on a client whose socket is full before its queue is."""
+    monkeypatch.setattr("clockwise.daemon.CLOSE_TIMEOUT", 0.2)
+
+    async def scenario(daemon):
+        fill_laps(daemon)
+        stalled = stalled_subscriber(sock)
+        controller = DaemonClient(sock)
+        for _ in range(10):
+            await controller.request("toggle", target="stopwatch")
+
+        await asyncio.wait_for(daemon.close(), 5)
+        assert not daemon._clients
+        stalled.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_events_carry_only_new_laps(sock):
+    """Test subscribers are sent each lap once and can rebuild the full buffer."""
+    from clockwise.models.stopwatch_model import Stopwatch, decode_laps
+
+    async def scenario(daemon):
+        fill_laps(daemon, 1000)
+        mirror = Stopwatch()
+        events = []
+        subscriber = DaemonClient(sock, events.append)
+        mirror.set_state((await subscriber.request("subscribe"))["stopwatch"])
+
+        state = await subscriber.request("lap")
+        assert state["stopwatch"]["laps_from"] == 1001
+        assert state["stopwatch"]["laps_ns"] == ""
+        controller = DaemonClient(sock)
+        await controller.request("lap")
+        await until(lambda: len(events) == 2)
+
+        for event in events:
+            stopwatch_state = event["state"]["stopwatch"]
+            assert len(decode_laps(stopwatch_state["laps_ns"])) == 1
+            mirror.set_state(stopwatch_state)
+        assert events[-1]["state"]["stopwatch"]["laps_from"] == 1001
+        assert mirror.laps == daemon.stopwatch.laps
+
+        await controller.request("reset", target="stopwatch")
+        await until(lambda: len(events) == 3)
+        assert "laps_from" not in events[-1]["state"]["stopwatch"]
+        status = await subscriber.request("status")
+        assert "laps_from" not in status["stopwatch"]
+
+        for client in (subscriber, controller):
+            await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_oversized_message_is_reported(sock, monkeypatch):
+    """Test a message over the read limit fails the request instead of a silent disconnect."""
+    monkeypatch.setattr("clockwise.daemon.READ_LIMIT", 4096)
+
+    async def scenario(daemon):
+        fill_laps(daemon, 1000)
+        client = DaemonClient(sock)
+        with pytest.raises(DaemonError, match="longer than 4096 bytes"):
+            await client.request("status")
+        with pytest.raises(DaemonError, match="longer than"):
+            await client.wait_closed()
+        await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+@pytest.mark.parametrize("backend", ["heap", "wheel"])
+def test_completion_is_pushed(sock, backend):
+    """Test the daemon wakes itself to announce a finished timer."""
+
+    async def scenario(daemon):
+        events = []
+        client = DaemonClient(sock, events.append)
+        await client.request("subscribe")
+        await client.request("set", duration=0.2, name="Tea")
+        await client.request("start")
+        await until(lambda: events and events[-1]["cause"] == "complete")
+
+        assert events[-1]["state"]["timer"]["completed"] is True
+        await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock, timer_backend=backend))
+
+
+def test_send_command_and_stale_socket(sock, tmp_path):
+    """Test the blocking helper, stale socket cleanup and a second daemon."""
+    open(sock, "w").close()
+
+    async def scenario(daemon):
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(None, lambda: send_command("start", sock))
+        assert state["timer"]["running"] is False  # no duration set yet
+
+        with pytest.raises(DaemonError, match="already running"):
+            await ClockwiseDaemon(sock).start()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+    with pytest.raises(DaemonError):
+        send_command("status", sock)
+
+
+def test_state_persists_across_daemons(sock, tmp_path):
+    """Test the daemon saves state on close and restores it on start."""
+    persistence = StatePersistence(tmp_path / "state.json")
+
+    async def set_timer(daemon):
+        client = DaemonClient(sock)
+        await client.request("set", duration=90, name="Saved")
+        await client.close()
+
+    run_daemon(set_timer, ClockwiseDaemon(sock, persistence))
+
+    daemon = ClockwiseDaemon(sock, persistence)
+    assert (daemon.timer.name, daemon.timer.duration) == ("Saved", 90)
+
+
+def test_restored_running_timer_completes(sock, tmp_path):
+    """Test a timer saved while running is scheduled again when the daemon starts."""
+    persistence = StatePersistence(tmp_path / "state.json")
+    timer_state = {"duration": 60, "name": "Left over", "remaining_ns": 100_000_000}
+    persistence.save_state(dict(timer_state, running=True), {})
+
+    async def scenario(daemon):
+        assert daemon.engine.next_deadline() is not None
+        await until(lambda: daemon.timer.completed)
+
+    run_daemon(scenario, ClockwiseDaemon(sock, persistence, timer_backend="wheel"))
+
+
+def test_autosave_is_armed_only_while_running(sock, tmp_path):
+    """Test the idle daemon schedules no saves, and a running clock does."""
+    persistence = StatePersistence(tmp_path / "state.json")
+
+    async def scenario(daemon):
+        assert daemon._autosave is None
+        client = DaemonClient(sock)
+        await client.request("start", target="stopwatch")
+        assert daemon._autosave is not None
+        await client.request("set", duration=0.1, name="Short")
+        await client.request("start")
+        await client.request("pause", target="stopwatch")
+        assert daemon._autosave is not None
+
+        await until(lambda: daemon.timer.completed)
+        assert daemon._autosave is None
+        assert daemon._wakeup is None
+        await client.close()
+
+    run_daemon(scenario, ClockwiseDaemon(sock, persistence, save_interval=0.05))
+
+
+def test_app_attaches_to_daemon(app_dirs, sock):
+    """Test an attached app mirrors the daemon and sends it commands."""
+
+    async def scenario(daemon):
+        client = DaemonClient(sock)
+        await client.request("set", duration=300, name="Remote")
+        await client.close()
+        app = ClockwiseApp(attach=sock)
+        async with app.run_test() as pilot:
+            await until(lambda: app.daemon is not None)
+            assert app.timer.name == "Remote"
+
+            app.action_toggle_active()
+            await until(lambda: daemon.timer.running and app.timer.running)
+            assert app.state_writer is None
+            await pilot.pause()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
+
+
+def test_attached_app_mirrors_laps(app_dirs, sock):
+    """Test an attached app keeps the daemon's laps as they are pushed, and resyncs."""
+
+    async def scenario(daemon):
+        fill_laps(daemon, 100)
+        app = ClockwiseApp(attach=sock)
+        async with app.run_test() as pilot:
+            await until(lambda: app.daemon is not None)
+            assert app.stopwatch.laps == daemon.stopwatch.laps
+
+            app.action_switch_focus()
+            app.action_add_lap()
+            await until(lambda: len(app.stopwatch.laps) == 101)
+            assert app.stopwatch.laps == daemon.stopwatch.laps
+
+            # Lose a lap, so the next delta does not follow
+            app.stopwatch.laps.pop()
+            app.action_add_lap()
+            await until(lambda: len(app.stopwatch.laps) == 102)
+            assert app.stopwatch.laps == daemon.stopwatch.laps
+            await pilot.pause()
+
+    run_daemon(scenario, ClockwiseDaemon(sock))
@@ -0,0 +1,166 @@
+"""Tests for TimerEngine and its timing wheel backend."""
+
+import random
+
+import pytest
+
+from clockwise.config.defaults import SETTING_CHOICES
+from clockwise.models import TimerEngine, WheelTimerEngine, create_engine
+from clockwise.models.engine import ENGINE_BACKENDS
+
+NS_PER_SECOND = 1_000_000_000
+
+
+@pytest.fixture(params=["heap", "wheel"])
+def backend(request):
+    """Scheduling backend under test."""
+    return request.param
+
+
+def test_engine_add_and_get(frozen_clock, backend):
+    """Test timers are created idle unless started."""
+    engine = create_engine(backend)
+    timer_id = engine.add(60, "Station 1")
+
+    assert len(engine) == 1
+    assert timer_id in engine
+    assert engine.get(timer_id).name == "Station 1"
+    assert engine.next_deadline() is None
+
+
+def test_engine_next_deadline(frozen_clock, backend):
+    """Test the next deadline is the earliest running timer."""
+    engine = create_engine(backend)
+    engine.add(30, start=True)
+    engine.add(10, start=True)
+    engine.add(5)
+
+    assert engine.next_deadline() == 10 * NS_PER_SECOND
+
+
+def test_engine_poll_completes_due_timers_in_order(frozen_clock, backend):
+    """Test poll completes only the timers that are due."""
+    engine = create_engine(backend)
+    late = engine.add(30, start=True)
+    early = engine.add(10, start=True)
+    middle = engine.add(20, start=True)
+
+    assert engine.poll(5 * NS_PER_SECOND) == []
+    assert engine.poll(25 * NS_PER_SECOND) == [early, middle]
+    assert engine.get(early).completed is True
+    assert engine.get(late).running is True
+    assert engine.next_deadline() == 30 * NS_PER_SECOND
+
+
+def test_engine_pause_and_resume(frozen_clock, backend):
+    """Test a paused timer is unscheduled and resumes with its remaining time."""
+    engine = create_engine(backend)
+    timer_id = engine.add(10, start=True)
+
+    frozen_clock[0] = 4 * NS_PER_SECOND
+    engine.pause(timer_id)
+    assert engine.next_deadline() is None
+    assert engine.poll(40 * NS_PER_SECOND) == []
+
+    frozen_clock[0] = 50 * NS_PER_SECOND
+    engine.start(timer_id)
+    assert engine.next_deadline() == 56 * NS_PER_SECOND
+    assert engine.poll(56 * NS_PER_SECOND) == [timer_id]
+
+
+def test_engine_cancel(frozen_clock, backend):
+    """Test cancelled timers never complete."""
+    engine = create_engine(backend)
+    ids = [engine.add(n, start=True) for n in range(1, 11)]
+
+    for timer_id in ids[:9]:
+        engine.cancel(timer_id)
+
+    assert len(engine) == 1
+    assert engine.next_deadline() == 10 * NS_PER_SECOND
+    assert engine.poll(60 * NS_PER_SECOND) == [ids[9]]
+
+    with pytest.raises(KeyError):
+        engine.get(ids[0])
+
+
+def test_engine_reset(frozen_clock, backend):
+    """Test resetting a timer stops and rewinds it."""
+    engine = create_engine(backend)
+    timer_id = engine.add(10, start=True)
+
+    frozen_clock[0] = 3 * NS_PER_SECOND
+    engine.reset(timer_id)
+
+    assert engine.get(timer_id).remaining == 10
+    assert engine.get(timer_id).running is False
+    assert engine.next_deadline() is None
+
+
+def test_create_engine():
+    """Test backends are selected by name."""
+    assert type(create_engine("heap")) is TimerEngine
+    assert type(create_engine("wheel")) is WheelTimerEngine
+
+    with pytest.raises(ValueError):
+        create_engine("calendar")
+
+
+def test_create_engine_from_settings():
+    """Test the timer_backend setting picks the backend when none is named."""
+    assert type(create_engine(settings={"timer_backend": "wheel"})) is WheelTimerEngine
+    assert type(create_engine("heap", settings={"timer_backend": "wheel"})) is TimerEngine
+    assert type(create_engine(settings={})) is TimerEngine
+    assert SETTING_CHOICES["timer_backend"] == ENGINE_BACKENDS
+
+
+def test_sync_follows_direct_changes(frozen_clock, backend):
+    """Test sync reschedules a timer whose state was changed behind the engine's back."""
+    engine = create_engine(backend)
+    timer_id = engine.add(0)
+    timer = engine.get(timer_id)
+    timer.set_state({"duration": 10, "remaining": 5, "running": True})
+    engine.sync(timer_id)
+    assert engine.next_deadline() == timer.deadline_ns
+
+    timer.set_duration(20)
+    engine.sync(timer_id)
+    assert engine.next_deadline() is None
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3, 4, 5])
+def test_wheel_matches_heap(frozen_clock, levels):
+    """Test the wheel completes the same timers at the same polls as the heap."""
+    rng = random.Random(7)
+    heap = create_engine("heap")
+    wheel = WheelTimerEngine(levels=levels)
+
+    for _ in range(2000):
+        duration = rng.choice([1, 5, 59, 600, 3600, 90_000, 40_000_000])
+        heap_id = heap.add(duration)
+        wheel_id = wheel.add(duration)
+        assert heap_id == wheel_id
+        if rng.random() < 0.8:
+            heap.start(heap_id)
+            wheel.start(wheel_id)
+
+    ids = list(heap)
+    for timer_id in rng.sample(ids, 500):
+        heap.cancel(timer_id)
+        wheel.cancel(timer_id)
+
+    now_ns = 0
+    for step in [1, 3, 2, 600, 1, 3000, 86_400, 100_000, 50_000_000]:
+        now_ns += step * NS_PER_SECOND + rng.randrange(NS_PER_SECOND)
+        assert wheel.next_deadline() == heap.next_deadline()
+        assert sorted(wheel.poll(now_ns)) == sorted(heap.poll(now_ns))
+
+    assert wheel.next_deadline() is None
+
+
+def test_wheel_rejects_bad_parameters():
+    """Test a wheel needs at least one level and a positive resolution."""
+    with pytest.raises(ValueError):
+        WheelTimerEngine(levels=0)
+    with pytest.raises(ValueError):
+        WheelTimerEngine(resolution_ns=0)
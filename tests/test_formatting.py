@@ -1,7 +1,19 @@
 """Tests for formatting utilities."""
 
+from array import array
+
 import pytest
-from clockwise.utils.formatting import format_time, format_time_natural, parse_time_input
+from clockwise.utils import formatting
+from clockwise.utils.formatting import (
+    FORMAT_CACHE_SIZE,
+    DurationParseError,
+    format_time,
+    format_time_natural,
+    format_times,
+    format_times_natural,
+    parse_time_input,
+    parse_time_inputs,
+)
 
 
 class TestFormatTime:
@@ -66,6 +78,14 @@ class TestFormatTimeNatural:
         assert format_time_natural(3661) == "1h 1m 1s"
         assert format_time_natural(3725) == "1h 2m 5s"
 
+    def test_fractional_seconds(self):
+        """Test fractional durations keep their milliseconds."""
+        assert format_time_natural(0.5) == "500ms"
+        assert format_time_natural(1.5) == "1.5s"
+        assert format_time_natural(90.25) == "1m 30.25s"
+        assert format_time_natural(3600.001) == "1h 0.001s"
+        assert format_time_natural(2.0) == "2s"
+
     def test_zero_time(self):
         """Test formatting zero."""
         assert format_time_natural(0) == "0s"
@@ -135,3 +155,129 @@ class TestParseTimeInput:
         """Test parsing empty string raises ValueError."""
         with pytest.raises(ValueError):
             parse_time_input("")
+
+
+class TestDurationGrammar:
+    """Tests for the extended duration grammar and its errors."""
+
+    def test_parse_days_and_milliseconds(self):
+        """Test parsing the largest and smallest units."""
+        assert parse_time_input("1d2h") == 93600
+        assert parse_time_input("1d 30s") == 86430
+        assert parse_time_input("1s250ms") == 1.25
+        assert parse_time_input("500MS") == 0.5
+
+    def test_parse_decimals(self):
+        """Test decimal values, whole results staying integers."""
+        assert parse_time_input("1.5h") == 5400
+        assert isinstance(parse_time_input("1.5h"), int)
+        assert parse_time_input("0.1h") == 360
+        assert parse_time_input(".5m") == 30
+        assert parse_time_input("2.5s") == 2.5
+
+    def test_parse_clock_fractions(self):
+        """Test clock form with fractional seconds."""
+        assert parse_time_input("1:30:00.250") == 5400.25
+        assert parse_time_input("0:05.5") == 5.5
+        assert parse_time_input("90.5") == 90.5
+
+    @pytest.mark.parametrize(
+        "compact, spelled_out",
+        [
+            ("1d2h3m4s5ms", "1D 2H 3M 4S 5MS"),
+            ("90m", " 90 m "),
+            ("1m5ms", "1M 5Ms"),
+            ("2h0s", "2.0h 0.s"),
+            ("1:02:03", " 1:02:03.000 "),
+        ],
+    )
+    def test_fast_forms_match_full_grammar(self, compact, spelled_out):
+        """Test the forms parsed without the full grammar give the same seconds."""
+        assert formatting._parse(compact) == formatting._parse(spelled_out)
+        assert type(formatting._parse(compact)) is type(formatting._parse(spelled_out))
+
+    @pytest.mark.parametrize(
+        "text, position",
+        [
+            ("5x3m", 1),
+            ("1h30", 4),
+            ("30m1h", 4),
+            ("1h 1h", 4),
+            ("invalid", 0),
+            ("1:2:3:4", 5),
+            ("1:75", 2),
+            ("1:75:00", 2),
+            ("1:3x", 2),
+            ("-5m", 0),
+            ("   ", 3),
+        ],
+    )
+    def test_error_position(self, text, position):
+        """Test errors point at where the input stops making sense."""
+        with pytest.raises(DurationParseError) as info:
+            parse_time_input(text)
+        assert info.value.position == position
+        assert info.value.text == text
+        assert f"position {position}" in str(info.value)
+
+    def test_error_is_value_error(self):
+        """Test callers catching ValueError keep working."""
+        with pytest.raises(ValueError):
+            parse_time_input("5x3m")
+
+
+class TestParseTimeInputs:
+    """Tests for bulk parsing."""
+
+    def test_parses_in_order(self):
+        """Test results line up with the inputs, repeats included."""
+        assert parse_time_inputs(["25m", "1h", "25m", "90"]) == [1500, 3600, 1500, 90]
+        assert parse_time_inputs(iter([])) == []
+
+    def test_error_reports_index(self):
+        """Test the failing item's index is attached to the error."""
+        with pytest.raises(DurationParseError) as info:
+            parse_time_inputs(["1m", "2m", "2x", "3m"])
+        assert info.value.index == 2
+        assert info.value.position == 1
+
+
+class TestFormatTimes:
+    """Tests for cached and sequence formatting."""
+
+    def test_cached_results_match(self):
+        """Test repeated and float inputs format like fresh ones."""
+        assert format_time(3661) == format_time(3661) == "01:01:01"
+        assert format_time(90.7, show_hours=False) == "01:30"
+        assert format_time(6000, show_hours=False) == "100:00"
+        assert format_time(360000) == "100:00:00"
+        assert format_time_natural(3725) == format_time_natural(3725.0) == "1h 2m 5s"
+
+    def test_cache_is_bounded(self):
+        """Test the caches never grow past their limit."""
+        for seconds in range(FORMAT_CACHE_SIZE * 2):
+            format_time(seconds)
+            format_time_natural(seconds)
+        assert len(formatting._clock_hms) <= FORMAT_CACHE_SIZE
+        assert len(formatting._natural) <= FORMAT_CACHE_SIZE
+
+    @pytest.mark.parametrize("show_hours", [True, False])
+    def test_sequences_match_scalar(self, show_hours):
+        """Test every kind of sequence formats like format_time."""
+        values = [0, 5, 59, 60, 3599, 3600, 86399, 400000]
+        expected = [format_time(value, show_hours) for value in values]
+        assert format_times(values, show_hours) == expected
+        assert format_times(array("q", values), show_hours) == expected
+        assert format_times((value for value in values), show_hours) == expected
+        assert format_times_natural(array("q", values)) == [format_time_natural(v) for v in values]
+
+    @pytest.mark.parametrize("show_hours", [True, False])
+    def test_numpy_arrays(self, show_hours):
+        """Test NumPy arrays take the vectorised path with the same results."""
+        numpy = pytest.importorskip("numpy")
+        values = [0, 5, 59, 60, 3599, 3600, 86399, 400000]
+        expected = [format_time(value, show_hours) for value in values]
+        assert format_times(numpy.array(values), show_hours) == expected
+        assert format_times(numpy.array(values[:-1], dtype=float), show_hours) == expected[:-1]
+        assert format_times(numpy.array([], dtype=int), show_hours) == []
+        assert format_times_natural(numpy.array(values)) == [format_time_natural(v) for v in values]
@@ -0,0 +1,120 @@
+"""Tests for headless timer and stopwatch runs."""
+
+import io
+import subprocess
+import sys
+
+import pytest
+
+from clockwise.headless import EXIT_INTERRUPTED, EXIT_OK, run_stopwatch, run_timer
+from clockwise.models.clock import SimulatedClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run on a simulated clock and return a sleep that advances it."""
+    simulated = SimulatedClock()
+    sleeps = []
+    monkeypatch.setattr("clockwise.headless.SYSTEM_CLOCK", simulated)
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        simulated.advance(seconds)
+
+    return sleeps, sleep
+
+
+class Terminal(io.StringIO):
+    """Output stream that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+def test_timer_runs_to_completion(clock):
+    """Test a timer wakes once per displayed second and exits 0."""
+    sleeps, sleep = clock
+    out = Terminal()
+    assert run_timer(3, "Build", out=out, sleep=sleep) == EXIT_OK
+
+    assert sleeps == [1, 1, 1]
+    output = out.getvalue()
+    assert "\rBuild 00:00:03" in output
+    assert "\rBuild 00:00:01" in output
+    assert output.endswith("Build complete (3s)\n")
+
+
+@pytest.mark.parametrize(
+    "duration, countdown, complete",
+    [(0.5, "00:00:01", "500ms"), (1.5, "00:00:02", "1.5s")],
+)
+def test_timer_fractional_duration(clock, duration, countdown, complete):
+    """Test a sub-second duration counts down rounded up and is reported exactly."""
+    sleeps, sleep = clock
+    out = io.StringIO()
+    assert run_timer(duration, "Tea", out=out, sleep=sleep) == EXIT_OK
+
+    assert sum(sleeps) == pytest.approx(duration)
+    assert out.getvalue().splitlines() == [f"Tea {countdown}", f"Tea complete ({complete})"]
+
+
+def test_timer_redirected_output_is_brief(clock):
+    """Test redirected output gets only the first and final lines."""
+    _, sleep = clock
+    out = io.StringIO()
+    run_timer(120, "Build", out=out, sleep=sleep)
+    assert out.getvalue().splitlines() == ["Build 00:02:00", "Build complete (2m)"]
+
+
+def test_timer_quiet(clock):
+    """Test --quiet prints nothing."""
+    _, sleep = clock
+    out = Terminal()
+    run_timer(2, quiet=True, out=out, sleep=sleep)
+    assert out.getvalue() == ""
+
+
+def test_timer_interrupted(clock):
+    """Test Ctrl-C stops the timer with status 130."""
+    sleeps, sleep = clock
+
+    def interrupting_sleep(seconds):
+        if len(sleeps) == 2:
+            raise KeyboardInterrupt
+        sleep(seconds)
+
+    out = io.StringIO()
+    assert run_timer(10, "Build", out=out, sleep=interrupting_sleep) == EXIT_INTERRUPTED
+    assert out.getvalue().splitlines()[-1] == "Build stopped, 00:00:08 left"
+
+
+def test_stopwatch_stops_at_limit(clock):
+    """Test the stopwatch stops after --for."""
+    sleeps, sleep = clock
+    out = io.StringIO()
+    assert run_stopwatch(5, out=out, sleep=sleep) == EXIT_OK
+    assert len(sleeps) == 5
+    assert out.getvalue().splitlines()[-1] == "Stopwatch stopped at 00:00:05"
+
+
+def test_timer_runs_a_day_on_simulated_time():
+    """Test a 24 hour timer completes at once when the clock's sleep is simulated."""
+    clock = SimulatedClock()
+    out = io.StringIO()
+    assert run_timer(86_400, "Day", out=out, clock=clock) == EXIT_OK
+    assert clock.monotonic_ns() == 86_400 * 1_000_000_000
+    assert out.getvalue().splitlines()[-1] == "Day complete (24h)"
+
+
+def test_headless_cli_never_imports_textual():
+    """Test the timer subcommand runs without importing Textual."""
+    code = (
+        "import sys\n"
+        "from clockwise.__main__ import main\n"
+        "try:\n"
+        "    main(['timer', '1s', '--quiet'])\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0, e.code\n"
+        "assert 'textual' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
@@ -0,0 +1,196 @@
+"""Tests for the session history store."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from clockwise.state import HistoryStore
+
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def history(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+def session(started_at, duration, preset="pomodoro", kind="timer", laps=None):
+    """Build a session starting at Unix time ``started_at``."""
+    return {
+        "kind": kind,
+        "name": preset.title() if preset else "Stopwatch",
+        "preset": preset,
+        "started_at": started_at,
+        "ended_at": started_at + duration,
+        "duration": duration,
+        "laps": laps,
+    }
+
+
+def test_record_and_list(history):
+    """Test recorded sessions come back newest first with their laps."""
+    history.record(session(1000, 1500))
+    history.record(session(5000, 12.5, preset=None, kind="stopwatch", laps=[1, 2, 3]))
+
+    stopwatch, timer = history.sessions()
+    assert stopwatch["kind"] == "stopwatch"
+    assert list(stopwatch["laps"]) == [1, 2, 3]
+    assert timer["preset"] == "pomodoro"
+    assert timer["duration"] == 1500
+    assert list(timer["laps"]) == []
+
+
+def test_record_many_is_one_transaction(history):
+    """Test a batch with a bad session inserts nothing."""
+    batch = [session(i, 60) for i in range(10)]
+    batch.append({"kind": "timer"})
+    with pytest.raises(KeyError):
+        history.record_many(batch)
+    assert history.count() == 0
+
+    assert history.record_many(session(i, 60) for i in range(10)) == 10
+    assert history.count() == 10
+
+
+def test_total_duration_filters(history):
+    """Test totals honour time range, preset and kind filters."""
+    week = datetime(2024, 1, 1)
+    start = week.timestamp()
+    history.record_many(
+        [
+            session(start - DAY, 1500),
+            session(start + DAY, 1500),
+            session(start + 2 * DAY, 300, preset="short_break"),
+            session(start + 3 * DAY, 90, preset=None, kind="stopwatch"),
+        ]
+    )
+
+    this_week = {"since": week, "until": week + timedelta(days=7)}
+    assert history.total_duration(preset="pomodoro", **this_week) == 1500
+    assert history.total_duration(**this_week) == 1890
+    assert history.total_duration(kind="stopwatch") == 90
+    assert history.total_duration(preset="missing") == 0
+    assert len(history.sessions(limit=2)) == 2
+
+
+def test_database_uses_wal_and_indexes(history):
+    """Test the database is in WAL mode and queries use the indexes."""
+    conn = sqlite3.connect(str(history.db_file))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT SUM(duration) FROM sessions "
+                "WHERE preset = ? AND started_at >= ?",
+                ("pomodoro", 0),
+            )
+        )
+        assert "sessions_preset" in plan
+    finally:
+        conn.close()
+
+
+def test_history_survives_reopen(tmp_path):
+    """Test sessions persist across store instances."""
+    path = tmp_path / "history.db"
+    store = HistoryStore(path)
+    store.record(session(0, 60))
+    store.close()
+
+    store = HistoryStore(path)
+    assert store.count() == 1
+    store.close()
+
+
+def test_report_reads_rollups(history):
+    """Test reports group sessions by preset, day and week."""
+    monday = datetime(2024, 1, 1, 9)
+    history.record_many(
+        [
+            session(monday.timestamp(), 1500),
+            session((monday + timedelta(hours=1)).timestamp(), 1500),
+            session((monday + timedelta(days=1)).timestamp(), 300, preset="short_break"),
+            session((monday + timedelta(days=8)).timestamp(), 90, preset=None, kind="stopwatch"),
+        ]
+    )
+
+    by_preset = {row["bucket"]: (row["sessions"], row["duration"]) for row in history.report()}
+    assert by_preset == {
+        "pomodoro": (2, 3000),
+        "short_break": (1, 300),
+        "stopwatch": (1, 90),
+    }
+
+    by_day = [(row["bucket"], row["sessions"]) for row in history.report(group_by="day")]
+    assert by_day == [("2024-01-01", 2), ("2024-01-02", 1), ("2024-01-09", 1)]
+
+    by_week = history.report(since=monday + timedelta(days=3), group_by="week")
+    assert [(row["bucket"], row["duration"]) for row in by_week] == [
+        ("2024-01-01", 3300),
+        ("2024-01-08", 90),
+    ]
+    since_day = history.report(since=monday + timedelta(days=1), group_by="day")
+    assert [row["bucket"] for row in since_day] == ["2024-01-02", "2024-01-09"]
+
+    with pytest.raises(ValueError):
+        history.report(group_by="month")
+
+
+def test_rollups_match_rebuild(history):
+    """Test incremental rollups agree with a rebuild from the raw sessions."""
+    start = datetime(2024, 3, 1).timestamp()
+    for i in range(50):
+        history.record(session(start + i * 7919, 60 + i, preset=("a", "b", None)[i % 3]))
+    reports = {group: history.report(group_by=group) for group in ("preset", "day", "week")}
+
+    history._conn.execute("DELETE FROM daily_rollups")
+    history._conn.execute("DELETE FROM preset_rollups")
+    history.rebuild_rollups()
+    assert {group: history.report(group_by=group) for group in reports} == reports
+
+
+def test_preset_report_reads_totals(history):
+    """Test the all-time preset report reads one row per preset, not the daily buckets."""
+    start = datetime(2024, 3, 1).timestamp()
+    for day in range(30):
+        history.record(session(start + day * 86400, 60, preset=("a", "b")[day % 2]))
+    assert history._conn.execute("SELECT COUNT(*) FROM preset_rollups").fetchone()[0] == 2
+    expected = history.report(since=start)
+
+    with history._conn:
+        history._conn.execute("DELETE FROM daily_rollups")
+    assert history.report() == expected
+    assert [(row["bucket"], row["sessions"]) for row in expected] == [("a", 15), ("b", 15)]
+
+
+def test_rollups_built_for_existing_history(tmp_path):
+    """Test a database recorded without rollups gets them on open."""
+    path = tmp_path / "history.db"
+    store = HistoryStore(path)
+    store.record(session(datetime(2024, 1, 1).timestamp(), 60))
+    with store._conn:
+        store._conn.execute("DELETE FROM daily_rollups")
+        store._conn.execute("DELETE FROM weekly_rollups")
+    store.close()
+
+    store = HistoryStore(path)
+    assert store.report(group_by="week")[0]["sessions"] == 1
+    store.close()
+
+
+def test_preset_totals_built_for_older_databases(tmp_path):
+    """Test a database from before the all-time totals gets them on open."""
+    path = tmp_path / "history.db"
+    store = HistoryStore(path)
+    store.record(session(datetime(2024, 1, 1).timestamp(), 60))
+    with store._conn:
+        store._conn.execute("DROP TABLE preset_rollups")
+    store.close()
+
+    store = HistoryStore(path)
+    assert [(row["bucket"], row["sessions"]) for row in store.report()] == [("pomodoro", 1)]
+    store.close()
@@ -0,0 +1,149 @@
+"""Tests for the append-only state journal."""
+
+import json
+from datetime import datetime
+
+from clockwise.models.stopwatch_model import Stopwatch, decode_laps
+from clockwise.state import StateJournal
+
+TIMER_STATE = {"duration": 60, "name": "Test", "remaining": 60, "running": False}
+
+
+def stopwatch_state(laps=()):
+    """Build a stopwatch state holding ``laps`` (in seconds)."""
+    stopwatch = Stopwatch()
+    stopwatch.set_state({"elapsed": 0, "running": False, "laps": list(laps)})
+    return stopwatch.get_state()
+
+
+def read_records(journal):
+    """Parse every record in the journal file."""
+    with open(journal.journal_file) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_first_save_writes_snapshot(tmp_path):
+    """Test the first save of a session writes a full snapshot."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state([1, 2]))
+
+    assert journal.state_file.exists()
+    assert not journal.journal_file.exists()
+    assert journal.get_timer_state() == TIMER_STATE
+
+
+def test_changes_are_appended(tmp_path):
+    """Test later saves append one record per changed model."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state())
+    snapshot = journal.state_file.read_text()
+
+    running = dict(TIMER_STATE, running=True)
+    journal.save_state(running, stopwatch_state())
+    journal.save_state(running, stopwatch_state())
+
+    assert journal.state_file.read_text() == snapshot
+    records = read_records(journal)
+    assert [(r["seq"], r["event"], r["target"]) for r in records] == [(1, "start", "timer")]
+    assert journal.get_timer_state() == running
+
+
+def test_laps_append_only_new_values(tmp_path):
+    """Test a lap record carries just the new laps, not the whole list."""
+    journal = StateJournal(tmp_path / "state.json")
+    laps = list(range(1, 1001))
+    journal.save_state(TIMER_STATE, stopwatch_state(laps))
+    journal.save_state(TIMER_STATE, stopwatch_state(laps + [1001]))
+
+    (record,) = read_records(journal)
+    assert record["event"] == "lap"
+    assert list(decode_laps(record["laps_append"])) == [1001 * 1_000_000_000]
+    assert journal.journal_file.stat().st_size < 300
+
+    restored = decode_laps(journal.get_stopwatch_state()["laps_ns"])
+    assert len(restored) == 1001
+    assert restored[-1] == 1001 * 1_000_000_000
+
+
+def test_lap_reset_replaces_laps(tmp_path):
+    """Test clearing laps replays as a reset."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state([1, 2, 3]))
+    journal.save_state(TIMER_STATE, stopwatch_state())
+
+    (record,) = read_records(journal)
+    assert record["event"] == "reset"
+    assert journal.get_stopwatch_state()["laps_ns"] == ""
+
+
+def test_restore_in_new_session(tmp_path):
+    """Test a new journal instance restores snapshot plus replayed records."""
+    path = tmp_path / "state.json"
+    journal = StateJournal(path)
+    journal.save_state(TIMER_STATE, stopwatch_state([1]))
+    journal.save_state(dict(TIMER_STATE, remaining=30), stopwatch_state([1, 2]))
+
+    state = StateJournal(path).load_state()
+    assert state["timer"]["remaining"] == 30
+    assert list(decode_laps(state["stopwatch"]["laps_ns"])) == [1_000_000_000, 2_000_000_000]
+    assert "journal_seq" not in state
+
+
+def test_compaction_at_threshold(tmp_path):
+    """Test the journal folds into a snapshot once it passes the threshold."""
+    journal = StateJournal(tmp_path / "state.json", compact_bytes=1024)
+    laps = []
+    for lap in range(1, 40):
+        laps.append(lap)
+        journal.save_state(dict(TIMER_STATE, remaining=60 - lap), stopwatch_state(laps))
+        assert journal._journal_size() < 1024 + 512
+
+    state = StateJournal(journal.state_file).load_state()
+    assert state["timer"]["remaining"] == 21
+    assert len(decode_laps(state["stopwatch"]["laps_ns"])) == 39
+
+
+def test_compact_skips_records_in_snapshot(tmp_path):
+    """Test records left behind by an interrupted compaction are not replayed twice."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state([1]))
+    journal.save_state(TIMER_STATE, stopwatch_state([1, 2]))
+    stale = journal.journal_file.read_text()
+
+    journal.compact()
+    assert not journal.journal_file.exists()
+    journal.journal_file.write_text(stale)
+
+    laps = decode_laps(StateJournal(journal.state_file).get_stopwatch_state()["laps_ns"])
+    assert len(laps) == 2
+
+
+def test_torn_record_is_ignored(tmp_path):
+    """Test replay stops at a partially written record."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state())
+    journal.save_state(dict(TIMER_STATE, remaining=10), stopwatch_state())
+    with open(journal.journal_file, "a") as f:
+        f.write('{"seq": 2, "target": "tim')
+
+    state = StateJournal(journal.state_file).load_state()
+    assert state["timer"]["remaining"] == 10
+
+
+def test_timestamp_follows_last_record(tmp_path):
+    """Test the restored timestamp is the one of the latest record."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state(), datetime(2024, 1, 1))
+    journal.save_state(dict(TIMER_STATE, running=True), stopwatch_state(), datetime(2024, 1, 2))
+
+    assert journal.load_state()["timestamp"] == "2024-01-02T00:00:00"
+
+
+def test_clear_state_removes_journal(tmp_path):
+    """Test clearing state removes both snapshot and journal."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER_STATE, stopwatch_state())
+    journal.save_state(dict(TIMER_STATE, running=True), stopwatch_state())
+    journal.clear_state()
+
+    assert journal.load_state() is None
@@ -0,0 +1,133 @@
+"""Tests for tick latency histograms and the metrics overlay."""
+
+import asyncio
+import json
+import math
+import random
+
+from click.testing import CliRunner
+
+from clockwise.app import ClockwiseApp
+from clockwise.cli import cli
+from clockwise.metrics import BUCKETS, TICK_METRICS, Histogram, TickMetrics, format_ns
+from clockwise.models import SimulatedClock
+
+
+def test_histogram_percentiles_are_close():
+    """Test percentiles stay within the bucket precision across magnitudes."""
+    rng = random.Random(0)
+    values = [rng.randrange(10**9) for _ in range(20_000)] + [5, 7]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    assert histogram.count == len(values)
+    assert (histogram.min_ns, histogram.max_ns) == (5, values[-1])
+    for percent in (50, 90, 99, 99.9):
+        exact = values[math.ceil(len(values) * percent / 100) - 1]
+        assert exact <= histogram.percentile(percent) <= exact * (1 + 1 / 64)
+    assert histogram.percentile(0) == 5
+    assert histogram.percentile(100) == values[-1]
+
+
+def test_histogram_is_fixed_size():
+    """Test huge and negative values are counted without growing the histogram."""
+    histogram = Histogram()
+    histogram.record(-3)
+    histogram.record(10**15)
+    assert len(histogram.counts) == BUCKETS
+    assert histogram.percentile(1) == 0
+    assert histogram.percentile(100) == 10**15
+    assert histogram.buckets()[0] == [0, 1]
+
+    histogram.reset()
+    assert histogram.summary()["count"] == 0
+    assert histogram.percentile(99) == 0
+
+
+def test_dump(tmp_path):
+    """Test the dump holds a summary and buckets per histogram."""
+    metrics = TickMetrics()
+    for value in (1_000, 2_000, 3_000_000):
+        metrics.record("drift", value)
+    path = tmp_path / "metrics.json"
+    metrics.dump(path)
+
+    histograms = json.loads(path.read_text())["histograms"]
+    assert list(histograms) == list(TICK_METRICS)
+    drift = histograms["drift"]
+    assert drift["count"] == 3
+    assert drift["max_ns"] == 3_000_000
+    assert drift["p50_ns"] >= 2_000
+    assert sum(count for _, count in drift["buckets"]) == 3
+    assert histograms["save_state"]["count"] == 0
+
+
+def test_format_ns():
+    """Test durations are shown with a unit that suits them."""
+    assert [format_ns(v) for v in (0, 850, 12_345, 4_560_000, 1_200_000_000)] == [
+        "0ns",
+        "850ns",
+        "12.3us",
+        "4.56ms",
+        "1.2s",
+    ]
+
+
+def test_app_measures_nothing_until_asked(app_dirs):
+    """Test the app keeps no metrics unless enabled."""
+
+    async def main():
+        app = ClockwiseApp()
+        async with app.run_test() as pilot:
+            app.action_toggle_active()
+            app.tick_update()
+            await pilot.pause()
+            assert app.metrics is None
+            assert app.metrics_overlay is None
+
+    asyncio.run(main())
+
+
+def test_app_records_ticks_and_shows_overlay(app_dirs):
+    """Test each tick feeds the histograms and the overlay shows them."""
+    clock = SimulatedClock()
+
+    async def main():
+        app = ClockwiseApp(clock=clock, collect_metrics=True)
+        async with app.run_test() as pilot:
+            app.timer.set_duration(60, "Measured")
+            app.action_toggle_active()
+            for _ in range(10):
+                # Fire every wakeup 2 ms late
+                clock.advance(ns=app._wakeup_due_ns + 2_000_000 - clock.monotonic_ns())
+                app.tick_update()
+
+            histograms = app.metrics.histograms
+            assert histograms["timer_tick"].count == 10
+            assert histograms["stopwatch_tick"].count == 10
+            assert histograms["save_state"].count == 11
+            drift = histograms["drift"]
+            assert drift.count == 10
+            assert 2_000_000 <= drift.percentile(50) <= 2_100_000
+
+            await pilot.press("m")
+            overlay = app.query_one("#metrics-overlay")
+            assert overlay.display
+            assert "p99" in str(overlay.render())
+            assert "timer_tick" in str(overlay.render())
+            await pilot.press("m")
+            assert not overlay.display
+
+    asyncio.run(main())
+
+
+def test_metrics_file_option(app_dirs, tmp_path, monkeypatch):
+    """Test --metrics-file reaches the app runner."""
+    calls = []
+    monkeypatch.setattr("clockwise.app.run", lambda **kwargs: calls.append(kwargs))
+    path = str(tmp_path / "metrics.json")
+    result = CliRunner().invoke(cli, ["--metrics-file", path])
+    assert result.exit_code == 0, result.output
+    assert calls[0]["metrics_file"] == path
@@ -0,0 +1,175 @@
+"""Tests for state persistence."""
+
+import json
+import time
+from array import array
+from datetime import datetime
+
+import pytest
+
+from clockwise.config.defaults import SETTING_CHOICES
+from clockwise.config.manager import ConfigManager
+from clockwise.models.stopwatch_model import Stopwatch, encode_laps
+from clockwise.state import StatePersistence, StateWriter
+from clockwise.state.persistence import DURABILITY_MODES, create_persistence, write_file
+
+TIMER_STATE = {"duration": 60, "name": "Test", "remaining": 42, "running": False}
+STOPWATCH_STATE = {"elapsed": 5, "running": False, "laps_ns": ""}
+
+
+class RecordingPersistence(StatePersistence):
+    """StatePersistence that remembers every save."""
+
+    def __init__(self, state_file):
+        super().__init__(state_file)
+        self.saves = []
+
+    def save_state(self, timer_state, stopwatch_state, timestamp=None):
+        self.saves.append((timer_state, stopwatch_state))
+        super().save_state(timer_state, stopwatch_state, timestamp)
+
+
+def test_save_and_load_state(tmp_path):
+    """Test saved state round-trips through the state file."""
+    persistence = StatePersistence(tmp_path / "state.json")
+    timestamp = datetime(2024, 1, 2, 3, 4, 5)
+    persistence.save_state(TIMER_STATE, STOPWATCH_STATE, timestamp)
+
+    assert persistence.get_timer_state() == TIMER_STATE
+    assert persistence.get_stopwatch_state() == STOPWATCH_STATE
+    assert persistence.load_state()["timestamp"] == "2024-01-02T03:04:05"
+
+
+def test_load_corrupt_state(tmp_path):
+    """Test a corrupt state file loads as no state."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text('{"timer": ')
+
+    assert StatePersistence(state_file).load_state() is None
+
+
+@pytest.mark.parametrize("durability", ["none", "rename", "fsync"])
+def test_write_file_modes(tmp_path, durability):
+    """Test every durability mode replaces the file contents."""
+    path = tmp_path / "state.json"
+    path.write_text("old")
+    write_file(path, "new", durability)
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_write_file_failure_keeps_old_contents(tmp_path, monkeypatch):
+    """Test a failed atomic write leaves the previous file and no temp file."""
+    path = tmp_path / "state.json"
+    path.write_text("old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("clockwise.state.persistence.os.replace", fail)
+    with pytest.raises(OSError):
+        write_file(path, "new", "rename")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_unknown_durability(tmp_path):
+    """Test an unknown durability mode is rejected."""
+    with pytest.raises(ValueError):
+        StatePersistence(tmp_path / "state.json", durability="sometimes")
+
+
+def test_config_unknown_durability_falls_back(app_dirs, capsys):
+    """Test an unknown durability mode in the config file is replaced by the default."""
+    manager = ConfigManager()
+    manager.config_file.write_text('[settings]\nstate_durability = "sometimes"\n')
+    settings = manager.load_config()["settings"]
+
+    assert settings["state_durability"] == "rename"
+    assert "Invalid state_durability 'sometimes'" in capsys.readouterr().err
+    assert create_persistence(app_dirs / "state.json", settings).durability == "rename"
+    assert set(DURABILITY_MODES) == set(SETTING_CHOICES["state_durability"])
+
+
+def test_writer_coalesces_submissions(tmp_path):
+    """Test only the newest pending snapshot is written."""
+    persistence = RecordingPersistence(tmp_path / "state.json")
+    writer = StateWriter(persistence, interval=60)
+    for remaining in (44, 43, 42):
+        writer.submit({**TIMER_STATE, "remaining": remaining}, STOPWATCH_STATE)
+    writer.flush()
+
+    assert persistence.saves == [(TIMER_STATE, STOPWATCH_STATE)]
+    writer.close()
+
+
+def test_writer_skips_unchanged_state(tmp_path):
+    """Test a snapshot equal to the last one written is not rewritten."""
+    persistence = RecordingPersistence(tmp_path / "state.json")
+    writer = StateWriter(persistence, interval=60)
+    writer.submit(TIMER_STATE, STOPWATCH_STATE)
+    writer.flush()
+    writer.submit(dict(TIMER_STATE), dict(STOPWATCH_STATE))
+    writer.flush()
+
+    assert len(persistence.saves) == 1
+    writer.close()
+
+
+def test_writer_encodes_stopwatch_snapshots(tmp_path):
+    """Test a stopwatch snapshot is written with the laps it had when taken."""
+    persistence = RecordingPersistence(tmp_path / "state.json")
+    writer = StateWriter(persistence, interval=60)
+    stopwatch = Stopwatch()
+    stopwatch.set_state(
+        {"elapsed_ns": 9, "running": False, "laps_ns": encode_laps(array("q", [3]))}
+    )
+
+    snapshot = stopwatch.snapshot()
+    expected = stopwatch.get_state()
+    stopwatch._append_lap(7)
+    writer.submit(TIMER_STATE, snapshot)
+    writer.flush()
+    writer.submit(TIMER_STATE, stopwatch.snapshot())
+    writer.submit(TIMER_STATE, stopwatch.snapshot())
+    writer.flush()
+
+    assert persistence.saves == [(TIMER_STATE, expected), (TIMER_STATE, stopwatch.get_state())]
+    writer.close()
+
+
+def test_writer_ignores_repeated_submissions(tmp_path):
+    """Test submitting the snapshot just submitted does not wake the writer."""
+    persistence = RecordingPersistence(tmp_path / "state.json")
+    writer = StateWriter(persistence, interval=60)
+    writer.submit(TIMER_STATE, STOPWATCH_STATE)
+    writer.flush()
+    writer.submit(dict(TIMER_STATE), dict(STOPWATCH_STATE))
+    assert writer._pending is None
+    writer.close()
+
+
+def test_writer_writes_at_cadence(tmp_path):
+    """Test pending state is written without a flush once the interval passes."""
+    persistence = RecordingPersistence(tmp_path / "state.json")
+    writer = StateWriter(persistence, interval=0.01)
+    writer.submit(TIMER_STATE, STOPWATCH_STATE)
+    deadline = time.monotonic() + 2
+    while not persistence.saves and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    assert persistence.saves == [(TIMER_STATE, STOPWATCH_STATE)]
+    writer.close()
+
+
+def test_writer_close_flushes(tmp_path):
+    """Test closing the writer saves pending state."""
+    state_file = tmp_path / "state.json"
+    writer = StateWriter(StatePersistence(state_file), interval=60)
+    writer.submit(TIMER_STATE, STOPWATCH_STATE)
+    writer.close()
+
+    assert json.loads(state_file.read_text())["timer"] == TIMER_STATE
+    assert not writer._thread.is_alive()
@@ -0,0 +1,118 @@
+"""Tests for session profiling and the profile-report command."""
+
+import time
+import tracemalloc
+
+import pytest
+from click.testing import CliRunner
+
+from clockwise.cli import cli
+from clockwise.profiling import baseline_file, memory_report, profile_report, profiling
+
+LEAK = []
+
+
+def busy_work():
+    """Burn a little CPU so the profile has something to show."""
+    return sum(i * i for i in range(50_000))
+
+
+def leak_blocks():
+    """Hold on to memory the way a leak would."""
+    LEAK.extend(bytearray(1024) for _ in range(500))
+
+
+@pytest.fixture
+def session(tmp_path):
+    """Profile a short session that computes and leaks, returning both files."""
+    profile_file = tmp_path / "out.prof"
+    memory_file = tmp_path / "out.snap"
+    with profiling(profile_file, memory_file, interval=0.05):
+        busy_work()
+        time.sleep(0.2)
+        leak_blocks()
+    yield profile_file, memory_file
+    LEAK.clear()
+
+
+def test_profiling_writes_both_files(session):
+    """Test the session leaves a profile, a snapshot and a baseline."""
+    profile_file, memory_file = session
+    assert profile_file.stat().st_size > 0
+    assert memory_file.stat().st_size > 0
+    assert baseline_file(memory_file).exists()
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_report(session):
+    """Test the profile report ranks functions by cumulative time."""
+    report = profile_report(session[0], limit=50)
+    assert "by cumulative time" in report
+    assert "(busy_work)" in report
+
+
+def test_memory_report_shows_growth(session):
+    """Test allocations made after the session started show up as growth."""
+    report = memory_report(session[1])
+    top, growth = report.split("\n\n")
+    assert "traced in total" in top
+    assert "growers since the session started" in growth
+    assert "test_profiling.py" in growth.splitlines()[1]
+
+
+def test_short_session_reports_growth(tmp_path):
+    """Test a session that ends before the first periodic snapshot still shows growth."""
+    memory_file = tmp_path / "short.snap"
+    with profiling(memory_file=memory_file):
+        leak_blocks()
+    LEAK.clear()
+
+    growth = memory_report(memory_file).split("\n\n")[1]
+    assert "test_profiling.py" in growth.splitlines()[1]
+
+
+def test_failed_profile_dump_stops_tracing(tmp_path):
+    """Test tracing is stopped even when the profile cannot be written."""
+    profile_file = tmp_path / "missing" / "out.prof"
+    with pytest.raises(OSError):
+        with profiling(profile_file, tmp_path / "out.snap"):
+            busy_work()
+    assert not tracemalloc.is_tracing()
+
+
+def test_reports_reject_other_files(session):
+    """Test each report refuses the other kind of file."""
+    profile_file, memory_file = session
+    with pytest.raises(ValueError):
+        profile_report(memory_file)
+    with pytest.raises(ValueError):
+        memory_report(profile_file)
+
+
+def test_profile_report_command(session):
+    """Test profile-report prints both summaries."""
+    profile_file, memory_file = session
+    result = CliRunner().invoke(
+        cli, ["profile-report", "--profile", str(profile_file), "--trace-memory", str(memory_file)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "by cumulative time" in result.output
+    assert "allocators" in result.output
+
+    result = CliRunner().invoke(cli, ["profile-report"])
+    assert result.exit_code == 2
+    result = CliRunner().invoke(cli, ["profile-report", "--profile", str(memory_file)])
+    assert result.exit_code == 1
+    assert "Not a profile" in result.output
+
+
+def test_profiling_flags(app_dirs, tmp_path, monkeypatch):
+    """Test --profile and --trace-memory reach the app runner."""
+    calls = []
+    monkeypatch.setattr("clockwise.app.run", lambda **kwargs: calls.append(kwargs))
+    result = CliRunner().invoke(
+        cli, ["--profile", str(tmp_path / "a.prof"), "--trace-memory", str(tmp_path / "a.snap")]
+    )
+    assert result.exit_code == 0, result.output
+    assert calls[0]["profile_file"] == str(tmp_path / "a.prof")
+    assert calls[0]["memory_file"] == str(tmp_path / "a.snap")
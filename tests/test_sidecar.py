@@ -0,0 +1,131 @@
+"""Tests for the memory-mapped state sidecar."""
+
+import asyncio
+import time
+
+import pytest
+
+from clockwise.app import ClockwiseApp
+from clockwise.models import Stopwatch, Timer
+from clockwise.state import SidecarReader, StateSidecar, read_sidecar
+from clockwise.state.sidecar import SEQ, SEQ_OFFSET, SIZE, open_sidecar
+
+NS_PER_SECOND = 1_000_000_000
+
+
+@pytest.fixture
+def sidecar(tmp_path):
+    """A sidecar writer, closed after the test."""
+    sidecar = StateSidecar(tmp_path / "state.bin")
+    yield sidecar
+    sidecar.close()
+
+
+def test_update_and_read(sidecar):
+    """Test published state reads back field for field."""
+    timer = Timer(90, "Tea ☕")
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    stopwatch.tick(3)
+    stopwatch.add_lap()
+    stopwatch.pause()
+    sidecar.update(timer, stopwatch)
+
+    state = read_sidecar(sidecar.path)
+    assert state["timer"] == {
+        "name": "Tea ☕",
+        "duration_ns": 90 * NS_PER_SECOND,
+        "remaining_ns": 90 * NS_PER_SECOND,
+        "running": False,
+        "completed": False,
+    }
+    assert state["stopwatch"] == {
+        "elapsed_ns": stopwatch.elapsed_ns,
+        "running": False,
+        "lap_count": 1,
+        "last_lap_ns": stopwatch.laps[0],
+    }
+    assert sidecar.path.stat().st_size == SIZE
+
+
+def test_reader_counts_running_clocks_on(sidecar):
+    """Test running clocks advance between writes."""
+    timer = Timer(60, "Run")
+    stopwatch = Stopwatch()
+    timer.start()
+    stopwatch.start()
+    stopwatch.add_lap()
+    sidecar.update(timer, stopwatch)
+
+    with SidecarReader(sidecar.path) as reader:
+        first = reader.read()
+        time.sleep(0.05)
+        second = reader.read()
+    assert second["timer"]["remaining_ns"] < first["timer"]["remaining_ns"]
+    assert second["stopwatch"]["elapsed_ns"] >= first["stopwatch"]["elapsed_ns"] + 40_000_000
+    assert second["stopwatch"]["lap_count"] == 1
+    assert second["timer"]["running"] is True
+
+
+def test_reader_sees_updates_in_place(sidecar):
+    """Test an open reader follows later updates without reopening."""
+    timer = Timer(10, "First")
+    stopwatch = Stopwatch()
+    sidecar.update(timer, stopwatch)
+    with SidecarReader(sidecar.path) as reader:
+        assert reader.read()["timer"]["name"] == "First"
+        timer.set_duration(20, "Second")
+        sidecar.update(timer, stopwatch)
+        assert reader.read()["timer"]["name"] == "Second"
+
+
+def test_read_during_update_gives_up(sidecar):
+    """Test a writer stuck mid-update never yields a torn read."""
+    sidecar.update(Timer(10), Stopwatch())
+    SEQ.pack_into(sidecar._map, SEQ_OFFSET, 7)
+    assert read_sidecar(sidecar.path) is None
+
+
+def test_single_writer(sidecar):
+    """Test a second instance does not write a sidecar already in use."""
+    assert open_sidecar(sidecar.path) is None
+
+
+def test_reopen_after_crash_mid_update(tmp_path):
+    """Test a new writer recovers from an odd sequence left behind."""
+    path = tmp_path / "state.bin"
+    sidecar = StateSidecar(path)
+    SEQ.pack_into(sidecar._map, SEQ_OFFSET, 7)
+    sidecar.close()
+
+    sidecar = StateSidecar(path)
+    sidecar.update(Timer(10, "Back"), Stopwatch())
+    sidecar.close()
+    assert read_sidecar(path)["timer"]["name"] == "Back"
+
+
+def test_rejects_other_files(tmp_path):
+    """Test files that are not sidecars are refused."""
+    path = tmp_path / "state.bin"
+    assert read_sidecar(path) is None
+    path.write_bytes(b"{}" * SIZE)
+    with pytest.raises(ValueError):
+        SidecarReader(path)
+    assert read_sidecar(path) is None
+
+
+def test_app_publishes_sidecar(app_dirs):
+    """Test the app keeps the sidecar current when enabled."""
+
+    async def main():
+        app = ClockwiseApp()
+        app.config["settings"]["state_sidecar"] = True
+        async with app.run_test() as pilot:
+            app.timer.set_duration(30, "Focus")
+            app.action_toggle_active()
+            await pilot.pause()
+            state = read_sidecar(app.config_manager.sidecar_file)
+            assert state["timer"]["name"] == "Focus"
+            assert state["timer"]["running"] is True
+
+    asyncio.run(main())
@@ -0,0 +1,24 @@
+"""Short run of the memory soak harness in tests/soak.py."""
+
+import pytest
+
+from tests.soak import HOUR, Sample, check, growth_per_hour, soak
+
+
+def test_growth_per_hour():
+    """Test the growth rate is the slope of the samples, skipping missing RSS."""
+    samples = [Sample(h, 1000 + 500 * h, None, 0) for h in range(5)]
+    assert growth_per_hour(samples, "traced") == pytest.approx(500)
+    assert growth_per_hour(samples, "rss") == 0.0
+    with pytest.raises(AssertionError, match="traced \\+500 B/h"):
+        check(samples, warmup=0, traced_limit=100)
+
+
+@pytest.mark.soak
+def test_memory_is_flat_over_a_long_session(app_dirs):
+    """Test six simulated hours of timer cycles and laps leave memory flat."""
+    samples = soak(hours=6, step=60, lap_every=600)
+    assert len(samples) == 7
+    assert samples[-1].laps == 6 * HOUR // 600
+    # RSS needs far longer runs to show a trend; see python -m tests.soak
+    check(samples, warmup=2, rss_limit=None)
@@ -0,0 +1,84 @@
+"""Import-time budgets for the command line and the models."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time of each probe, measured with ``python -X importtime``
+# in a fresh interpreter. The budgets leave room for slow CI machines while
+# still failing loudly if Textual (several hundred ms) sneaks back in.
+BUDGETS_MS = {
+    "import clockwise": 20,
+    "import clockwise.models; clockwise.models.Timer; clockwise.models.Stopwatch": 60,
+    "import clockwise.__main__, clockwise.cli": 150,
+}
+HEAVY = ("textual", "rich", "click", "platformdirs", "sqlite3")
+
+
+def import_times(code, tmp_path):
+    """
+    Run ``code`` under ``-X importtime``.
+
+    Returns ``{module: cumulative_us}`` for every module imported; nested
+    imports are keyed with their leading indentation so only top-level
+    entries are counted towards a total.
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path / "pyc"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name[1:]] = int(cumulative)
+    return times
+
+
+def startup_ms(times, baseline):
+    """Time spent importing modules the bare interpreter does not, in milliseconds."""
+    return sum(us for name, us in times.items() if name[:1] != " " and name not in baseline) / 1000
+
+
+@pytest.mark.parametrize("code", list(BUDGETS_MS))
+def test_import_budget(code, tmp_path):
+    """Test cold imports stay within budget and never load heavy dependencies."""
+    baseline = import_times("pass", tmp_path)
+    import_times(code, tmp_path)  # compile bytecode once, as an install would
+    runs = [import_times(code, tmp_path) for _ in range(3)]
+
+    loaded = {name.strip().split(".")[0] for name in runs[0]}
+    allowed = {"click"} if "cli" in code else set()
+    assert not loaded & (set(HEAVY) - allowed)
+    best = min(startup_ms(times, baseline) for times in runs)
+    assert best < BUDGETS_MS[code], f"{code}: {best:.1f} ms"
+
+
+def test_lazy_packages():
+    """Test package exports resolve lazily and reject unknown names."""
+    code = (
+        "import sys\n"
+        "import clockwise, clockwise.widgets, clockwise.config, clockwise.state\n"
+        "assert 'textual' not in sys.modules\n"
+        "assert 'platformdirs' not in sys.modules\n"
+        "assert 'LapList' in dir(clockwise.widgets)\n"
+        "from clockwise.widgets import LapList\n"
+        "assert 'textual' in sys.modules\n"
+        "from clockwise.config import ConfigManager\n"
+        "try:\n"
+        "    clockwise.widgets.Missing\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise AssertionError('expected AttributeError')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,152 @@
+"""Tests for the fast status command."""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import platformdirs
+
+from clockwise import status
+from clockwise.models import SimulatedClock, Timer
+from clockwise.utils.formatting import format_time
+from clockwise.state import StateJournal, StatePersistence
+
+SAVED_AT = datetime(2024, 1, 1, 12, 0, 0)
+TIMER = {"duration": 1500, "name": "Pomodoro", "remaining": 1500, "running": False}
+STOPWATCH = {"elapsed": 0, "elapsed_ns": 0, "running": False, "laps_ns": ""}
+STATUS_BUDGET_MS = 10
+
+
+def fields(timer=None, stopwatch=None, seconds_later=0):
+    """Status fields for a state saved at SAVED_AT, read ``seconds_later``."""
+    state = {
+        "timer": dict(TIMER, **(timer or {})),
+        "stopwatch": dict(STOPWATCH, **(stopwatch or {})),
+        "timestamp": SAVED_AT.isoformat(),
+    }
+    return status.status_fields(state, SAVED_AT.timestamp() + seconds_later)
+
+
+def test_idle_timer():
+    """Test a timer that has not started."""
+    result = fields()
+    assert (result["name"], result["remaining"], result["status"]) == ("Pomodoro", "25:00", "idle")
+    assert result["progress"] == 0
+    assert result["stopwatch"] == "idle"
+
+
+def test_running_timer_counts_from_timestamp():
+    """Test remaining time keeps counting down since the state was saved."""
+    result = fields({"remaining": 600, "running": True}, seconds_later=90.5)
+    # 509.5 seconds left shows as 08:30, rounded up like the app's display
+    assert result["remaining"] == "08:30"
+    assert result["remaining_s"] == 510
+    assert result["status"] == "running"
+    assert result["progress"] == 66
+
+    assert fields({"remaining": 5, "running": True}, seconds_later=30)["status"] == "done"
+    assert fields({"remaining": 5, "running": True}, seconds_later=4.9)["status"] == "running"
+    assert fields({"remaining": 600}, seconds_later=90)["remaining"] == "10:00"
+    assert fields({"remaining": 600}, seconds_later=90)["status"] == "paused"
+
+
+def test_running_timer_uses_saved_nanoseconds():
+    """Test the exact saved remaining time is used, not the rounded seconds."""
+    saved = {"remaining": 600, "remaining_ns": 599_200_000_000, "running": True}
+    assert fields(saved, seconds_later=0.5)["remaining"] == "09:59"
+    assert fields(saved, seconds_later=0.1)["remaining"] == "10:00"
+
+
+def test_status_matches_app_display():
+    """Test a status line read mid-second shows what the timer shows."""
+    clock = SimulatedClock(SAVED_AT)
+    timer = Timer(600, "Tea", clock)
+    timer.start()
+    clock.advance(ns=12_300_000_000)
+    saved_at = datetime.fromtimestamp(clock.time())
+    state = {"timer": timer.get_state(), "timestamp": saved_at.isoformat()}
+    clock.advance(ns=45_400_000_000)
+
+    result = status.status_fields(state, clock.time())
+    assert result["remaining_s"] == timer.remaining == 543
+    assert result["remaining"] == format_time(timer.remaining, show_hours=False)
+
+
+def test_running_stopwatch_counts_from_timestamp():
+    """Test elapsed time keeps counting since the state was saved."""
+    result = fields(stopwatch={"elapsed_ns": 3_500_000_000, "running": True}, seconds_later=3600)
+    assert result["elapsed"] == "01:00:03"
+    assert result["stopwatch"] == "running"
+
+
+def test_read_state_replays_journal(tmp_path):
+    """Test the latest journal records override the snapshot."""
+    journal = StateJournal(tmp_path / "state.json")
+    journal.save_state(TIMER, STOPWATCH, SAVED_AT)
+    journal.save_state(dict(TIMER, running=True), STOPWATCH, SAVED_AT)
+    journal.save_state(dict(TIMER, remaining=1200, running=False), STOPWATCH, SAVED_AT)
+
+    state = status.read_state(str(journal.state_file))
+    assert state["timer"]["remaining"] == 1200
+    assert state == dict(journal.load_state(), journal_seq=0)
+
+
+def test_data_dir_matches_platformdirs(monkeypatch, tmp_path):
+    """Test the state path agrees with the one ConfigManager uses."""
+    assert status.data_dir() == platformdirs.user_data_dir("clockwise")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    assert status.data_dir() == platformdirs.user_data_dir("clockwise")
+
+
+def test_main(monkeypatch, tmp_path, capsys):
+    """Test output, missing state and bad formats."""
+    path = tmp_path / "state.json"
+    monkeypatch.setattr(status, "state_file", lambda: str(path))
+    assert status.main([]) == 1
+
+    StatePersistence(path).save_state(TIMER, STOPWATCH)
+    assert status.main(["--format", "{name}: {remaining} ({status})"]) == 0
+    assert capsys.readouterr().out == "Pomodoro: 25:00 (idle)\n"
+    assert status.main(["--format={missing}"]) == 2
+    assert status.main(["--bogus"]) == 2
+
+
+def test_status_startup_budget(tmp_path):
+    """Test a cold ``clockwise status`` stays within its time budget."""
+    data_dir = tmp_path / "data"
+    (data_dir / "clockwise").mkdir(parents=True)
+    StatePersistence(data_dir / "clockwise" / "state.json").save_state(TIMER, STOPWATCH)
+
+    env = dict(os.environ, XDG_DATA_HOME=str(data_dir), PYTHONPYCACHEPREFIX=str(tmp_path / "pyc"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        "from clockwise.__main__ import main\n"
+        "try:\n"
+        "    main(['status'])\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0, e.code\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        "heavy = {'click', 'platformdirs', 'textual', 'json'} & set(sys.modules)\n"
+        "assert not heavy, heavy\n"
+        "sys.stderr.write(f'{elapsed}')\n"
+    )
+
+    timings = []
+    for _ in range(4):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=str(Path(status.__file__).parent.parent),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout == "Pomodoro 25:00\n"
+        timings.append(float(result.stderr))
+
+    # The first run compiles bytecode, as only a fresh install would.
+    assert min(timings[1:]) < STATUS_BUDGET_MS, timings
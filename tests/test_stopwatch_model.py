@@ -0,0 +1,187 @@
+"""Tests for Stopwatch model."""
+
+from array import array
+
+import pytest
+
+from clockwise.models.stopwatch_model import LapEncoder, Stopwatch, encode_laps
+
+NS_PER_SECOND = 1_000_000_000
+
+
+def test_stopwatch_initialization():
+    """Test stopwatch initializes correctly."""
+    stopwatch = Stopwatch()
+    assert stopwatch.elapsed == 0
+    assert stopwatch.running is False
+    assert len(stopwatch.laps) == 0
+
+
+def test_stopwatch_tick():
+    """Test stopwatch only advances while running."""
+    stopwatch = Stopwatch()
+    stopwatch.tick()
+    assert stopwatch.elapsed == 0
+
+    stopwatch.start()
+    stopwatch.tick()
+    stopwatch.tick()
+    assert stopwatch.elapsed == 2
+
+
+def test_stopwatch_counts_from_monotonic_clock(frozen_clock):
+    """Test elapsed time is derived from the clock across pauses."""
+    now = frozen_clock
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    now[0] = 2_500_000_000
+    assert stopwatch.elapsed == 2
+
+    stopwatch.pause()
+    now[0] = 100_000_000_000
+    assert stopwatch.elapsed == 2
+
+    stopwatch.start()
+    now[0] += 1_000_000_000
+    assert stopwatch.elapsed_ns == 3_500_000_000
+
+
+def test_stopwatch_laps(frozen_clock):
+    """Test lap recording and lap durations."""
+    stopwatch = Stopwatch()
+    stopwatch.add_lap()
+    assert len(stopwatch.laps) == 0
+
+    stopwatch.start()
+    stopwatch.tick(10)
+    stopwatch.add_lap()
+    stopwatch.tick(5)
+    stopwatch.add_lap()
+    stopwatch.tick(2)
+
+    assert list(stopwatch.laps) == [10 * NS_PER_SECOND, 15 * NS_PER_SECOND]
+    assert stopwatch.get_last_lap_time() == 5
+    assert stopwatch.get_current_lap_time() == 2
+
+    stopwatch.reset()
+    assert len(stopwatch.laps) == 0
+    assert stopwatch.elapsed == 0
+    assert stopwatch.running is False
+
+
+def test_stopwatch_state_persistence(frozen_clock):
+    """Test state save and restore."""
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    stopwatch.tick(42)
+    stopwatch.add_lap()
+
+    state = stopwatch.get_state()
+    assert state["elapsed"] == 42
+    assert state["running"] is True
+    assert isinstance(state["laps_ns"], str)
+
+    new_stopwatch = Stopwatch()
+    new_stopwatch.set_state(state)
+    assert new_stopwatch.elapsed == 42
+    assert new_stopwatch.running is True
+    assert list(new_stopwatch.laps) == [42 * NS_PER_SECOND]
+    assert new_stopwatch.get_lap_stats()["count"] == 1
+
+
+def test_lap_encoder_extends_encoding(monkeypatch):
+    """Test incremental encoding matches a full encode and only encodes new laps."""
+    import base64
+
+    b64encode = base64.b64encode
+    encoded = []
+    monkeypatch.setattr(
+        base64, "b64encode", lambda data: encoded.append(len(data)) or b64encode(data)
+    )
+
+    def encode(encoder, laps, count=None):
+        """Encode incrementally, returning the result and the bytes encoded."""
+        expected = encode_laps(laps[:count])
+        encoded.clear()
+        assert encoder.encode(laps, count) == expected
+        return sum(encoded)
+
+    encoder = LapEncoder()
+    laps = array("q")
+    for lap in range(1, 50):
+        # Two new laps, plus at most two encoded before that were past the
+        # last whole group
+        laps.extend([lap * 7919, lap * 7919 + 1])
+        assert encode(encoder, laps, len(laps) - 1) <= 4 * 8
+    assert encode(encoder, laps, len(laps) - 1) == 0
+    assert encode(encoder, laps, 10) == 10 * 8
+    assert encode(encoder, array("q", [5, 6])) == 2 * 8
+
+
+def test_stopwatch_state_extends_laps(frozen_clock):
+    """Test a state from ``laps_from`` appends to the laps held, and only there."""
+    source = Stopwatch()
+    source.start()
+    mirror = Stopwatch()
+    for _ in range(3):
+        frozen_clock[0] += 2 * NS_PER_SECOND
+        source.add_lap()
+    mirror.set_state(source.get_state())
+
+    frozen_clock[0] += 3 * NS_PER_SECOND
+    source.add_lap()
+    delta = source.get_state(laps_from=3)
+    assert delta["laps_from"] == 3
+    assert delta["laps_ns"] == encode_laps(source.laps[3:])
+    mirror.set_state(delta)
+    assert mirror.laps == source.laps
+    assert mirror.get_lap_stats() == source.get_lap_stats()
+
+    with pytest.raises(ValueError):
+        mirror.set_state(delta)
+    assert mirror.laps == source.laps
+
+
+def test_stopwatch_restores_legacy_laps():
+    """Test state with laps stored as whole seconds still loads."""
+    stopwatch = Stopwatch()
+    stopwatch.set_state({"elapsed": 30, "running": False, "laps": [10, 25]})
+
+    assert list(stopwatch.laps) == [10 * NS_PER_SECOND, 25 * NS_PER_SECOND]
+    assert stopwatch.get_last_lap_time() == 15
+    assert stopwatch.get_current_lap_time() == 5
+
+
+def test_stopwatch_lap_stats(frozen_clock):
+    """Test lap statistics are kept up to date as laps are added."""
+    stopwatch = Stopwatch()
+    assert stopwatch.get_lap_stats() == {
+        "count": 0,
+        "fastest_ns": 0,
+        "slowest_ns": 0,
+        "mean_ns": 0.0,
+        "stddev_ns": 0.0,
+    }
+
+    stopwatch.start()
+    for seconds in [2, 4, 4, 4, 5, 5, 7, 9]:
+        stopwatch.tick(seconds)
+        stopwatch.add_lap()
+
+    stats = stopwatch.get_lap_stats()
+    assert stats["count"] == 8
+    assert stats["fastest_ns"] == 2 * NS_PER_SECOND
+    assert stats["slowest_ns"] == 9 * NS_PER_SECOND
+    assert stats["mean_ns"] == pytest.approx(5 * NS_PER_SECOND)
+    assert stats["stddev_ns"] == pytest.approx(2 * NS_PER_SECOND)
+
+
+def test_stopwatch_next_change(frozen_clock):
+    """Test the next display change lands on the next whole second."""
+    now = frozen_clock
+    stopwatch = Stopwatch()
+    assert stopwatch.next_change_ns() is None
+
+    stopwatch.start()
+    now[0] = 2_400_000_000
+    assert stopwatch.next_change_ns() == 3_000_000_000
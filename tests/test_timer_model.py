@@ -126,3 +126,51 @@ def test_timer_state_persistence():
     assert new_timer.name == "Test"
     assert new_timer.remaining == 58
     assert new_timer.running is True
+
+
+def test_timer_counts_from_monotonic_clock(frozen_clock):
+    """Test remaining time is derived from the clock, not from ticks."""
+    now = frozen_clock
+
+    timer = Timer(duration=10)
+    timer.start()
+    now[0] = 3_500_000_000
+    assert timer.remaining == 7
+
+    timer.pause()
+    now[0] = 60_000_000_000
+    assert timer.remaining == 7
+
+    timer.start()
+    now[0] += 7_000_000_000
+    assert timer.remaining == 0
+    assert timer.running is True
+
+    timer.update()
+    assert timer.running is False
+    assert timer.completed is True
+
+
+def test_timer_restores_running_state(frozen_clock):
+    """Test a restored running timer keeps counting from the saved point."""
+    now = frozen_clock
+
+    timer = Timer()
+    timer.set_state({"duration": 60, "name": "Test", "remaining": 30, "running": True})
+    now[0] = 5_000_000_000
+    assert timer.remaining == 25
+    assert timer.get_progress() == 35 / 60
+
+
+def test_timer_next_change(frozen_clock):
+    """Test the next display change lands on the next whole second."""
+    now = frozen_clock
+
+    timer = Timer(duration=10)
+    assert timer.next_change_ns() is None
+
+    timer.start()
+    assert timer.next_change_ns() == 1_000_000_000
+
+    now[0] = 9_250_000_000
+    assert timer.next_change_ns() == 10_000_000_000